@@ -26,10 +26,17 @@
 # NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from typing import Optional
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict
+from os.path import dirname, join
+from sys import intern
+from threading import Event, Lock, Thread, local
+from typing import List, Optional
 from enum import Enum
 from random import randint
+from time import monotonic
 from ovos_bus_client.message import Message
+from ovos_bus_client.session import SessionManager
 from ovos_utils import classproperty
 from ovos_utils.log import LOG
 from ovos_utils.process_utils import RuntimeRequirements
@@ -38,15 +45,169 @@ from neon_utils.skills.neon_skill import NeonSkill
 from neon_utils.validator_utils import numeric_confirmation_validator
 from ovos_workshop.decorators import intent_handler
 from ovos_workshop.intents import IntentBuilder
+from ovos_workshop.resource_files import ResourceFile, SkillResources
+
+from .util.activity import ActivityMonitor
+from .util.audit import AuditAction, WakeWordAuditLog
+from .util.budget import TimeBudget, budgeted_flow
+from .util.early_dispatch import EarlyDispatcher
+from .util.lang_cache import LangCache
+from .util.memory import MemoryProfiler
+from .util.rules import CronRule, RuleScheduler, RuleStore
+from .util.scheduler import ControlPriority, ControlScheduler
+from .util.solo import SoloGovernor
+from .util.watchdog import ListenerWatchdog
+from .util.fanout import FanOutSummary, device_request, fan_out, \
+    get_target_devices
+from .util.ww_backend import WW_CATALOG_FIELDS, WakeWordBackend, \
+    get_backend, parse_wake_words_reply, project_wake_words
+from .util.ww_matcher import WakeWordMatcher
+from .util.ww_snapshot import SnapshotStore, WakeWordSnapshot
 
 
 class SystemCommand(Enum):
-    SHUTDOWN = "shut down this device"
-    RESTART = "restart Neon"
-    EXIT = "stop Neon"
+    """
+    Power commands. Each value is the spoken action; `event` is the Message
+    type emitted to perform it, `dialog` the confirmation spoken first and
+    `intent` the name of its intent file.
+    """
+    SHUTDOWN = ("shut down this device", "system.shutdown", "confirm_shutdown")
+    RESTART = ("restart Neon", "system.reboot", "confirm_restarting")
+    EXIT = ("stop Neon", "neon.shutdown", "confirm_exiting")
+
+    def __new__(cls, value: str, event: str, dialog: str):
+        command = object.__new__(cls)
+        command._value_ = value
+        command.event = event
+        command.dialog = dialog
+        return command
+
+    @property
+    def intent(self) -> str:
+        return self.name.lower()
+
+
+PARTIAL_UTTERANCE_EVENT = "recognizer_loop:partial_utterance"
+
+# Default seconds allowed for each control flow, including user dialogs
+DEFAULT_FLOW_BUDGETS = {"exit_shutdown": 90,
+                        "wake_words_state": 60,
+                        "change_wake_word": 120}
 
 
 class DeviceControlCenterSkill(NeonSkill):
+    def __init__(self, **kwargs):
+        self._ww_backend = None
+        self._watchdog = None
+        self._audit = None
+        self._solo = None
+        self._rules = None
+        self._activity = None
+        self._ww_snapshots = None
+        self._ww_snapshot: Optional[WakeWordSnapshot] = None
+        self._ww_provisional = False
+        self._ww_snapshot_lock = Lock()
+        self._ww_reconcile_wakeup = Event()
+        self._ww_reconcile_stop = Event()
+        self._ww_matcher = WakeWordMatcher()
+        self._rule_store = None
+        self._last_activity = monotonic()
+        self._early_dispatch = None
+        self._memory = MemoryProfiler(dirname(__file__))
+        self._scheduler = ControlScheduler()
+        self._flow_state = local()
+        self._lang_cache = LangCache()
+        self._loaded_langs = set()
+        self._intent_files = list()
+        self._lang_load_lock = Lock()
+        self._ww_disable_lock = Lock()
+        NeonSkill.__init__(self, **kwargs)
+
+    def initialize(self):
+        NeonSkill.initialize(self)
+        self._lang_cache.max_size = self.settings.get("max_cached_langs", 3)
+        self.add_event("recognizer_loop:utterance", self._on_utterance_lang)
+        self.add_event("neon.device_controls.memory_report",
+                       self._handle_memory_report)
+        if self.settings.get("memory_profile", False):
+            self._memory.start()
+            self.add_event("mycroft.skill.handler.complete",
+                           self._on_handler_complete)
+        if self.settings.get("ww_audit_log", True):
+            self._audit = WakeWordAuditLog(
+                join(self.file_system.path, "ww_audit.bin"),
+                max_bytes=self.settings.get("ww_audit_max_bytes", 64 * 1024))
+            self.add_event("neon.device_controls.ww_audit",
+                           self._handle_ww_audit)
+        if any(self.settings.get(limit) is not None for limit in
+               ("solo_time_budget", "solo_stt_budget", "solo_max_load")):
+            self._solo = SoloGovernor(
+                self._end_solo_mode,
+                time_budget=self.settings.get("solo_time_budget"),
+                stt_budget=self.settings.get("solo_stt_budget"),
+                max_load=self.settings.get("solo_max_load"),
+                check_interval=self.settings.get("solo_check_interval", 10))
+            self.add_event("recognizer_loop:utterance",
+                           self._solo.on_utterance)
+            self.add_event("recognizer_loop:record_begin",
+                           self._solo.on_record_begin)
+            self.add_event("recognizer_loop:record_end",
+                           self._solo.on_record_end)
+            self.add_event("neon.device_controls.solo_report",
+                           self._handle_solo_report)
+        self.add_event("recognizer_loop:utterance", self._on_user_activity)
+        if self.settings.get("ww_snapshot", True):
+            self._load_ww_snapshot()
+        if self.settings.get("defer_power", False):
+            self._activity = ActivityMonitor(self.skill_id)
+            for event, handler in (
+                    ("recognizer_loop:utterance",
+                     self._activity.on_utterance),
+                    ("speak", self._activity.on_speak),
+                    ("recognizer_loop:audio_output_start",
+                     self._activity.on_audio_output_start),
+                    ("recognizer_loop:audio_output_end",
+                     self._activity.on_audio_output_end),
+                    ("recognizer_loop:record_begin",
+                     self._activity.on_record_begin),
+                    ("recognizer_loop:record_end",
+                     self._activity.on_record_end),
+                    ("mycroft.skill.handler.start",
+                     self._activity.on_handler_start),
+                    ("mycroft.skill.handler.complete",
+                     self._activity.on_handler_complete)):
+                self.add_event(event, handler)
+        if self.settings.get("scheduled_controls", True):
+            self._rule_store = RuleStore(join(self.file_system.path, "rules"))
+            self._rules = RuleScheduler(self._run_rule)
+            for rule in self._rule_store.load():
+                self._rules.add(rule)
+            self._rules.start()
+            self.add_event("neon.device_controls.get_rules",
+                           self._handle_get_rules)
+            self.add_event("neon.device_controls.add_rule",
+                           self._handle_add_rule)
+            self.add_event("neon.device_controls.remove_rule",
+                           self._handle_remove_rule)
+        if self.settings.get("listener_watchdog", True):
+            self._watchdog = ListenerWatchdog(
+                self.ww_backend.ping,
+                interval=self.settings.get("watchdog_interval", 60),
+                max_interval=self.settings.get("watchdog_max_interval", 900))
+            self._watchdog.start()
+        if self.settings.get("early_dispatch", False):
+            self._early_dispatch = EarlyDispatcher(
+                self._load_power_intents, self._prepare_confirmation,
+                ttl=self.settings.get("early_dispatch_ttl", 15))
+            self.add_event(PARTIAL_UTTERANCE_EVENT,
+                           self._on_partial_utterance)
+            self.add_event("recognizer_loop:utterance",
+                           self._on_final_utterance)
+        if self._memory.enabled:
+            sample = self._memory.sample("load")
+            LOG.info(f"Memory at load: {sample.total} bytes traced, "
+                     f"{sample.local} bytes allocated by skill")
+
     @classproperty
     def runtime_requirements(self):
         return RuntimeRequirements(network_before_load=False,
@@ -59,41 +220,174 @@ class DeviceControlCenterSkill(NeonSkill):
                                    no_network_fallback=True,
                                    no_gui_fallback=True)
 
+    def load_lang(self, root_directory: Optional[str] = None,
+                  lang: Optional[str] = None) -> SkillResources:
+        """
+        Get SkillResources for a language from a small cache. Resources for
+        the core language are always kept; others are created on first use
+        and evicted when unused.
+        :param root_directory: root path to find resources (default res_dir)
+        :param lang: language to get resources for (default self.lang)
+        :returns: SkillResources object
+        """
+        lang = lang or self.lang
+        root_directory = root_directory or self.res_dir
+        if not self._lang_cache.pinned:
+            self._lang_cache.pinned.add(self.core_lang)
+        return self._lang_cache.get(
+            lang, lambda: SkillResources(root_directory, lang,
+                                         skill_id=self.skill_id))
+
+    def load_data_files(self, root_directory: Optional[str] = None):
+        """
+        Register resources for the core language. Other supported languages
+        are registered on the first request in them, or in the background at
+        startup if the `preload_langs` setting is True. Dialogs are loaded
+        when first rendered.
+        :param root_directory: root path to find resources (default res_dir)
+        """
+        root_directory = root_directory or self.res_dir
+        self._load_lang_data(self.core_lang, root_directory)
+        others = sorted(set(self.native_langs) - {self.core_lang})
+        if others and self.settings.get("preload_langs", False):
+            Thread(target=lambda: [self._load_lang_data(lang, root_directory)
+                                   for lang in others],
+                   name="device_controls_lang_loader", daemon=True).start()
+
+    def register_intent_file(self, intent_file: str, handler):
+        """
+        Register a Padatious intent for each language loaded so far. Languages
+        loaded later register the intent in `_load_lang_data`.
+        :param intent_file: name of the .intent file to register
+        :param handler: method to call when the intent matches
+        """
+        with self._lang_load_lock:
+            self._intent_files.append(intent_file)
+            for lang in self._loaded_langs:
+                self._register_intent_file_lang(intent_file, lang)
+        if handler:
+            self.add_event(f"{self.skill_id}:{intent_file}", handler,
+                           'mycroft.skill.handler', activation=True,
+                           is_intent=True)
+
+    def _register_intent_file_lang(self, intent_file: str, lang: str):
+        resources = self.load_lang(self.res_dir, lang)
+        resource_file = ResourceFile(resources.types.intent, intent_file)
+        if resource_file.file_path is None:
+            LOG.error(f"Unable to find {intent_file} for {lang}")
+            return
+        self.intent_service.register_padatious_intent(
+            f"{self.skill_id}:{intent_file}", str(resource_file.file_path),
+            lang)
+
+    def _load_lang_data(self, lang: str,
+                        root_directory: Optional[str] = None):
+        """
+        Register vocab, regex and intent files for a language with the intent
+        service if not already registered.
+        :param lang: language to load
+        :param root_directory: root path to find resources (default res_dir)
+        """
+        with self._lang_load_lock:
+            if lang in self._loaded_langs:
+                return
+            LOG.debug(f"Loading resources for {lang}")
+            resources = self.load_lang(root_directory, lang)
+            if resources.types.vocabulary.base_directory is not None:
+                vocab = resources.load_skill_vocabulary(
+                    self.alphanumeric_skill_id)
+                for vocab_type, lines in vocab.items():
+                    for line in lines:
+                        self.intent_service.register_adapt_keyword(
+                            vocab_type, line[0], line[1:], lang)
+            if resources.types.regex.base_directory is not None:
+                for regex in resources.load_skill_regex(
+                        self.alphanumeric_skill_id):
+                    self.intent_service.register_adapt_regex(regex, lang)
+            for intent_file in self._intent_files:
+                self._register_intent_file_lang(intent_file, lang)
+            self._loaded_langs.add(lang)
+
+    def _on_utterance_lang(self, message: Message):
+        """
+        Register resources for a supported language on the first request in
+        it. This runs alongside intent matching, so it is a best-effort
+        warm-up: the first utterance in a language that was not preloaded may
+        not match this skill.
+        """
+        lang = (message.data.get("lang") or "").lower()
+        if lang and lang not in self._loaded_langs and \
+                lang in self.native_langs:
+            self._load_lang_data(lang)
+
+    @property
+    def ww_backend(self) -> WakeWordBackend:
+        """
+        Get the backend used to query and change wake word configuration.
+        """
+        if not self._ww_backend:
+            self._ww_backend = get_backend(
+                self.bus, self.settings.get("ww_backend", "auto"))
+            LOG.info(f"Using {type(self._ww_backend).__name__}")
+        return self._ww_backend
+
     @property
     def ww_enabled(self) -> Optional[bool]:
         """
-        Get the current wake words state.
+        Get the current wake words state. Until the listener has responded
+        after start-up, the last saved state is returned.
         """
-        resp = self.bus.wait_for_response(Message("neon.query_wake_words_state"))
-        if not resp:
-            LOG.warning("No WW Status reported")
-            return None
-        if resp.data.get('enabled', True):
-            return True
-        return False
+        snapshot = self._ww_snapshot
+        if self._ww_provisional and snapshot.enabled is not None:
+            return snapshot.enabled
+        return self._fetch_ww_state()
 
     @property
     def wakewords(self) -> Optional[dict]:
         """
-        Get a dict of available configured wake words.
+        Get a dict of available configured wake words. Until the listener has
+        responded after start-up, the last saved catalog is returned.
+        """
+        snapshot = self._ww_snapshot
+        if self._ww_provisional:
+            return {ww: dict(config)
+                    for ww, config in snapshot.wake_words.items()}
+        return self._fetch_wake_words()
+
+    def _fetch_ww_state(self) -> Optional[bool]:
+        """
+        Query the listener for the current wake words state.
         """
-        message = dig_for_message() or Message("neon.get_wake_words")
-        resp = self.bus.wait_for_response(
-            message.forward("neon.get_wake_words"), "neon.wake_words")
-        return resp.data if resp else None
+        start = monotonic()
+        with self._budget_step("get_wake_words_state"):
+            state = self.ww_backend.get_state()
+        self._report_listener(state is not None, monotonic() - start)
+        if state is not None:
+            self._update_ww_snapshot(enabled=state)
+        return state
+
+    def _fetch_wake_words(self) -> Optional[dict]:
+        """
+        Query the listener for the available configured wake words.
+        """
+        start = monotonic()
+        with self._budget_step("get_wake_words"):
+            wake_words = self.ww_backend.get_wake_words(dig_for_message())
+        self._report_listener(wake_words is not None, monotonic() - start)
+        if wake_words is not None:
+            self._update_ww_snapshot(wake_words=wake_words)
+        return wake_words
 
     @intent_handler(IntentBuilder("ExitShutdownIntent").require("request")
-                    .one_of("exit", "shutdown", "restart"))
+                    .one_of("exit", "shutdown", "restart")
+                    .exclude("listening").exclude("skipping"))
+    @budgeted_flow("exit_shutdown")
     def handle_exit_shutdown_intent(self, message):
         """
         Handles a request to exit or shutdown.
         This action will be confirmed numerically before executing.
         :param message: message object associated with request
         """
-        confirm_number = str(randint(100, 999))
-        self.gui.show_text(confirm_number,
-                           self.resources.render_dialog("word_confirm"))
-        validator = numeric_confirmation_validator(confirm_number)
         if message.data.get("exit"):
             action = SystemCommand.EXIT
         elif message.data.get("shutdown"):
@@ -103,17 +397,36 @@ class DeviceControlCenterSkill(NeonSkill):
         else:
             LOG.error("No exit, shutdown, or restart keyword")
             return
-        response = self.get_response("ask_exit_shutdown",
-                                     {"action": action.value,
-                                      "number": confirm_number},
-                                     validator, "action_not_confirmed",
-                                     num_retries=3)
+        devices = get_target_devices(message.context)
+        prepared = None if devices else self._take_prepared(action, message)
+        confirm_number = prepared.data if prepared else str(randint(100, 999))
+        self.gui.show_text(confirm_number,
+                           self.resources.render_dialog("word_confirm"))
+        validator = numeric_confirmation_validator(confirm_number)
+        if devices:
+            response = self.get_response("ask_fan_out_exit_shutdown",
+                                         {"action": action.name.lower(),
+                                          "count": len(devices),
+                                          "number": confirm_number},
+                                         validator, "action_not_confirmed",
+                                         num_retries=3)
+        else:
+            response = self.get_response("ask_exit_shutdown",
+                                         {"action": action.value,
+                                          "number": confirm_number},
+                                         validator, "action_not_confirmed",
+                                         num_retries=3)
         LOG.debug(f"Got response: {response}")
         self.gui.clear()
-        if not response:
+        if not response and self._budget_expired():
+            self.speak_dialog("error_flow_timed_out", private=True)
+        elif not response:
             self.speak_dialog("confirm_cancel", private=True)
+        elif devices:
+            # Remote power actions do not preempt local operations
+            self._do_fan_out_exit_shutdown(action, devices, message)
         elif response:
-            self._do_exit_shutdown(action)
+            self._run_power_action(action)
 
     @intent_handler("exit.intent")
     def handle_exit_intent(self, message):
@@ -134,19 +447,26 @@ class DeviceControlCenterSkill(NeonSkill):
                     .require("start_sww"))
     @intent_handler(IntentBuilder("SoloModeIntent").one_of("start", "enable")
                     .require("solo"))
+    @budgeted_flow("wake_words_state")
     def handle_skip_wake_words(self, message):
         """
         Disable wake words and start always-listening recognizer
         :param message: message object associated with request
         """
         if self.neon_in_request(message):
+            devices = get_target_devices(message.context)
+            if devices:
+                self._fan_out_ww_state(False, devices, message)
+                return
+            if not self._check_listener():
+                return
             ww_state = self.ww_enabled
             if ww_state:
                 resp = self.ask_yesno("ask_start_skipping")
                 if resp == "yes":
                     self.speak_dialog("confirm_skip_ww", private=True)
-                    self.bus.wait_for_response(message.forward(
-                        "neon.wake_words_state", {"enabled": False}))
+                    if self._set_ww_state(False, message) and self._solo:
+                        self._solo.start()
                 else:
                     self.speak_dialog("not_doing_anything", private=True)
             else:
@@ -156,18 +476,25 @@ class DeviceControlCenterSkill(NeonSkill):
                     .require("stop_sww"))
     @intent_handler(IntentBuilder("StopSoloModeIntent")
                     .one_of("stop", "disable").require("solo"))
+    @budgeted_flow("wake_words_state")
     def handle_use_wake_words(self, message):
         """
         Enable wake words and stop always-listening recognizer
         :param message: message object associated with request
         """
+        devices = get_target_devices(message.context)
+        if devices:
+            self._fan_out_ww_state(True, devices, message)
+            return
+        if not self._check_listener():
+            return
         ww_state = self.ww_enabled
         if ww_state is False:  # If no return, assume WW always required
             resp = self.ask_yesno("ask_start_requiring")
             if resp == "yes":
                 self.speak_dialog("confirm_require_ww", private=True)
-                self.bus.wait_for_response(message.forward(
-                    "neon.wake_words_state", {"enabled": True}))
+                if self._set_ww_state(True, message) and self._solo:
+                    self._solo.stop()
             else:
                 self.speak_dialog("not_doing_anything", private=True)
         else:
@@ -176,7 +503,7 @@ class DeviceControlCenterSkill(NeonSkill):
     # TODO: Factory Reset
 
     @intent_handler(IntentBuilder("ConfirmListeningIntent")
-                    .one_of("enable", "disable").require("listening").build())
+                    .one_of("enable", "disable").require("listening"))
     def handle_confirm_listening(self, message):
         """
         Enable confirmation sounds when a wake word is detected
@@ -188,12 +515,14 @@ class DeviceControlCenterSkill(NeonSkill):
             self.speak_dialog("confirm_listening_enabled")
         else:
             self.speak_dialog("confirm_listening_disabled")
-        self.bus.emit(message.forward("neon.confirm_listening",
-                                      {"enabled": enabled}))
+        self._scheduler.submit(
+            ControlPriority.TOGGLE, "confirm_listening",
+            lambda: self.bus.emit(message.forward("neon.confirm_listening",
+                                                  {"enabled": enabled})))
         # TODO: Handle this event DM
 
     @intent_handler(IntentBuilder("ShowDebugIntent")
-                    .one_of("enable", "disable").require("debug").build())
+                    .one_of("enable", "disable").require("debug"))
     def handle_show_debug(self, message):
         enabled = True if message.data.get("enable") else False
 
@@ -201,18 +530,29 @@ class DeviceControlCenterSkill(NeonSkill):
             self.speak_dialog("confirm_brain_enabled")
         else:
             self.speak_dialog("confirm_brain_disabled")
-        self.bus.emit(message.forward("neon.show_debug",
-                                      {"enabled": enabled}))
+        self._scheduler.submit(
+            ControlPriority.TOGGLE, "show_debug",
+            lambda: self.bus.emit(message.forward("neon.show_debug",
+                                                  {"enabled": enabled})))
         # TODO: Handle this event DM
 
     @intent_handler(IntentBuilder("ChangeWakeWordIntent")
                     .require("change").require("ww").optionally("rx_wakeword"))
+    @budgeted_flow("change_wake_word")
     def handle_change_ww(self, message):
         """
         Handle a user request to change their configured wake word.
         """
         requested_ww = message.data.get("rx_wakeword") or \
             message.data.get("utterance")
+        devices = get_target_devices(message.context)
+        if devices:
+            self.speak_dialog("confirm_ww_changing")
+            self._fan_out(lambda device, timeout: self._change_ww_on_device(
+                requested_ww, device, timeout, message), devices)
+            return
+        if not self._check_listener():
+            return
         available_ww = self.wakewords
         if not available_ww:
             LOG.warning(f"Wake Word API Not Available")
@@ -220,29 +560,7 @@ class DeviceControlCenterSkill(NeonSkill):
             return
         enabled_ww = [ww for ww in available_ww.keys() if
                       available_ww[ww].get('active')]
-        matched_ww = None
-        for ww in available_ww.keys():
-            if ww.lower().replace('_', ' ') in requested_ww.lower():
-                LOG.debug(f"matched: {ww}")
-                matched_ww = ww
-                break
-        if not matched_ww:
-            LOG.warning("Checking alternate transcriptions for a wake word")
-            utterances = message.data.get('utterances', [])
-            for ww in available_ww.keys():
-                test_ww = ww.lower().replace('_', ' ')
-                if any([test_ww in utt.lower() for utt in utterances]):
-                    matched_ww = ww
-                    LOG.debug(f"Found ww: {matched_ww}")
-                    break
-        if not matched_ww:
-            LOG.warning("Checking for known wake words")
-            if self.voc_match(requested_ww, 'mycroft') and \
-                    'hey_mycroft' in available_ww.keys():
-                matched_ww = 'hey_mycroft'
-            elif self.voc_match(requested_ww, 'neon') and \
-                    'hey_neon' in available_ww.keys():
-                matched_ww = 'hey_neon'
+        matched_ww = self._match_wake_word(requested_ww, available_ww, message)
 
         if not matched_ww:
             LOG.debug(f"No valid ww matched in: {requested_ww}")
@@ -258,22 +576,31 @@ class DeviceControlCenterSkill(NeonSkill):
             if len(enabled_ww) > 1:
                 LOG.info(f"Multiple WW active")
                 for ww in enabled_ww:
+                    if self._budget_expired():
+                        self.speak_dialog("error_flow_timed_out")
+                        break
                     if ww != matched_ww:
                         spoken_ww = ww.replace("_", " ")
+                        self._prepare_wake_word(ww, False, message)
                         resp = self.ask_yesno("ask_disable_ww",
                                               {"ww": spoken_ww})
                         if resp == "yes":
-                            if self._disable_wake_word(ww, message):
+                            if self._disable_other_wake_word(ww, message):
                                 self.speak_dialog("confirm_ww_disabled",
                                                   {"ww": spoken_ww})
                             else:
                                 pass
                                 # TODO: Speak error
+                        else:
+                            self._cancel_prepare_wake_word(ww, message)
 
             return
 
+        # Let the listener load the new model while the dialog is spoken
+        self._prepare_wake_word(matched_ww, True, message)
         self.speak_dialog("confirm_ww_changing")
         if not self._enable_wake_word(matched_ww, message):
+            self._cancel_prepare_wake_word(matched_ww, message)
             self.speak_dialog("error_ww_change_failed")
             # TODO: If this is a timeout, the new WW might be active
             return
@@ -285,7 +612,7 @@ class DeviceControlCenterSkill(NeonSkill):
         if len(enabled_ww) == 1:
             old_ww = enabled_ww[0]
             LOG.debug(f"Disable old WW: {old_ww}")
-            self._disable_wake_word(old_ww, message)
+            self._disable_other_wake_word(old_ww, message)
             # TODO: Something different if this fails
 
             self.speak_dialog("confirm_ww_changed", {"wake_word": new_ww})
@@ -296,50 +623,648 @@ class DeviceControlCenterSkill(NeonSkill):
     def stop(self):
         pass
 
-    def _enable_wake_word(self, ww: str, message: Message) -> bool:
+    def get_response(self, dialog: str = '', data: Optional[dict] = None,
+                     validator=None, on_fail=None, num_retries: int = -1,
+                     message: Optional[Message] = None) -> Optional[str]:
         """
-        Enable the requested wake word and return True on success
-        :param ww: string wake word to enable
+        Get a response from the user, limiting retries to the time budget of
+        the current control flow. A prompt is only spoken if a full listening
+        window fits in the remaining budget; an attempt that has started is
+        not interrupted, so a flow may overrun its budget by at most the time
+        taken to speak one prompt.
+        """
+        budget = self._current_budget()
+        if budget:
+            if budget.remaining < self._get_response_timeout:
+                LOG.warning(f"No time left in flow {budget.name} to ask: "
+                            f"{dialog}")
+                return None
+            # Allow time to speak a prompt in addition to listening
+            num_retries = budget.limit_retries(
+                num_retries, 2 * self._get_response_timeout)
+        with self._budget_step(f"get_response.{dialog}"):
+            return super().get_response(dialog, data, validator, on_fail,
+                                        num_retries, message)
+
+    @contextmanager
+    def time_budget(self, name: str, message: Message):
+        """
+        Run a control flow within a time budget. The time used by each step
+        is logged and emitted when the flow completes. Nested flows share the
+        budget of the outermost flow.
+        :param name: name of the flow, used to look up the budget
+        :param message: Message associated with request
+        """
+        if self._current_budget():
+            yield self._current_budget()
+            return
+        total = self.settings.get("flow_budgets", {}).get(
+            name, DEFAULT_FLOW_BUDGETS.get(name, 60))
+        budget = TimeBudget(name, total)
+        self._flow_state.budget = budget
+        try:
+            yield budget
+        finally:
+            self._flow_state.budget = None
+            report = budget.log_report()
+            self.bus.emit(message.forward("neon.device_controls.flow_report",
+                                          report))
+
+    def _current_budget(self) -> Optional[TimeBudget]:
+        """
+        Get the time budget of the control flow running in this thread.
+        """
+        return getattr(self._flow_state, "budget", None)
+
+    def _budget_expired(self) -> bool:
+        budget = self._current_budget()
+        return bool(budget and budget.expired)
+
+    def _budget_step(self, name: str):
+        """
+        Get a context manager that records time spent in a step of the
+        current control flow.
+        :param name: name of the step
+        """
+        budget = self._current_budget()
+        return budget.step(name) if budget else nullcontext()
+
+    def _budget_remaining(self) -> Optional[float]:
+        budget = self._current_budget()
+        return budget.remaining if budget else None
+
+    def shutdown(self):
+        self._scheduler.shutdown()
+        self._memory.stop()
+        if self._watchdog:
+            self._watchdog.stop()
+        if self._audit:
+            self._audit.stop()
+        if self._solo:
+            self._solo.shutdown()
+        if self._rules:
+            self._rules.stop()
+        self._ww_reconcile_stop.set()
+
+    def _load_power_intents(self, lang: str) -> dict:
+        """
+        Load the intent files that may be dispatched early for a language.
+        :param lang: language to load intents for
+        :returns: dict of intent name to intent file lines
+        """
+        resources = self.load_lang(lang=lang)
+        return {c.intent: resources.load_intent_file(f"{c.intent}.intent")
+                or [] for c in SystemCommand}
+
+    def _prepare_confirmation(self, name: str, lang: str) -> str:
+        """
+        Prepare the confirmation for a power intent before it is handled.
+        Resources for the request language are loaded and the confirmation
+        dialogs rendered once so their templates are cached.
+        :param name: name of the matched intent
+        :param lang: language of the request
+        :returns: confirmation number to use for the request
+        """
+        resources = self.load_lang(lang=lang)
+        number = str(randint(100, 999))
+        resources.render_dialog("ask_exit_shutdown",
+                                {"action": SystemCommand[name.upper()].value,
+                                 "number": number})
+        resources.render_dialog("word_confirm")
+        return number
+
+    def _take_prepared(self, action: SystemCommand, message: Message):
+        """
+        Get a confirmation prepared from partial transcriptions of this
+        request.
+        :param action: SystemCommand being confirmed
+        :param message: Message associated with request
+        :returns: PreparedDispatch if one was prepared for this action
+        """
+        if not self._early_dispatch:
+            return None
+        prepared = self._early_dispatch.take(
+            SessionManager.get(message).session_id, action.intent)
+        if prepared:
+            LOG.debug(f"Using confirmation prepared {prepared.age}s ago")
+        return prepared
+
+    def _on_partial_utterance(self, message: Message):
+        utterance = message.data.get("utterance")
+        if utterance:
+            self._early_dispatch.on_partial(
+                SessionManager.get(message).session_id, utterance,
+                message.data.get("lang") or self.lang)
+
+    def _on_final_utterance(self, message: Message):
+        utterances = message.data.get("utterances") or [""]
+        self._early_dispatch.on_final(
+            SessionManager.get(message).session_id, utterances[0],
+            message.data.get("lang") or self.lang)
+
+    def voc_list(self, voc_filename: str,
+                 lang: Optional[str] = None) -> List[str]:
+        """
+        Get vocab options for a resource. Options are interned in place so
+        phrases shared with other skills are only stored once per process.
+        """
+        vocab = NeonSkill.voc_list(self, voc_filename, lang)
+        vocab[:] = map(intern, vocab)
+        return vocab
+
+    def _on_handler_complete(self, message: Message):
+        """
+        Sample memory after each of this skill's handlers completes.
+        """
+        if message.context.get("skill_id") == self.skill_id:
+            name = message.data.get("name") or "unknown"
+            self._memory.sample(name.split(".")[-1])
+
+    def _handle_memory_report(self, message: Message):
+        """
+        Reply with the latest memory sample for load and each handler.
+        Requests may specify a `skill_id` when more than one instance is
+        loaded.
+        """
+        if message.data.get("skill_id", self.skill_id) != self.skill_id:
+            return
+        self.bus.emit(message.response({"enabled": self._memory.enabled,
+                                        "samples": self._memory.report()}))
+
+    def _check_listener(self) -> bool:
+        """
+        Check the cached listener state before making a request that would
+        block on it. Speaks an error if the listener is known to be down.
+        :returns: False if the listener is known to be unavailable
+        """
+        if not self._watchdog:
+            return True
+        self._watchdog.notify_activity()
+        if self._watchdog.is_down:
+            LOG.warning(f"Listener unavailable after "
+                        f"{self._watchdog.failures} failed checks")
+            self.speak_dialog("error_listener_unavailable")
+            return False
+        return True
+
+    def _handle_ww_audit(self, message: Message):
+        """
+        Reply with the most recent wake word changes, oldest first. Requests
+        may specify a `limit` (default 20) and a `skill_id` when more than one
+        instance is loaded.
+        """
+        if message.data.get("skill_id", self.skill_id) != self.skill_id:
+            return
+        self._audit.flush()
+        entries = self._audit.recent(message.data.get("limit", 20))
+        self.bus.emit(message.response(
+            {"entries": [asdict(entry) for entry in entries]}))
+
+    def _end_solo_mode(self, reason: str):
+        """
+        Require wake words again after solo mode reached a limit.
+        :param reason: limit reached; `time`, `stt` or `load`
+        """
+        message = Message("neon.device_controls.solo_governor")
+        if not self._set_ww_state(True, message):
+            LOG.error(f"Failed to end solo mode after limit: {reason}")
+            return
+        self.speak_dialog("confirm_solo_overload_ended" if reason == "load"
+                          else "confirm_solo_budget_ended", private=True)
+        self.bus.emit(message.forward("neon.device_controls.solo_ended",
+                                      {"reason": reason,
+                                       **self._solo.report()}))
+
+    def _on_user_activity(self, _: Message):
+        self._last_activity = monotonic()
+
+    def _is_idle(self) -> bool:
+        """
+        Check if the device has had no user activity recently.
+        """
+        return monotonic() - self._last_activity >= \
+            self.settings.get("rule_idle_seconds", 600)
+
+    def _run_rule(self, rule: CronRule):
+        """
+        Perform the action of a scheduled rule that is due.
+        :param rule: CronRule to run
+        """
+        if rule.condition == "idle" and not self._is_idle():
+            LOG.info(f"Skipping rule while not idle: {rule}")
+            return
+        LOG.info(f"Running scheduled rule: {rule}")
+        message = Message("neon.device_controls.rule", {"rule": str(rule)})
+        if rule.action in ("skip_wake_words", "require_wake_words"):
+            enabled = rule.action == "require_wake_words"
+            if self._set_ww_state(enabled, message) and self._solo:
+                if enabled:
+                    self._solo.stop()
+                else:
+                    self._solo.start()
+        else:
+            self._run_power_action(SystemCommand[rule.action.upper()])
+
+    def _handle_get_rules(self, message: Message):
+        if message.data.get("skill_id", self.skill_id) != self.skill_id:
+            return
+        self.bus.emit(message.response(
+            {"rules": [str(rule) for rule in self._rules.rules]}))
+
+    def _handle_add_rule(self, message: Message):
+        """
+        Add a scheduled rule, e.g. `{"rule": "0 3 * * * restart idle"}`.
+        Rules use crontab time fields followed by an action and an optional
+        condition.
+        """
+        if message.data.get("skill_id", self.skill_id) != self.skill_id:
+            return
+        try:
+            rule = CronRule.parse(message.data.get("rule") or "")
+        except ValueError as e:
+            self.bus.emit(message.response({"added": False,
+                                            "error": str(e)}))
+            return
+        added = self._rules.add(rule)
+        if added:
+            self._rule_store.save(self._rules.rules)
+        self.bus.emit(message.response({"added": added, "rule": str(rule)}))
+
+    def _handle_remove_rule(self, message: Message):
+        if message.data.get("skill_id", self.skill_id) != self.skill_id:
+            return
+        removed = self._rules.remove(message.data.get("rule") or "")
+        if removed:
+            self._rule_store.save(self._rules.rules)
+        self.bus.emit(message.response({"removed": removed}))
+
+    def _handle_solo_report(self, message: Message):
+        """
+        Reply with solo mode usage and the STT traffic saved by its limits.
+        Requests may specify a `skill_id` when more than one instance is
+        loaded.
+        """
+        if message.data.get("skill_id", self.skill_id) != self.skill_id:
+            return
+        self.bus.emit(message.response(self._solo.report()))
+
+    def _audit_change(self, action: AuditAction, wake_word: str,
+                      success: bool, latency: float):
+        """
+        Record a wake word change in the audit log, if enabled
+        :param action: AuditAction performed
+        :param wake_word: wake word changed, if any
+        :param success: True if the listener accepted the change
+        :param latency: seconds the listener call took
+        """
+        if self._audit:
+            self._audit.record(action, wake_word, success, latency)
+
+    def _report_listener(self, success: bool, latency: float):
+        """
+        Update the cached listener state with the result of a request
+        :param success: True if the listener responded
+        :param latency: seconds the request took
+        """
+        if self._watchdog:
+            self._watchdog.report(success, latency)
+        if success and self._ww_provisional:
+            # The listener is up; replace the saved view right away
+            self._ww_reconcile_wakeup.set()
+
+    def _load_ww_snapshot(self):
+        """
+        Load the saved wake word catalog and state as a provisional view and
+        start reconciling it with the listener in the background.
+        """
+        self._ww_snapshots = SnapshotStore(
+            join(self.file_system.path, "ww_catalog.json"))
+        snapshot = self._ww_snapshots.load()
+        if not snapshot:
+            return
+        LOG.info(f"Using saved wake word catalog {snapshot.version}")
+        self._ww_snapshot = snapshot
+        self._ww_provisional = True
+        self.ww_backend.seed_catalog(snapshot.wake_words, snapshot.version)
+        Thread(target=self._reconcile_ww_snapshot, name="ww_reconcile",
+               daemon=True).start()
+
+    def _reconcile_ww_snapshot(self):
+        """
+        Query the listener until it responds, then replace the provisional
+        wake word view with the listener's catalog and state.
+        """
+        provisional = self._ww_snapshot
+        delay = self.settings.get("ww_reconcile_interval", 1)
+        while not self._ww_reconcile_stop.is_set():
+            wake_words = self._fetch_wake_words()
+            state = self._fetch_ww_state() if wake_words is not None else None
+            if state is not None:
+                self._ww_provisional = False
+                if provisional.wake_words != self._ww_snapshot.wake_words or \
+                        provisional.enabled != self._ww_snapshot.enabled:
+                    LOG.info("Saved wake word catalog was out of date")
+                LOG.debug("Wake word catalog reconciled")
+                return
+            self._ww_reconcile_wakeup.wait(delay)
+            self._ww_reconcile_wakeup.clear()
+            delay = min(delay * 2, 30)
+
+    def _update_ww_snapshot(self, wake_words: Optional[dict] = None,
+                            enabled: Optional[bool] = None):
+        """
+        Save the wake word catalog and state reported by the listener if
+        they changed.
+        :param wake_words: catalog reported by the listener, if queried
+        :param enabled: wake words state reported by the listener, if queried
+        """
+        if not self._ww_snapshots:
+            return
+        with self._ww_snapshot_lock:
+            last = self._ww_snapshot
+            if wake_words is None:
+                if not last or last.enabled == enabled:
+                    return
+                wake_words = last.wake_words
+            elif enabled is None and last:
+                enabled = last.enabled
+            if last and last.enabled == enabled and \
+                    last.wake_words == project_wake_words(wake_words):
+                return
+            try:
+                self._ww_snapshot = self._ww_snapshots.save(wake_words,
+                                                            enabled)
+            except OSError as e:
+                LOG.warning(f"Failed to save wake word catalog: {e}")
+
+    def _match_wake_word(self, requested_ww: str, available_ww: dict,
+                         message: Message) -> Optional[str]:
+        """
+        Find the configured wake word a user requested
+        :param requested_ww: string wake word or utterance to match
+        :param available_ww: dict of available wake words
+        :param message: Message associated with request
+        :returns: matched wake word name, else None
+        """
+        lang = self.lang
+        candidates = [requested_ww, message.data.get("utterance"),
+                      *message.data.get("utterances", [])]
+        for text in dict.fromkeys(c for c in candidates if c):
+            ww = self._ww_matcher.match(text, available_ww.keys(), lang)
+            if ww:
+                LOG.debug(f"extracted: {ww}")
+                return ww
+        LOG.debug("Checking for wake words within words")
+        for ww in available_ww.keys():
+            if ww.lower().replace('_', ' ') in requested_ww.lower():
+                LOG.debug(f"matched: {ww}")
+                return ww
+        LOG.warning("Checking alternate transcriptions for a wake word")
+        utterances = message.data.get('utterances', [])
+        for ww in available_ww.keys():
+            test_ww = ww.lower().replace('_', ' ')
+            if any([test_ww in utt.lower() for utt in utterances]):
+                LOG.debug(f"Found ww: {ww}")
+                return ww
+        LOG.warning("Checking for known wake words")
+        if self.voc_match(requested_ww, 'mycroft') and \
+                'hey_mycroft' in available_ww.keys():
+            return 'hey_mycroft'
+        elif self.voc_match(requested_ww, 'neon') and \
+                'hey_neon' in available_ww.keys():
+            return 'hey_neon'
+        return None
+
+    def _fan_out(self, job, devices: List[str]) -> FanOutSummary:
+        """
+        Run a job on multiple devices and speak a single summary of the result
+        :param job: callable accepting a device name and timeout in seconds
+        :param devices: list of device names to run the job on
+        :returns: FanOutSummary of the completed job
+        """
+        summary = fan_out(devices, job,
+                          timeout=self.settings.get("fan_out_timeout", 30),
+                          max_workers=self.settings.get("fan_out_workers", 16))
+        if summary.ok:
+            self.speak_dialog("confirm_fan_out_complete",
+                              {"total": summary.total})
+        else:
+            self.speak_dialog("error_fan_out_partial",
+                              {"succeeded": len(summary.succeeded),
+                               "total": summary.total,
+                               "failed": ", ".join(summary.failed)})
+        return summary
+
+    def _fan_out_ww_state(self, enabled: bool, devices: List[str],
+                          message: Message):
+        """
+        Confirm and send a wake word state change to multiple devices
+        :param enabled: True to require wake words, False to skip them
+        :param devices: list of device names to update
+        :param message: Message associated with request
+        """
+        resp = self.ask_yesno("ask_start_requiring" if enabled else
+                              "ask_start_skipping")
+        if resp != "yes":
+            self.speak_dialog("not_doing_anything", private=True)
+            return
+
+        def _job(device: str, timeout: float) -> bool:
+            resp = device_request(self.bus, message.forward(
+                "neon.wake_words_state", {"enabled": enabled}), device,
+                timeout)
+            return not resp.data.get('error')
+
+        self._fan_out(_job, devices)
+
+    def _change_ww_on_device(self, requested_ww: str, device: str,
+                             timeout: float, message: Message) -> bool:
+        """
+        Change the wake word on a single remote device
+        :param requested_ww: string wake word or utterance to match
+        :param device: device name to update
+        :param timeout: seconds allowed for the whole change
+        :param message: Message associated with request
         :returns: True on success, False on failure
         """
-        # This has to reload the recognizer loop, so allow more time to respond
-        resp = self.bus.wait_for_response(message.forward(
-            "neon.enable_wake_word", {"wake_word": ww}), timeout=30)
-        if not resp:
-            LOG.error("No response to WW enable request")
+        deadline = monotonic() + timeout
+        resp = device_request(self.bus, message.forward(
+            "neon.get_wake_words", {"fields": list(WW_CATALOG_FIELDS)}),
+            device, timeout, "neon.wake_words")
+        available_ww, _ = parse_wake_words_reply(resp.data)
+        if not available_ww:
+            LOG.warning(f"No wake words reported by {device}")
+            return False
+        matched_ww = self._match_wake_word(requested_ww, available_ww, message)
+        if not matched_ww:
+            LOG.warning(f"No valid ww for {device} in: {requested_ww}")
             return False
+        enabled_ww = [ww for ww in available_ww.keys() if
+                      available_ww[ww].get('active')]
+        if matched_ww in enabled_ww:
+            return True
+        resp = device_request(self.bus, message.forward(
+            "neon.enable_wake_word", {"wake_word": matched_ww}), device,
+            max(deadline - monotonic(), 0))
         if resp.data.get('error'):
-            LOG.warning(f"WW enable failed with response: {resp.data}")
+            LOG.warning(f"WW enable failed on {device}: {resp.data}")
             return False
+        if len(enabled_ww) == 1:
+            device_request(self.bus, message.forward(
+                "neon.disable_wake_word", {"wake_word": enabled_ww[0]}),
+                device, max(deadline - monotonic(), 0))
         return True
 
+    def _enable_wake_word(self, ww: str, message: Message) -> bool:
+        """
+        Enable the requested wake word and return True on success
+        :param ww: string wake word to enable
+        :returns: True on success, False on failure
+        """
+        start = monotonic()
+        with self._budget_step("enable_wake_word"):
+            success = self._scheduler.run(
+                ControlPriority.WAKE_WORD, f"wake_word.enable.{ww}",
+                lambda: self.ww_backend.enable_wake_word(ww, message),
+                default=False, merge=True, timeout=self._budget_remaining())
+        latency = monotonic() - start
+        self._report_listener(success, latency)
+        self._audit_change(AuditAction.ENABLE_WAKE_WORD, ww, success, latency)
+        return success
+
+    def _set_ww_state(self, enabled: bool, message: Message) -> bool:
+        """
+        Require or skip wake words and return True if acknowledged
+        :param enabled: True to require wake words, False to skip them
+        :returns: True if the listener acknowledged the change
+        """
+        start = monotonic()
+        with self._budget_step("set_wake_words_state"):
+            success = self._scheduler.run(
+                ControlPriority.WAKE_WORD, "wake_words_state",
+                lambda: self.ww_backend.set_state(enabled, message),
+                default=False, timeout=self._budget_remaining())
+        self._audit_change(AuditAction.REQUIRE_WAKE_WORDS if enabled else
+                           AuditAction.SKIP_WAKE_WORDS, "", success,
+                           monotonic() - start)
+        return success
+
+    def _prepare_wake_word(self, ww: str, enable: bool, message: Message):
+        """
+        Send a speculative hint so the listener can prepare a wake word change
+        while the user is prompted to confirm it
+        :param ww: string wake word that may be enabled or disabled
+        :param enable: True if the wake word may be enabled, else disabled
+        """
+        if self.settings.get("prepare_wake_words", True):
+            LOG.debug(f"Preparing ww={ww}, enable={enable}")
+            self.ww_backend.prepare_wake_word(ww, enable, message)
+
+    def _cancel_prepare_wake_word(self, ww: str, message: Message):
+        """
+        Cancel a speculative hint sent by `_prepare_wake_word`
+        :param ww: string wake word that will not be changed
+        """
+        if self.settings.get("prepare_wake_words", True):
+            LOG.debug(f"Cancel preparing ww={ww}")
+            self.ww_backend.cancel_prepare_wake_word(ww, message)
+
     def _disable_wake_word(self, ww: str, message: Message) -> bool:
         """
         Disable the requested wake word and return True on success
         :param ww: string wake word to disable
         :returns: True on success, False on failure
         """
-        resp = self.bus.wait_for_response(message.forward(
-            "neon.disable_wake_word", {"wake_word": ww}), timeout=30)
-        if not resp:
-            LOG.error("No response to WW disable request")
-            return False
-        if resp.data.get('error'):
-            LOG.warning(f"WW disable failed with response: {resp.data}")
-            return False
-        return True
+        start = monotonic()
+        with self._budget_step("disable_wake_word"):
+            success = self._scheduler.run(
+                ControlPriority.WAKE_WORD, f"wake_word.disable.{ww}",
+                lambda: self.ww_backend.disable_wake_word(ww, message),
+                default=False, merge=True, timeout=self._budget_remaining())
+        latency = monotonic() - start
+        self._report_listener(success, latency)
+        self._audit_change(AuditAction.DISABLE_WAKE_WORD, ww, success, latency)
+        return success
+
+    def _disable_other_wake_word(self, ww: str, message: Message) -> bool:
+        """
+        Disable a wake word only if another wake word remains active. The
+        caller's view of active wake words may be stale if another request
+        changed them concurrently, so the current state is checked again.
+        Disables are serialized so two requests cannot each disable the
+        other's remaining wake word; enables are not blocked.
+        :param ww: string wake word to disable
+        :returns: True if the wake word is no longer active
+        """
+        with self._ww_disable_lock:
+            available_ww = self._fetch_wake_words()
+            if available_ww is None:
+                return False
+            active = [w for w, config in available_ww.items()
+                      if config.get('active')]
+            if ww not in active:
+                LOG.debug(f"WW already disabled: {ww}")
+                return True
+            if len(active) < 2:
+                LOG.warning(f"Not disabling the only active WW: {ww}")
+                return False
+            return self._disable_wake_word(ww, message)
+
+    def _run_power_action(self, action: SystemCommand):
+        """
+        Perform a confirmed power action. With the `defer_power` setting, an
+        action requested while the device is busy waits in the background
+        for a quiet window of `power_quiet_seconds`, up to
+        `power_max_deferral` seconds, and the user is told how long to
+        expect.
+        :param action: SystemCommand action to perform
+        """
+        def _run():
+            self._scheduler.run(ControlPriority.POWER, "power",
+                                lambda: self._do_exit_shutdown(action))
+
+        quiet = self.settings.get("power_quiet_seconds", 10)
+        max_wait = self.settings.get("power_max_deferral", 300)
+        if not self._activity or self._activity.quiet_for() >= quiet:
+            _run()
+            return
+        expected = min(self._activity.expected_wait(quiet), max_wait)
+        LOG.info(f"Deferring {action.name} up to {max_wait}s: "
+                 f"{self._activity.report()}")
+        self.speak_dialog("confirm_power_deferred",
+                          {"action": action.value,
+                           "seconds": round(expected)}, private=True)
+
+        def _deferred():
+            if not self._activity.wait_for_quiet(quiet, max_wait):
+                LOG.warning(f"No quiet window after {max_wait}s; "
+                            f"performing {action.name}")
+            _run()
+
+        Thread(target=_deferred, name="deferred_power", daemon=True).start()
 
     def _do_exit_shutdown(self, action: SystemCommand):
         """
         Handle confirmed requests to stop running process.
         :param action: SystemCommand action to perform
         """
-        if action == SystemCommand.SHUTDOWN:
-            self.speak_dialog("confirm_shutdown", private=True, wait=True)
-            self.bus.emit(Message("system.shutdown"))
-        elif action == SystemCommand.EXIT:
-            self.speak_dialog("confirm_exiting", private=True, wait=True)
-            self.bus.emit(Message("neon.shutdown"))
-        elif action == SystemCommand.RESTART:
-            self.speak_dialog("confirm_restarting", private=True, wait=True)
-            self.bus.emit(Message("system.reboot"))
+        self.speak_dialog(action.dialog, private=True, wait=True)
+        self.bus.emit(Message(action.event))
+
+    def _do_fan_out_exit_shutdown(self, action: SystemCommand,
+                                  devices: List[str], message: Message):
+        """
+        Handle confirmed requests to stop running processes on other devices.
+        Power events are not acknowledged, so each device succeeds once the
+        request is sent.
+        :param action: SystemCommand action to perform
+        :param devices: list of device names to send the action to
+        :param message: Message associated with request
+        """
+        def _job(device: str, _: float) -> bool:
+            msg = message.forward(action.event)
+            msg.context["destination"] = device
+            self.bus.emit(msg)
+            return True
+
+        self._fan_out(_job, devices)
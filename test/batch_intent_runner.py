@@ -0,0 +1,256 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Run every utterance in `test_intents.yaml` against the skill's intents with
+each language loaded once and languages tested in parallel processes.
+Run with `python test/batch_intent_runner.py [-j WORKERS] [--verbose]`
+"""
+
+import argparse
+import sys
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from os.path import dirname, join
+from time import perf_counter
+from typing import Dict, List, Optional, Tuple
+
+import yaml
+
+from adapt.engine import IntentDeterminationEngine
+from ovos_workshop.intents import IntentBuilder
+from ovos_workshop.resource_files import SkillResources
+from padacioso import IntentContainer
+
+ROOT_DIR = dirname(dirname(__file__))
+INTENT_TESTS = join(dirname(__file__), "test_intents.yaml")
+PADATIOUS_MIN_CONF = 0.8
+
+
+@dataclass
+class UtteranceResult:
+    utterance: str
+    expected: str
+    matched: Optional[str]
+    match_time: float
+    error: Optional[str] = None
+
+    @property
+    def passed(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class LanguageResult:
+    lang: str
+    load_time: float
+    results: List[UtteranceResult] = field(default_factory=list)
+
+    @property
+    def failures(self) -> List[UtteranceResult]:
+        return [r for r in self.results if not r.passed]
+
+
+def get_skill_intents() -> Tuple[list, List[str]]:
+    """
+    Get the intents registered by the skill's decorated handlers.
+    :returns: list of built Adapt intents and list of Padatious intent files
+    """
+    from skill_device_controls import DeviceControlCenterSkill
+    adapt_intents = list()
+    intent_files = list()
+    for name in dir(DeviceControlCenterSkill):
+        method = getattr(DeviceControlCenterSkill, name)
+        for intent in getattr(method, "intents", None) or []:
+            if isinstance(intent, str):
+                intent_files.append(intent)
+            elif isinstance(intent, IntentBuilder):
+                adapt_intents.append(intent.build())
+            else:
+                adapt_intents.append(intent)
+    return adapt_intents, intent_files
+
+
+def load_language(lang: str) -> Tuple[IntentDeterminationEngine,
+                                      IntentContainer]:
+    """
+    Load all vocab, regex and intents for a language.
+    :param lang: language to load
+    :returns: Adapt engine and Padacioso container with skill intents
+    """
+    resources = SkillResources(ROOT_DIR, lang, skill_id="batch_test")
+    engine = IntentDeterminationEngine()
+    for vocab_type, lines in resources.load_skill_vocabulary("").items():
+        for line in lines:
+            engine.register_entity(line[0], vocab_type.lower())
+            for alias in line[1:]:
+                engine.register_entity(alias, vocab_type.lower(),
+                                       alias_of=line[0])
+    for regex in resources.load_skill_regex(""):
+        engine.register_regex_entity(regex)
+    container = IntentContainer(fuzz=False)
+    adapt_intents, intent_files = get_skill_intents()
+    for intent in adapt_intents:
+        engine.register_intent_parser(intent)
+    for intent_file in intent_files:
+        container.add_intent(intent_file,
+                             resources.load_intent_file(intent_file))
+    return engine, container
+
+
+def _get_expected_entities(spec) -> dict:
+    """
+    Normalize the expected entities for a test utterance. Entities may be a
+    list of vocab names, a list of {vocab: value} dicts, or a dict.
+    """
+    if isinstance(spec, dict):
+        return spec
+    expected = dict()
+    for entity in spec or []:
+        if isinstance(entity, dict):
+            expected.update(entity)
+        else:
+            expected[entity] = None
+    return expected
+
+
+def determine_intents(engine: IntentDeterminationEngine,
+                      utterance: str) -> List[dict]:
+    """
+    Get every Adapt match for an utterance. Intents excluding vocab found in
+    the utterance are dropped, as the OVOS Adapt pipeline does.
+    """
+    vocab = {data[1] for tag in engine.tagger.tag(utterance.lower())
+             for entity in tag["entities"] for data in entity["data"]}
+    excludes = {i.name: set(i.excludes) for i in engine.intent_parsers}
+    return [i for i in engine.determine_intent(utterance, 100,
+                                               include_tags=True)
+            if not excludes.get(i["intent_type"], set()) & vocab]
+
+
+def match_utterance(engine: IntentDeterminationEngine,
+                    container: IntentContainer,
+                    utterance: str) -> Tuple[Optional[str], dict]:
+    """
+    Match an utterance with Adapt, falling back to Padatious intents.
+    :returns: matched intent name and extracted entities
+    """
+    intents = determine_intents(engine, utterance)
+    if intents:
+        best = max(intents, key=lambda i: i.get('confidence', 0.0))
+        entities = {k: v for k, v in best.items()
+                    if k not in ("intent_type", "confidence", "target",
+                                 "__tags__") and isinstance(v, str)}
+        return best['intent_type'], entities
+    intent = container.calc_intent(utterance) or dict()
+    if intent.get("name") and intent.get("conf", 0) >= PADATIOUS_MIN_CONF:
+        return intent["name"], intent.get("entities") or dict()
+    return None, dict()
+
+
+def run_language(lang: str, tests: Dict[str, list]) -> LanguageResult:
+    """
+    Test every utterance for a single language.
+    :param lang: language to test
+    :param tests: dict of intent name to list of test utterances
+    :returns: LanguageResult with a result for every utterance
+    """
+    start = perf_counter()
+    engine, container = load_language(lang)
+    result = LanguageResult(lang, perf_counter() - start)
+    for intent_name, utterances in tests.items():
+        for test in utterances or []:
+            if isinstance(test, dict):
+                utterance, spec = list(test.items())[0]
+            else:
+                utterance, spec = test, None
+            utterance = utterance.lower().strip()
+            start = perf_counter()
+            matched, entities = match_utterance(engine, container, utterance)
+            elapsed = perf_counter() - start
+            error = None
+            if matched != intent_name:
+                error = f"matched {matched}"
+            else:
+                for entity, value in _get_expected_entities(spec).items():
+                    if entity not in entities:
+                        error = f"missing entity {entity}"
+                    elif value is not None and \
+                            str(value).lower() != entities[entity].lower():
+                        error = f"{entity}={entities[entity]}, " \
+                                f"expected {value}"
+            result.results.append(UtteranceResult(utterance, intent_name,
+                                                  matched, elapsed, error))
+    return result
+
+
+def run_batch(intent_tests: str = INTENT_TESTS,
+              workers: Optional[int] = None) -> List[LanguageResult]:
+    """
+    Test all languages in an intent test file in parallel processes.
+    :param intent_tests: path to test_intents.yaml
+    :param workers: max processes to use (default one per language)
+    :returns: list of LanguageResult
+    """
+    with open(intent_tests) as f:
+        tests = yaml.safe_load(f)
+    with ProcessPoolExecutor(max_workers=workers or len(tests)) as executor:
+        return list(executor.map(run_language, tests.keys(), tests.values()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-j", "--workers", type=int, default=None)
+    parser.add_argument("-f", "--file", default=INTENT_TESTS)
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args()
+
+    start = perf_counter()
+    results = run_batch(args.file, args.workers)
+    failed = 0
+    for lang in results:
+        times = sorted(r.match_time for r in lang.results)
+        print(f"{lang.lang}: {len(lang.results) - len(lang.failures)}/"
+              f"{len(lang.results)} passed; loaded in "
+              f"{lang.load_time * 1000:.1f}ms; match median "
+              f"{times[len(times) // 2] * 1000:.2f}ms, max "
+              f"{times[-1] * 1000:.2f}ms")
+        for r in lang.results:
+            if args.verbose or not r.passed:
+                status = "PASS" if r.passed else f"FAIL ({r.error})"
+                print(f"  {r.match_time * 1000:7.2f}ms {r.expected}: "
+                      f"'{r.utterance}' {status}")
+        failed += len(lang.failures)
+    print(f"Completed in {perf_counter() - start:.2f}s with {failed} "
+          f"mismatches")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
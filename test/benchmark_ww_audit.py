@@ -0,0 +1,78 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+Measure the latency the wake word audit log adds to a wake word change.
+Run with `python test/benchmark_ww_audit.py [iterations]`
+"""
+
+import sys
+
+from os.path import dirname, join
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+sys.path.append(dirname(__file__))
+from fake_listener import FakeListener
+from skill_device_controls.util.audit import AuditAction, WakeWordAuditLog
+from skill_device_controls.util.ww_backend import DirectWakeWordBackend
+
+
+def _time_changes(backend, iterations: int, audit=None) -> float:
+    start = perf_counter()
+    for i in range(iterations):
+        ww = "hey_mycroft"
+        call_start = perf_counter()
+        if i % 2:
+            success = backend.disable_wake_word(ww)
+            action = AuditAction.DISABLE_WAKE_WORD
+        else:
+            success = backend.enable_wake_word(ww)
+            action = AuditAction.ENABLE_WAKE_WORD
+        if audit:
+            audit.record(action, ww, success, perf_counter() - call_start)
+    return (perf_counter() - start) / iterations
+
+
+def main(iterations: int = 10000):
+    backend = DirectWakeWordBackend(FakeListener())
+    with TemporaryDirectory() as tmp:
+        audit = WakeWordAuditLog(join(tmp, "ww_audit.bin"))
+        plain = _time_changes(backend, iterations)
+        audited = _time_changes(backend, iterations, audit)
+        start = perf_counter()
+        audit.flush()
+        drain = perf_counter() - start
+        audit.stop()
+    print(f"{'change (us)':<22}{plain * 1e6:>10.2f}")
+    print(f"{'audited change (us)':<22}{audited * 1e6:>10.2f}")
+    print(f"{'added per change (us)':<22}{(audited - plain) * 1e6:>10.2f}")
+    print(f"{'writer backlog (ms)':<22}{drain * 1000:>10.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,82 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Compare wake word backend latency over a messagebus and in-process.
+Run with `python test/benchmark_ww_backend.py [iterations]`
+"""
+
+import sys
+
+from os.path import dirname
+from time import perf_counter
+
+from ovos_utils.fakebus import FakeBus
+
+sys.path.append(dirname(__file__))
+from fake_listener import FakeListener
+from skill_device_controls.util.ww_backend import BusWakeWordBackend, \
+    DirectWakeWordBackend
+
+
+def _time_operations(backend, iterations: int) -> dict:
+    operations = {
+        "get_state": lambda: backend.get_state(),
+        "get_wake_words": lambda: backend.get_wake_words(),
+        "enable_wake_word": lambda: backend.enable_wake_word("hey_mycroft"),
+        "disable_wake_word": lambda: backend.disable_wake_word("hey_mycroft"),
+    }
+    results = dict()
+    for name, operation in operations.items():
+        start = perf_counter()
+        for _ in range(iterations):
+            operation()
+        results[name] = (perf_counter() - start) / iterations
+    return results
+
+
+def main(iterations: int = 200):
+    listener = FakeListener()
+    bus = FakeBus()
+    listener.bind(bus)
+    backends = {"bus": BusWakeWordBackend(bus),
+                "direct": DirectWakeWordBackend(listener)}
+    results = {name: _time_operations(backend, iterations)
+               for name, backend in backends.items()}
+    print(f"{'operation':<20}{'bus (ms)':>12}{'direct (ms)':>14}"
+          f"{'speedup':>10}")
+    for operation in results["bus"]:
+        bus_time = results["bus"][operation]
+        direct_time = results["direct"][operation]
+        print(f"{operation:<20}{bus_time * 1000:>12.3f}"
+              f"{direct_time * 1000:>14.4f}"
+              f"{bus_time / max(direct_time, 1e-9):>9.0f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
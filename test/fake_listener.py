@@ -0,0 +1,180 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from copy import deepcopy
+from threading import Lock
+from time import sleep
+from typing import Optional
+
+from ovos_bus_client.message import Message
+from skill_device_controls.util.ww_backend import get_catalog_version, \
+    project_wake_words
+
+
+class FakeListener:
+    """
+    Local stand-in for the speech listener's wake word API. Requests may be
+    made directly or over a messagebus after calling `bind`. Set
+    `supports_projection` False to emulate a listener that always replies with
+    the full wake word catalog. `latency` seconds are added to each wake word
+    change, as when a listener reloads its recognizer. Each change appends
+    the resulting state and active wake words to `history`.
+    """
+    def __init__(self, wake_words: Optional[dict] = None,
+                 enabled: bool = True, supports_projection: bool = True,
+                 latency: float = 0):
+        self.wake_words = deepcopy(wake_words) if wake_words is not None else \
+            {"hey_neon": {"active": True, "module": "ovos-ww-plugin-vosk"},
+             "hey_mycroft": {"active": False,
+                             "module": "ovos-ww-plugin-precise-lite"}}
+        self.enabled = enabled
+        self.supports_projection = supports_projection
+        self.latency = latency
+        self.prepared = dict()
+        self.history = list()
+        self.lock = Lock()
+        self.bus = None
+
+    @property
+    def active(self) -> set:
+        return {ww for ww, config in self.wake_words.items()
+                if config.get('active')}
+
+    def _record_change(self):
+        self.history.append((self.enabled, frozenset(self.active)))
+
+    # Direct API
+    def get_wake_words_state(self) -> bool:
+        return self.enabled
+
+    def set_wake_words_state(self, enabled: bool):
+        with self.lock:
+            self.enabled = enabled
+            self._record_change()
+
+    def get_wake_words(self) -> dict:
+        with self.lock:
+            return deepcopy(self.wake_words)
+
+    def enable_wake_word(self, ww: str) -> bool:
+        sleep(self.latency)
+        with self.lock:
+            if ww not in self.wake_words:
+                return False
+            self.prepared.pop(ww, None)
+            self.wake_words[ww]['active'] = True
+            self._record_change()
+            return True
+
+    def disable_wake_word(self, ww: str) -> bool:
+        sleep(self.latency)
+        with self.lock:
+            if ww not in self.wake_words:
+                return False
+            self.prepared.pop(ww, None)
+            self.wake_words[ww]['active'] = False
+            self._record_change()
+            return True
+
+    def prepare_wake_word(self, ww: str, enable: bool):
+        with self.lock:
+            if ww in self.wake_words:
+                self.prepared[ww] = enable
+
+    def cancel_prepare_wake_word(self, ww: str):
+        with self.lock:
+            self.prepared.pop(ww, None)
+
+    # Messagebus API
+    def bind(self, bus):
+        self.bus = bus
+        bus.on("neon.query_wake_words_state", self._handle_query_state)
+        bus.on("neon.wake_words_state", self._handle_set_state)
+        bus.on("neon.get_wake_words", self._handle_get_wake_words)
+        bus.on("neon.enable_wake_word", self._handle_enable_wake_word)
+        bus.on("neon.disable_wake_word", self._handle_disable_wake_word)
+        bus.on("neon.prepare_wake_word", self._handle_prepare_wake_word)
+        bus.on("neon.cancel_prepare_wake_word", self._handle_cancel_prepare)
+
+    def unbind(self):
+        self.bus.remove("neon.query_wake_words_state", self._handle_query_state)
+        self.bus.remove("neon.wake_words_state", self._handle_set_state)
+        self.bus.remove("neon.get_wake_words", self._handle_get_wake_words)
+        self.bus.remove("neon.enable_wake_word", self._handle_enable_wake_word)
+        self.bus.remove("neon.disable_wake_word",
+                        self._handle_disable_wake_word)
+        self.bus.remove("neon.prepare_wake_word",
+                        self._handle_prepare_wake_word)
+        self.bus.remove("neon.cancel_prepare_wake_word",
+                        self._handle_cancel_prepare)
+        self.bus = None
+
+    def _handle_query_state(self, message: Message):
+        self.bus.emit(message.response({"enabled": self.enabled}))
+
+    def _handle_set_state(self, message: Message):
+        self.set_wake_words_state(message.data["enabled"])
+        self.bus.emit(message.response({"enabled": self.enabled}))
+
+    def _handle_get_wake_words(self, message: Message):
+        wake_words = self.get_wake_words()
+        fields = message.data.get("fields")
+        if not self.supports_projection or not fields:
+            self.bus.emit(message.reply("neon.wake_words", wake_words))
+            return
+        wake_words = project_wake_words(wake_words, fields)
+        version = get_catalog_version(wake_words)
+        if message.data.get("version") == version:
+            self.bus.emit(message.reply("neon.wake_words",
+                                        {"not_modified": True,
+                                         "version": version}))
+        else:
+            self.bus.emit(message.reply("neon.wake_words",
+                                        {"wake_words": wake_words,
+                                         "version": version}))
+
+    def _handle_enable_wake_word(self, message: Message):
+        ww = message.data["wake_word"]
+        success = self.enable_wake_word(ww)
+        self.bus.emit(message.response({"error": not success,
+                                        "active": success,
+                                        "wake_word": ww}))
+
+    def _handle_disable_wake_word(self, message: Message):
+        ww = message.data["wake_word"]
+        success = self.disable_wake_word(ww)
+        self.bus.emit(message.response({"error": not success,
+                                        "active": not success,
+                                        "wake_word": ww}))
+
+    def _handle_prepare_wake_word(self, message: Message):
+        self.prepare_wake_word(message.data["wake_word"],
+                               message.data["enable"])
+
+    def _handle_cancel_prepare(self, message: Message):
+        self.cancel_prepare_wake_word(message.data["wake_word"])
@@ -0,0 +1,75 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from typing import Iterator, List, Optional
+
+from ovos_bus_client.message import Message
+from skill_device_controls import PARTIAL_UTTERANCE_EVENT
+
+
+class FakePartialStream:
+    """
+    Local stand-in for a streaming STT engine. Emits a growing partial
+    hypothesis for each word of an utterance, followed by the final
+    transcription.
+    """
+    def __init__(self, bus, lang: str = "en-us",
+                 session_id: str = "default"):
+        self.bus = bus
+        self.lang = lang
+        self.session_id = session_id
+
+    def partials(self, utterance: str) -> Iterator[str]:
+        """
+        Get the partial hypotheses streamed for an utterance.
+        """
+        words = utterance.split()
+        for i in range(1, len(words) + 1):
+            yield " ".join(words[:i])
+
+    def stream(self, utterance: str, final: Optional[str] = None,
+               emit_final: bool = True) -> List[str]:
+        """
+        Stream partial hypotheses for an utterance.
+        :param utterance: utterance to stream partials of
+        :param final: final transcription, if it differs from `utterance`
+        :param emit_final: if False, only partials are emitted
+        :returns: list of emitted partial hypotheses
+        """
+        context = {"session": {"session_id": self.session_id}}
+        emitted = list()
+        for partial in self.partials(utterance):
+            self.bus.emit(Message(PARTIAL_UTTERANCE_EVENT,
+                                  {"utterance": partial, "lang": self.lang},
+                                  context))
+            emitted.append(partial)
+        if emit_final:
+            self.bus.emit(Message("recognizer_loop:utterance",
+                                  {"utterances": [final or utterance],
+                                   "lang": self.lang}, context))
+        return emitted
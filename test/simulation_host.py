@@ -0,0 +1,351 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+Run DeviceControlCenterSkill handlers against an in-memory bus and fake
+listener, with TTS, GUI and user responses replaced by scripts.
+Each worker process loads the skill once and reuses it for every scenario,
+so scripts run in milliseconds after start-up.
+Run with `python test/simulation_host.py [scenarios] [processes]`
+"""
+
+import sys
+
+from collections import deque
+from copy import deepcopy
+from inspect import getfile
+from dataclasses import dataclass, field
+from multiprocessing import get_context
+from os import environ
+from os.path import dirname
+from random import Random
+from statistics import quantiles
+from tempfile import mkdtemp
+from threading import Thread
+from time import perf_counter
+from typing import Dict, List, Optional
+
+from lingua_franca import load_language
+from ovos_bus_client.message import Message
+from ovos_utils.fakebus import FakeBus
+from ovos_utils.log import LOG
+from neon_utils.skills.neon_skill import NeonSkill
+
+sys.path.append(dirname(__file__))
+from fake_listener import FakeListener
+from skill_device_controls import DeviceControlCenterSkill, SystemCommand
+
+SKILL_DIR = dirname(getfile(DeviceControlCenterSkill))
+
+# Answer with the confirmation number shown on the GUI
+CONFIRM = "<confirm>"
+
+SIMULATION_SETTINGS = {"listener_watchdog": False,
+                       "ww_audit_log": False,
+                       "memory_profile": False,
+                       "ww_backend": "bus"}
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    # (handler, seconds) for each step run
+    steps: List[tuple] = field(default_factory=list)
+    spoken: List[str] = field(default_factory=list)
+    prompts: List[str] = field(default_factory=list)
+    # Power events emitted by the skill
+    events: List[str] = field(default_factory=list)
+    wake_words: Dict[str, bool] = field(default_factory=dict)
+    wake_words_enabled: Optional[bool] = None
+    error: Optional[str] = None
+    # Name of a handler that did not return within the timeout
+    deadlocked: Optional[str] = None
+
+
+class StubGUI:
+    """
+    GUI that records text shown and ignores all other calls.
+    """
+    def __init__(self):
+        self.shown = list()
+
+    def show_text(self, text, title=None, *args, **kwargs):
+        self.shown.append((text, title))
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class _ScriptedUser(NeonSkill):
+    """
+    Replaces speech and the user's spoken responses. `get_response` is
+    overridden below the skill's own override, so the skill's time budget
+    handling runs as it does on a device.
+    """
+    def speak(self, utterance, *args, **kwargs):
+        self.spoken.append(utterance)
+
+    def get_response(self, dialog='', data=None, validator=None,
+                     on_fail=None, num_retries=-1, message=None):
+        self.prompts.append(dialog)
+        if not self.answers:
+            return None
+        answer = self.answers.popleft()
+        if answer == CONFIRM:
+            answer = str(self.gui.shown[-1][0]) if self.gui.shown else ""
+        if validator and not validator(answer):
+            return None
+        return answer
+
+
+class SimulatedSkill(DeviceControlCenterSkill, _ScriptedUser):
+    def __init__(self, **kwargs):
+        self.spoken = list()
+        self.prompts = list()
+        self.answers = deque()
+        DeviceControlCenterSkill.__init__(self, **kwargs)
+
+
+def isolate_environment():
+    """
+    Point XDG directories at a new temporary directory so simulated skills
+    do not read or write user configuration.
+    """
+    root = mkdtemp(prefix="device_controls_sim_")
+    for var in ("XDG_CONFIG_HOME", "XDG_DATA_HOME", "XDG_CACHE_HOME"):
+        environ[var] = root
+
+
+class SimulationHost:
+    """
+    Loads the skill on an in-memory bus with a fake listener and runs
+    scripted scenarios against it. A scenario is a dict with:
+      `name`: label for the result
+      `steps`: list of {"handler", "data", "context"} to call in order
+      `answers`: responses given to prompts in order; `CONFIRM` answers
+        with the number shown on the GUI
+      `wake_words`: optional listener catalog to start from
+      `enabled`: optional initial wake words state (default True)
+    """
+    skill_id = "skill-device_controls.simulation"
+
+    def __init__(self, settings: Optional[dict] = None):
+        self.bus = FakeBus()
+        self.listener = FakeListener()
+        self.listener.bind(self.bus)
+        self.gui = StubGUI()
+        self._default_wake_words = deepcopy(self.listener.wake_words)
+        self._events = list()
+        for command in SystemCommand:
+            self.bus.on(command.event,
+                        lambda m: self._events.append(m.msg_type))
+        start = perf_counter()
+        # Parsers are loaded by the core at start-up on a device
+        load_language("en")
+        self.skill = SimulatedSkill(skill_id=self.skill_id, bus=self.bus,
+                                    gui=self.gui, resources_dir=SKILL_DIR,
+                                    settings={**SIMULATION_SETTINGS,
+                                              **(settings or dict())})
+        self.load_time = perf_counter() - start
+
+    def run(self, scenario: dict, timeout: float = 30) -> ScenarioResult:
+        """
+        Run a scenario from a clean listener and user state.
+        :param scenario: scenario dict described in the class docstring
+        :param timeout: seconds each handler may run before it is reported
+            as deadlocked
+        :returns: ScenarioResult of the run
+        """
+        self.listener.wake_words = deepcopy(scenario.get("wake_words") or
+                                            self._default_wake_words)
+        self.listener.enabled = scenario.get("enabled", True)
+        self.listener.prepared.clear()
+        self.listener.history.clear()
+        self.gui.shown.clear()
+        self._events.clear()
+        self.skill.spoken.clear()
+        self.skill.prompts.clear()
+        self.skill.answers = deque(scenario.get("answers", list()))
+
+        result = ScenarioResult(scenario.get("name", ""))
+        for step in scenario.get("steps", list()):
+            handler = step["handler"]
+            message = Message(f"{self.skill_id}:{handler}",
+                              deepcopy(step.get("data", dict())),
+                              deepcopy(step.get("context", dict())))
+            errors = list()
+
+            def _run():
+                try:
+                    getattr(self.skill, handler)(message)
+                except Exception as e:
+                    errors.append(f"{handler}: {e!r}")
+
+            start = perf_counter()
+            thread = Thread(target=_run, daemon=True)
+            thread.start()
+            thread.join(timeout)
+            result.steps.append((handler, perf_counter() - start))
+            if thread.is_alive():
+                result.deadlocked = handler
+                break
+            if errors:
+                result.error = errors[0]
+                break
+        result.spoken = list(self.skill.spoken)
+        result.prompts = list(self.skill.prompts)
+        result.events = list(self._events)
+        result.wake_words = {ww: bool(conf.get("active")) for ww, conf in
+                             self.listener.wake_words.items()}
+        result.wake_words_enabled = self.listener.enabled
+        return result
+
+    def shutdown(self):
+        self.skill.default_shutdown()
+        self.listener.unbind()
+
+
+_host: Optional[SimulationHost] = None
+
+
+def _init_worker(settings: Optional[dict]):
+    global _host
+    isolate_environment()
+    LOG.set_level("ERROR")
+    _host = SimulationHost(settings)
+
+
+def _run_in_worker(args) -> ScenarioResult:
+    global _host
+    scenario, timeout = args
+    result = _host.run(scenario, timeout)
+    if result.deadlocked:
+        # The stuck handler keeps its thread; continue with a fresh skill
+        _host = SimulationHost(_host.skill.settings)
+    return result
+
+
+def run_scenarios(scenarios: List[dict], processes: Optional[int] = None,
+                  timeout: float = 30,
+                  settings: Optional[dict] = None) -> List[ScenarioResult]:
+    """
+    Run scenarios in parallel worker processes, each with its own skill.
+    :param scenarios: list of scenario dicts (see `SimulationHost`)
+    :param processes: number of worker processes, default one per CPU
+    :param timeout: seconds each handler may run before it is reported as
+        deadlocked
+    :param settings: skill settings to apply in every worker
+    :returns: list of ScenarioResult in the order of `scenarios`
+    """
+    # Forked workers would inherit locks held by the core's imports
+    with get_context("spawn").Pool(processes, initializer=_init_worker,
+                                   initargs=(settings,)) as pool:
+        return pool.map(_run_in_worker,
+                        [(scenario, timeout) for scenario in scenarios],
+                        chunksize=max(len(scenarios) // (8 * (processes or 4)),
+                                      1))
+
+
+def generate_scenarios(count: int, seed: int = 0) -> List[dict]:
+    """
+    Generate random scenarios covering the wake word and power handlers.
+    :param count: number of scenarios to generate
+    :param seed: random seed, so a run can be repeated
+    :returns: list of scenario dicts
+    """
+    rng = Random(seed)
+    answers = ["yes", "no", None]
+    templates = [
+        lambda: {"steps": [{"handler": "handle_skip_wake_words",
+                            "data": {"neon": "neon", "ww": "wake words",
+                                     "start_sww": "start"}}],
+                 "enabled": rng.choice([True, False]),
+                 "answers": [rng.choice(answers)]},
+        lambda: {"steps": [{"handler": "handle_use_wake_words",
+                            "data": {"ww": "wake words", "stop_sww": "stop"}}],
+                 "enabled": rng.choice([True, False]),
+                 "answers": [rng.choice(answers)]},
+        lambda: {"steps": [{"handler": "handle_change_ww",
+                            "data": {"rx_wakeword": rng.choice(
+                                ["hey mycroft", "hey neon", "computer"])}}],
+                 "answers": [rng.choice(answers), rng.choice(answers)]},
+        lambda: {"steps": [{"handler": rng.choice(
+                     ["handle_exit_intent", "handle_restart_intent",
+                      "handle_shutdown_intent"]), "data": {}}],
+                 "answers": [rng.choice([CONFIRM, "123", None])]},
+    ]
+    scenarios = list()
+    for i in range(count):
+        template = rng.randrange(len(templates))
+        scenario = templates[template]()
+        scenario["name"] = f"{i}:{scenario['steps'][0]['handler']}"
+        scenario["answers"] = [a for a in scenario["answers"] if a]
+        scenarios.append(scenario)
+    return scenarios
+
+
+def summarize(results: List[ScenarioResult]) -> dict:
+    """
+    Summarize handler latency and failures across scenario results.
+    :param results: list of ScenarioResult
+    :returns: dict with per-handler latency stats, errors and deadlocks
+    """
+    latencies = dict()
+    for result in results:
+        for handler, seconds in result.steps:
+            latencies.setdefault(handler, list()).append(seconds)
+    handlers = dict()
+    for handler, values in latencies.items():
+        values.sort()
+        cuts = quantiles(values, n=100) if len(values) > 1 else values * 99
+        handlers[handler] = {"count": len(values), "p50": cuts[49],
+                             "p99": cuts[98], "max": values[-1]}
+    return {"handlers": handlers,
+            "errors": [(r.name, r.error) for r in results if r.error],
+            "deadlocks": [(r.name, r.deadlocked) for r in results
+                          if r.deadlocked]}
+
+
+def main(count: int = 1000, processes: Optional[int] = None):
+    scenarios = generate_scenarios(count)
+    start = perf_counter()
+    summary = summarize(run_scenarios(scenarios, processes, timeout=10))
+    print(f"Ran {count} scenarios in {perf_counter() - start:.1f}s")
+    print(f"{'handler':<26}{'count':>7}{'p50 (ms)':>11}{'p99 (ms)':>11}"
+          f"{'max (ms)':>11}")
+    for handler, stats in sorted(summary["handlers"].items()):
+        print(f"{handler:<26}{stats['count']:>7}{stats['p50'] * 1000:>11.2f}"
+              f"{stats['p99'] * 1000:>11.2f}{stats['max'] * 1000:>11.2f}")
+    for name, error in summary["errors"]:
+        print(f"ERROR {name}: {error}")
+    for name, handler in summary["deadlocks"]:
+        print(f"DEADLOCK {name}: {handler}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else None)
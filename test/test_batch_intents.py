@@ -0,0 +1,58 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import unittest
+
+from batch_intent_runner import run_batch, run_language
+
+
+class TestBatchIntents(unittest.TestCase):
+    def test_run_language(self):
+        result = run_language("en-us", {
+            "ChangeWakeWordIntent": [
+                {"change my wake word to hey mycroft":
+                    {"rx_wakeword": "hey mycroft"}}],
+            "SkipWWIntent": ["skip wake words"],
+            "UseWWIntent": ["enable solo mode"],
+            "shutdown.intent": ["power off"]})
+        self.assertEqual(len(result.results), 4)
+        self.assertEqual([r.utterance for r in result.failures],
+                         ["enable solo mode"])
+        self.assertEqual(result.failures[0].matched, "SoloModeIntent")
+        for r in result.results:
+            self.assertIsInstance(r.match_time, float)
+
+    def test_all_intents(self):
+        results = run_batch()
+        self.assertEqual({r.lang for r in results}, {"en-us", "uk-ua"})
+        for lang in results:
+            self.assertEqual(lang.failures, [], lang.lang)
+
+
+if __name__ == '__main__':
+    unittest.main()
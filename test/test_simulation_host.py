@@ -0,0 +1,115 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+import unittest
+
+from os import environ
+from threading import Event
+from unittest.mock import patch
+
+from simulation_host import CONFIRM, SimulationHost, generate_scenarios, \
+    isolate_environment, run_scenarios, summarize
+
+
+class TestSimulationHost(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.environ = patch.dict(environ)
+        cls.environ.start()
+        isolate_environment()
+        cls.host = SimulationHost()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.host.shutdown()
+        cls.environ.stop()
+
+    def test_change_wake_word(self):
+        scenario = {"name": "change",
+                    "steps": [{"handler": "handle_change_ww",
+                               "data": {"rx_wakeword": "hey mycroft"}}]}
+        result = self.host.run(scenario)
+        self.assertIsNone(result.error)
+        self.assertEqual(result.wake_words, {"hey_neon": False,
+                                             "hey_mycroft": True})
+        self.assertTrue(result.spoken)
+
+        # Each run starts from the default listener state
+        result = self.host.run({"steps": [], "enabled": False})
+        self.assertEqual(result.wake_words, {"hey_neon": True,
+                                             "hey_mycroft": False})
+        self.assertFalse(result.wake_words_enabled)
+        self.assertEqual(result.spoken, list())
+
+    def test_scripted_answers(self):
+        scenario = {"steps": [{"handler": "handle_skip_wake_words",
+                               "data": {"neon": "neon"}}],
+                    "answers": ["yes"]}
+        result = self.host.run(scenario)
+        self.assertEqual(result.prompts, ["ask_start_skipping"])
+        self.assertFalse(result.wake_words_enabled)
+
+        scenario = {"steps": [{"handler": "handle_restart_intent"}],
+                    "answers": [CONFIRM]}
+        result = self.host.run(scenario)
+        self.assertEqual(result.prompts, ["ask_exit_shutdown"])
+        self.assertEqual(result.events, ["system.reboot"])
+
+        # Wrong confirmation and no answer do nothing
+        scenario["answers"] = ["1"]
+        self.assertEqual(self.host.run(scenario).events, list())
+        scenario["answers"] = list()
+        self.assertEqual(self.host.run(scenario).events, list())
+
+    def test_deadlock_and_error(self):
+        blocked = Event()
+        self.host.skill.handle_blocked = lambda _: blocked.wait()
+        self.host.skill.handle_error = lambda _: 1 / 0
+        result = self.host.run({"steps": [{"handler": "handle_blocked"},
+                                          {"handler": "handle_error"}]},
+                               timeout=0.1)
+        self.assertEqual(result.deadlocked, "handle_blocked")
+        self.assertEqual(len(result.steps), 1)
+        blocked.set()
+        result = self.host.run({"steps": [{"handler": "handle_error"}]})
+        self.assertIn("ZeroDivisionError", result.error)
+
+    def test_run_scenarios(self):
+        scenarios = generate_scenarios(40, seed=1)
+        self.assertEqual(scenarios, generate_scenarios(40, seed=1))
+        results = run_scenarios(scenarios, processes=2, timeout=10)
+        self.assertEqual([r.name for r in results],
+                         [s["name"] for s in scenarios])
+        summary = summarize(results)
+        self.assertEqual(summary["errors"], list())
+        self.assertEqual(summary["deadlocks"], list())
+        self.assertEqual(sum(s["count"] for s in
+                             summary["handlers"].values()), 40)
+
+
+if __name__ == '__main__':
+    unittest.main()
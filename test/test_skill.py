@@ -32,6 +32,7 @@ import pytest
 from neon_minerva.tests.skill_unit_test_base import SkillTestCase
 
 from threading import Event
+from time import sleep, time
 from unittest.mock import Mock
 from ovos_bus_client.message import Message
 
@@ -648,6 +649,614 @@ class TestSkillMethods(SkillTestCase):
         self.skill.speak_dialog.assert_called_with("error_ww_change_failed")
         disable_ww.assert_not_called()
 
+    def test_handle_change_ww_prepare(self):
+        wake_word_config = {"hey_mycroft": {"active": True},
+                            "hey_neon": {"active": True},
+                            "hey_ezra": {"active": False}}
+        hints = list()
+
+        def _handle_get_ww(message):
+            self.skill.bus.emit(message.reply("neon.wake_words",
+                                              wake_word_config))
+
+        def _handle_prepare(message):
+            hints.append(("prepare", message.data["wake_word"],
+                          message.data["enable"]))
+
+        def _handle_cancel(message):
+            hints.append(("cancel", message.data["wake_word"]))
+
+        def _handle_enable_ww(message):
+            self.assertEqual(hints[-1], ("prepare", "hey_ezra", True))
+            self.skill.bus.emit(message.response({"error": False}))
+
+        self.skill.bus.remove_all_listeners("neon.get_wake_words")
+        self.skill.bus.on("neon.get_wake_words", _handle_get_ww)
+        self.skill.bus.on("neon.prepare_wake_word", _handle_prepare)
+        self.skill.bus.on("neon.cancel_prepare_wake_word", _handle_cancel)
+        self.skill.bus.on("neon.enable_wake_word", _handle_enable_ww)
+
+        # Declined disable cancels the prepared change
+        real_ask_yesno = self.skill.ask_yesno
+        self.skill.ask_yesno = Mock(return_value="no")
+        self.skill.handle_change_ww(Message("test",
+                                            {"rx_wakeword": "hey neon"}))
+        self.assertEqual(hints, [("prepare", "hey_mycroft", False),
+                                 ("cancel", "hey_mycroft")])
+        self.skill.ask_yesno = real_ask_yesno
+
+        # New wake word is prepared before confirmation is spoken
+        hints.clear()
+        self.skill.handle_change_ww(Message("test",
+                                            {"rx_wakeword": "hey ezra"}))
+        self.assertEqual(hints, [("prepare", "hey_ezra", True)])
+        self.skill.speak_dialog.assert_called_with(
+            "confirm_ww_changed", {"wake_word": "hey ezra"})
+
+        self.skill.bus.remove("neon.get_wake_words", _handle_get_ww)
+        self.skill.bus.remove("neon.prepare_wake_word", _handle_prepare)
+        self.skill.bus.remove("neon.cancel_prepare_wake_word", _handle_cancel)
+        self.skill.bus.remove("neon.enable_wake_word", _handle_enable_ww)
+
+    def test_listener_unavailable(self):
+        message = Message("valid_intent", {"neon": "Neon", "ww": "wake words",
+                                           "start_sww": "begin"})
+        from skill_device_controls.util.watchdog import ListenerWatchdog
+        real_watchdog = self.skill._watchdog
+        self.assertIsInstance(real_watchdog, ListenerWatchdog)
+        self.assertTrue(real_watchdog.is_alive())
+        # Use a watchdog that isn't running so the state is predictable
+        self.skill._watchdog = ListenerWatchdog(lambda _: False)
+        self.skill._watchdog.failures = self.skill._watchdog.failure_threshold
+        self.skill.handle_skip_wake_words(message)
+        self.skill.speak_dialog.assert_called_once_with(
+            "error_listener_unavailable")
+        self.skill.speak_dialog.reset_mock()
+        self.skill.handle_use_wake_words(message)
+        self.skill.speak_dialog.assert_called_once_with(
+            "error_listener_unavailable")
+        self.skill.speak_dialog.reset_mock()
+        self.skill.handle_change_ww(Message("test",
+                                            {"rx_wakeword": "hey neon"}))
+        self.skill.speak_dialog.assert_called_once_with(
+            "error_listener_unavailable")
+
+        # A successful request marks the listener as available
+        self.assertIsNotNone(self.skill.ww_enabled)
+        self.assertFalse(self.skill._watchdog.is_down)
+        self.skill._watchdog = real_watchdog
+
+    def test_flow_time_budget(self):
+        reports = list()
+        self.skill.bus.on("neon.device_controls.flow_report",
+                          lambda m: reports.append(m.data))
+        asked = list()
+
+        def ask_yesno(prompt, data=None):
+            asked.append(prompt)
+            # Simulate a user who walks away until the budget runs out
+            self.assertEqual(self.skill._current_budget().name,
+                             "change_wake_word")
+            self.skill._current_budget().total = 0
+            return None
+
+        wake_word_config = {"hey_mycroft": {"active": True},
+                            "hey_neon": {"active": True},
+                            "hey_ezra": {"active": True}}
+
+        def _handle_get_ww(message):
+            self.skill.bus.emit(message.reply("neon.wake_words",
+                                              wake_word_config))
+
+        self.skill.bus.remove_all_listeners("neon.get_wake_words")
+        self.skill.bus.on("neon.get_wake_words", _handle_get_ww)
+        real_ask_yesno = self.skill.ask_yesno
+        self.skill.ask_yesno = ask_yesno
+        self.skill.handle_change_ww(Message("test",
+                                            {"rx_wakeword": "hey neon"}))
+        self.assertEqual(asked, ["ask_disable_ww"])
+        self.skill.speak_dialog.assert_called_with("error_flow_timed_out")
+        self.assertIsNone(self.skill._current_budget())
+        self.assertEqual(reports[-1]["flow"], "change_wake_word")
+        self.assertTrue(reports[-1]["expired"])
+        self.assertIn("get_wake_words", reports[-1]["steps"])
+        self.skill.ask_yesno = real_ask_yesno
+
+        # Expired budgets don't wait for a user response
+        with self.skill.time_budget("test", Message("test")) as budget:
+            budget.total = 0
+            self.assertIsNone(self.skill.get_response("ask_start_skipping"))
+            # Nor do budgets without time for a full attempt
+            budget.total = budget.elapsed + \
+                self.skill._get_response_timeout - 1
+            self.assertIsNone(self.skill.get_response("ask_start_skipping"))
+        self.skill.speak.assert_not_called()
+
+        # Listener operations queued when the budget runs out are cancelled
+        from skill_device_controls.util.scheduler import ControlPriority
+        blocking = Event()
+        self.skill._scheduler.submit(ControlPriority.WAKE_WORD, "block",
+                                     lambda: blocking.wait(5))
+        enabled = list()
+        real_enable = self.skill.ww_backend.enable_wake_word
+        self.skill.ww_backend.enable_wake_word = \
+            lambda ww, _: enabled.append(ww) or True
+        with self.skill.time_budget("test", Message("test")) as budget:
+            budget.total = 0
+            self.assertFalse(self.skill._enable_wake_word("hey_neon",
+                                                          Message("test")))
+        blocking.set()
+        self.skill._scheduler.run(ControlPriority.TOGGLE, "sync", lambda: 0)
+        self.assertEqual(enabled, [])
+        self.skill.ww_backend.enable_wake_word = real_enable
+        self.skill.bus.remove_all_listeners("neon.get_wake_words")
+        self.skill.bus.remove_all_listeners("neon.device_controls.flow_report")
+
+    def test_fan_out_ww_state(self):
+        devices = ["kiosk_1", "kiosk_2", "kiosk_3"]
+        message = Message("valid_intent", {"neon": "Neon", "ww": "wake words",
+                                           "start_sww": "begin"},
+                          {"target_devices": devices})
+        states = dict()
+
+        def on_wake_words_state(msg):
+            device = msg.context["destination"]
+            if device == "kiosk_3":
+                return
+            states[device] = msg.data["enabled"]
+            self.skill.bus.emit(msg.response())
+
+        real_ask_yesno = self.skill.ask_yesno
+        self.skill.ask_yesno = Mock(return_value="yes")
+        self.skill.settings["fan_out_timeout"] = 1
+        self.skill.bus.on("neon.wake_words_state", on_wake_words_state)
+
+        self.skill.handle_skip_wake_words(message)
+        self.skill.ask_yesno.assert_called_once_with("ask_start_skipping")
+        self.assertEqual(states, {"kiosk_1": False, "kiosk_2": False})
+        self.skill.speak_dialog.assert_called_once_with(
+            "error_fan_out_partial", {"succeeded": 2, "total": 3,
+                                      "failed": "kiosk_3"})
+
+        message.context["target_devices"] = devices[:2]
+        self.skill.speak_dialog.reset_mock()
+        self.skill.handle_use_wake_words(message)
+        self.assertEqual(states, {"kiosk_1": True, "kiosk_2": True})
+        self.skill.speak_dialog.assert_called_once_with(
+            "confirm_fan_out_complete", {"total": 2})
+
+        self.skill.ask_yesno = real_ask_yesno
+        self.skill.settings.pop("fan_out_timeout")
+
+    def test_do_exit_shutdown(self):
+        from skill_device_controls import SystemCommand
+        do_exit_shutdown = type(self.skill)._do_exit_shutdown
+        for action in SystemCommand:
+            emitted = list()
+            self.skill.bus.once(action.event, emitted.append)
+            do_exit_shutdown(self.skill, action)
+            self.skill.speak_dialog.assert_called_with(action.dialog,
+                                                       private=True,
+                                                       wait=True)
+            self.assertEqual(len(emitted), 1)
+
+    def test_fan_out_exit_shutdown(self):
+        devices = ["kiosk_1", "kiosk_2"]
+        message = Message("valid_intent", {"restart": "restart"},
+                          {"target_devices": devices})
+        received = list()
+
+        def on_reboot(msg):
+            received.append(msg.context["destination"])
+
+        self.skill.bus.on("system.reboot", on_reboot)
+        real_get_response = self.skill.get_response
+        self.skill.get_response = Mock(return_value=True)
+        self.skill.handle_exit_shutdown_intent(message)
+        self.assertEqual(self.skill.get_response.call_args[0][0],
+                         "ask_fan_out_exit_shutdown")
+        self.assertEqual(self.skill.get_response.call_args[0][1]["count"], 2)
+        self.skill._do_exit_shutdown.assert_not_called()
+        self.assertEqual(set(received), set(devices))
+        self.skill.speak_dialog.assert_called_with("confirm_fan_out_complete",
+                                                   {"total": 2})
+        self.skill.bus.remove("system.reboot", on_reboot)
+        self.skill.get_response = real_get_response
+
+    def test_early_dispatch(self):
+        from skill_device_controls import PARTIAL_UTTERANCE_EVENT
+        from skill_device_controls.util.early_dispatch import EarlyDispatcher
+        from fake_stt import FakePartialStream
+
+        self.skill._early_dispatch = EarlyDispatcher(
+            self.skill._load_power_intents, self.skill._prepare_confirmation)
+        self.skill.bus.on(PARTIAL_UTTERANCE_EVENT,
+                          self.skill._on_partial_utterance)
+        self.skill.bus.on("recognizer_loop:utterance",
+                          self.skill._on_final_utterance)
+        stream = FakePartialStream(self.skill.bus, session_id="early")
+        context = {"session": {"session_id": "early"}}
+        real_get_response = self.skill.get_response
+        self.skill.get_response = Mock(return_value="yes")
+
+        # Confirmation is prepared before the utterance ends and committed
+        stream.stream("please shut down this device", emit_final=False)
+        prepared = self.skill._early_dispatch._prepared["early"]
+        self.assertEqual(prepared.label, "shutdown")
+        number = prepared.data
+        self.assertEqual(prepared.lang, "en-us")
+        stream.stream("please shut down this device")
+        self.skill.handle_shutdown_intent(Message("shutdown.intent", {},
+                                                  context))
+        args = self.skill.get_response.call_args[0]
+        self.assertEqual(args[0], "ask_exit_shutdown")
+        self.assertEqual(args[1], {"action": "shut down this device",
+                                   "number": number})
+        self.assertTrue(args[2](number))
+        self.assertEqual(self.skill._do_exit_shutdown.call_args[0][0].name,
+                         "SHUTDOWN")
+        self.assertEqual(self.skill._early_dispatch._prepared, dict())
+
+        # Prepared work is discarded when the final transcript differs
+        stream.stream("please exit", final="please end solo mode")
+        self.assertEqual(self.skill._early_dispatch._prepared, dict())
+        self.skill.handle_exit_intent(Message("exit.intent", {}, context))
+        self.assertEqual(self.skill.get_response.call_args[0][0],
+                         "ask_exit_shutdown")
+
+        # Prepared work is not used for a different action
+        stream.stream("restart", emit_final=False)
+        self.skill.handle_exit_intent(Message("exit.intent", {}, context))
+        self.assertEqual(self.skill.get_response.call_args[0][0],
+                         "ask_exit_shutdown")
+
+        self.skill.bus.remove(PARTIAL_UTTERANCE_EVENT,
+                              self.skill._on_partial_utterance)
+        self.skill.bus.remove("recognizer_loop:utterance",
+                              self.skill._on_final_utterance)
+        self.skill._early_dispatch = None
+        self.skill.get_response = real_get_response
+
+    def test_memory_footprint(self):
+        import tracemalloc
+        from os import getenv
+        from neon_minerva.skill import get_skill_object
+        from ovos_plugin_manager.skills import find_skill_plugins
+
+        # Per-instance budgets in bytes. `total` is process-wide, so includes
+        # allocations made by shared libraries while loading the skill
+        load_budget = 4 * 1024 * 1024
+        local_budget = 64 * 1024
+
+        entrypoint = getenv("TEST_SKILL_ENTRYPOINT") or \
+            list(find_skill_plugins().keys())[0]
+        tracemalloc.start()
+        skill = get_skill_object(skill_entrypoint=entrypoint,
+                                 skill_id="memory_test.test", bus=self.bus)
+        skill.speak_dialog = Mock()
+        skill.add_event("mycroft.skill.handler.complete",
+                        skill._on_handler_complete)
+        handled = Event()
+        self.bus.once("mycroft.skill.handler.complete",
+                      lambda _: handled.set())
+        self.bus.emit(Message(f"{skill.skill_id}:ShowDebugIntent",
+                              {"enable": "enable"}))
+        self.assertTrue(handled.wait(5))
+        report = self.bus.wait_for_response(
+            Message("neon.device_controls.memory_report",
+                    {"skill_id": skill.skill_id}))
+        skill.default_shutdown()
+        tracemalloc.stop()
+        self.assertTrue(report.data["enabled"])
+        samples = report.data["samples"]
+        self.assertLess(samples["load"]["total"], load_budget)
+        self.assertLess(samples["load"]["local"], local_budget)
+        self.assertLess(samples["handle_show_debug"]["local"], local_budget)
+
+        from sys import intern
+        vocab = self.skill.voc_list("neon")
+        self.assertTrue(vocab)
+        for phrase in vocab:
+            self.assertIs(phrase, intern(phrase))
+
+    def test_load_lang_data(self):
+        from unittest.mock import PropertyMock, patch
+        real_loaded = self.skill._loaded_langs
+        self.skill._loaded_langs = set()
+        registered = list()
+        intents = list()
+
+        def _on_vocab(msg):
+            registered.append(msg.data["lang"])
+
+        def _on_intent(msg):
+            intents.append((msg.data["name"].split(":")[-1],
+                            msg.data["lang"]))
+
+        self.bus.on("register_vocab", _on_vocab)
+        self.bus.on("padatious:register_intent", _on_intent)
+        with patch.object(type(self.skill), "native_langs",
+                          new_callable=PropertyMock,
+                          return_value=["en-us", "uk-ua"]):
+            # Only the core language is loaded at startup by default
+            self.skill.load_data_files()
+            self.assertEqual(self.skill._loaded_langs, {"en-us"})
+            self.assertEqual(set(registered), {"en-us"})
+            self.assertIn("exit.intent", self.skill._intent_files)
+            self.assertEqual(intents, [(i, "en-us") for i in
+                                       self.skill._intent_files])
+            sleep(0.5)
+            self.assertEqual(self.skill._loaded_langs, {"en-us"})
+
+            # A request in an unloaded language loads all of its resources
+            registered.clear()
+            intents.clear()
+            self.bus.emit(Message("recognizer_loop:utterance",
+                                  {"utterances": ["вийти"], "lang": "uk-ua"}))
+            self.assertEqual(self.skill._loaded_langs, {"en-us", "uk-ua"})
+            self.assertEqual(set(registered), {"uk-ua"})
+            self.assertEqual(intents, [(i, "uk-ua") for i in
+                                       self.skill._intent_files])
+
+            # Unsupported languages are ignored
+            self.bus.emit(Message("recognizer_loop:utterance",
+                                  {"utterances": ["sortir"], "lang": "fr-fr"}))
+            self.assertNotIn("fr-fr", self.skill._loaded_langs)
+
+            # Other languages may be loaded in the background at startup
+            self.skill._loaded_langs = set()
+            self.skill.settings["preload_langs"] = True
+            self.skill.load_data_files()
+            for _ in range(50):
+                if "uk-ua" in self.skill._loaded_langs:
+                    break
+                sleep(0.1)
+            self.assertEqual(self.skill._loaded_langs, {"en-us", "uk-ua"})
+            self.skill.settings.pop("preload_langs")
+
+        self.assertIn(self.skill.core_lang, self.skill._lang_cache.pinned)
+        self.bus.remove("register_vocab", _on_vocab)
+        self.bus.remove("padatious:register_intent", _on_intent)
+        self.skill._loaded_langs = real_loaded
+
+    def test_ww_audit_log(self):
+        from skill_device_controls.util.audit import AuditAction
+        self.skill._audit.flush()
+        before = len(self.skill._audit.recent(1000))
+        self.skill._enable_wake_word("hey_neon", Message("test"))
+        self.skill._set_ww_state(False, Message("test"))
+        report = self.bus.wait_for_response(
+            Message("neon.device_controls.ww_audit",
+                    {"limit": 2, "skill_id": self.skill.skill_id}))
+        entries = report.data["entries"]
+        self.assertEqual(len(self.skill._audit.recent(1000)), before + 2)
+        self.assertEqual([e["action"] for e in entries],
+                         ["enable_wake_word", "skip_wake_words"])
+        self.assertEqual(entries[0]["wake_word"], "hey_neon")
+        for entry in entries:
+            self.assertIsInstance(entry["success"], bool)
+            self.assertGreaterEqual(entry["latency"], 0)
+
+        # Requests for another skill are ignored
+        self.assertIsNone(self.bus.wait_for_response(
+            Message("neon.device_controls.ww_audit", {"skill_id": "other"}),
+            timeout=0.5))
+        self.assertEqual(AuditAction[entries[0]["action"].upper()],
+                         AuditAction.ENABLE_WAKE_WORD)
+
+    def test_ww_snapshot(self):
+        from skill_device_controls.util.ww_snapshot import SnapshotStore
+        store = SnapshotStore(self.skill._ww_snapshots.path)
+        saved = {"hey_neon": {"active": False},
+                 "hey_mycroft": {"active": True}}
+        store.save(saved, not WW_STATE)
+        listener_ww = {"hey_neon": {"active": True, "module": "ovos-ww"}}
+        self.skill.settings["ww_reconcile_interval"] = 0.1
+        self.skill.bus.remove_all_listeners("neon.get_wake_words")
+
+        def _handle_get_ww(message):
+            self.skill.bus.emit(message.reply("neon.wake_words",
+                                              listener_ww))
+
+        # Saved catalog and state are used until the listener responds
+        self.skill._load_ww_snapshot()
+        self.assertTrue(self.skill._ww_provisional)
+        self.assertEqual(self.skill.wakewords, saved)
+        self.assertEqual(self.skill.ww_enabled, not WW_STATE)
+        self.skill.wakewords["hey_neon"]["active"] = True
+        self.assertEqual(self.skill.wakewords, saved)
+
+        # Listener catalog replaces the saved one once available
+        self.skill.bus.on("neon.get_wake_words", _handle_get_ww)
+        self.skill._ww_reconcile_wakeup.set()
+        timeout = time() + 10
+        while self.skill._ww_provisional and time() < timeout:
+            sleep(0.1)
+        self.assertFalse(self.skill._ww_provisional)
+        self.assertEqual(self.skill.wakewords, listener_ww)
+        self.assertEqual(self.skill.ww_enabled, WW_STATE)
+        snapshot = store.load()
+        self.assertEqual(snapshot.wake_words, {"hey_neon": {"active": True}})
+        self.assertEqual(snapshot.enabled, WW_STATE)
+        self.skill.bus.remove("neon.get_wake_words", _handle_get_ww)
+        self.skill.settings.pop("ww_reconcile_interval")
+
+    def test_match_wake_word(self):
+        available_ww = {"hey_neon": {"active": True},
+                        "hey_mycroft": {"active": False}}
+        real_voc_match = self.skill.voc_match
+        self.skill.voc_match = Mock(return_value=False)
+
+        # Wake word is extracted from a greedy regex capture
+        message = Message("test", {"rx_wakeword": "to hey mycroft please",
+                                   "utterance": "change my wake word to hey "
+                                                "mycroft please"})
+        self.assertEqual(self.skill._match_wake_word(
+            message.data["rx_wakeword"], available_ww, message),
+            "hey_mycroft")
+
+        # Alternate transcriptions are searched in order
+        message = Message("test", {"utterance": "change my wake word",
+                                   "utterances": ["change my wake word",
+                                                  "change to hey neon"]})
+        self.assertEqual(self.skill._match_wake_word(
+            message.data["utterance"], available_ww, message), "hey_neon")
+        self.skill.voc_match.assert_not_called()
+
+        # Known wake words are still checked when nothing is extracted
+        message = Message("test", {"utterance": "change to mycroft"})
+        self.assertIsNone(self.skill._match_wake_word(
+            message.data["utterance"], available_ww, message))
+        self.skill.voc_match.assert_called()
+        self.skill.voc_match = real_voc_match
+        self.assertEqual(self.skill._match_wake_word(
+            message.data["utterance"], available_ww, message), "hey_mycroft")
+
+    def test_solo_governor(self):
+        from skill_device_controls.util.solo import SoloGovernor
+        global WW_STATE
+        WW_STATE = True
+        states = list()
+
+        def on_wake_words_state(msg):
+            global WW_STATE
+            WW_STATE = msg.data["enabled"]
+            states.append(WW_STATE)
+            self.skill.bus.emit(msg.response())
+
+        ended = list()
+        self.skill.bus.on("neon.wake_words_state", on_wake_words_state)
+        self.skill.bus.on("neon.device_controls.solo_ended",
+                          lambda m: ended.append(m.data))
+        self.skill._solo = SoloGovernor(self.skill._end_solo_mode,
+                                        check_interval=60)
+        self.skill.add_event("neon.device_controls.solo_report",
+                             self.skill._handle_solo_report)
+        real_ask_yesno = self.skill.ask_yesno
+        self.skill.ask_yesno = Mock(return_value="yes")
+
+        # Confirmed solo mode starts a governed session
+        self.skill.handle_skip_wake_words(Message("valid_intent",
+                                                  {"neon": "Neon"}))
+        self.assertTrue(self.skill._solo.active)
+
+        # Reaching a limit requires wake words again and reports it
+        self.skill._solo.stop("load")
+        self.skill._end_solo_mode("load")
+        self.assertEqual(states, [False, True])
+        self.skill.speak_dialog.assert_called_with(
+            "confirm_solo_overload_ended", private=True)
+        self.assertEqual(ended[0]["reason"], "load")
+        self.assertEqual(ended[0]["sessions"], 1)
+        report = self.bus.wait_for_response(
+            Message("neon.device_controls.solo_report",
+                    {"skill_id": self.skill.skill_id}))
+        self.assertFalse(report.data["active"])
+
+        # Requiring wake words by voice ends the session
+        WW_STATE = True
+        self.skill.handle_skip_wake_words(Message("valid_intent",
+                                                  {"neon": "Neon"}))
+        self.skill.handle_use_wake_words(Message("valid_intent", {}))
+        self.assertFalse(self.skill._solo.active)
+        self.assertEqual(self.skill._solo.last_session["reason"], "user")
+
+        self.skill._solo.shutdown()
+        self.skill._solo = None
+        self.skill.remove_event("neon.device_controls.solo_report")
+        self.skill.ask_yesno = real_ask_yesno
+        self.skill.bus.remove("neon.wake_words_state", on_wake_words_state)
+
+    def test_scheduled_rules(self):
+        from time import monotonic
+        from skill_device_controls.util.rules import CronRule
+
+        def _request(msg_type, data):
+            data["skill_id"] = self.skill.skill_id
+            return self.bus.wait_for_response(
+                Message(f"neon.device_controls.{msg_type}", data)).data
+
+        rule = "0 3 * * * restart idle"
+        self.assertEqual(_request("add_rule", {"rule": rule}),
+                         {"added": True, "rule": rule})
+        self.assertFalse(_request("add_rule", {"rule": rule})["added"])
+        self.assertIn("error", _request("add_rule", {"rule": "0 3 * * *"}))
+        self.assertEqual(_request("get_rules", {})["rules"], [rule])
+        self.assertEqual(self.skill._rule_store.load(),
+                         [CronRule.parse(rule)])
+
+        # Idle rules only run without recent user activity
+        self.skill._last_activity = monotonic()
+        self.skill._run_rule(CronRule.parse(rule))
+        self.skill._do_exit_shutdown.assert_not_called()
+        self.skill._last_activity = monotonic() - 601
+        self.skill._run_rule(CronRule.parse(rule))
+        self.assertEqual(self.skill._do_exit_shutdown.call_args[0][0].name,
+                         "RESTART")
+        self.bus.emit(Message("recognizer_loop:utterance",
+                              {"utterances": ["hello"]}))
+        self.assertFalse(self.skill._is_idle())
+
+        # Wake word rules use the wake word state path
+        states = list()
+
+        def on_wake_words_state(msg):
+            states.append(msg.data["enabled"])
+            self.skill.bus.emit(msg.response())
+
+        self.skill.bus.on("neon.wake_words_state", on_wake_words_state)
+        self.skill._run_rule(CronRule.parse("0 9 * * 1-5 skip_wake_words"))
+        self.skill._run_rule(CronRule.parse("0 17 * * 1-5 "
+                                            "require_wake_words"))
+        self.assertEqual(states, [False, True])
+        self.skill.bus.remove("neon.wake_words_state", on_wake_words_state)
+
+        self.assertTrue(_request("remove_rule", {"rule": rule})["removed"])
+        self.assertFalse(_request("remove_rule", {"rule": rule})["removed"])
+        self.assertEqual(self.skill._rule_store.load(), list())
+
+    def test_deferred_power_action(self):
+        from skill_device_controls import SystemCommand
+        from skill_device_controls.util.activity import ActivityMonitor
+        self.skill._activity = ActivityMonitor(self.skill.skill_id)
+        self.skill.settings["power_quiet_seconds"] = 0.2
+        self.skill.settings["power_max_deferral"] = 5
+
+        # A quiet device runs the action right away
+        sleep(0.2)
+        self.skill._run_power_action(SystemCommand.RESTART)
+        self.skill._do_exit_shutdown.assert_called_once()
+        self.skill.speak_dialog.assert_not_called()
+        self.skill._do_exit_shutdown.reset_mock()
+
+        # A busy device waits for a quiet window and reports the wait
+        self.skill._activity.on_audio_output_start()
+        self.skill._run_power_action(SystemCommand.SHUTDOWN)
+        self.skill.speak_dialog.assert_called_once()
+        dialog, data = self.skill.speak_dialog.call_args[0]
+        self.assertEqual(dialog, "confirm_power_deferred")
+        self.assertEqual(data["action"], SystemCommand.SHUTDOWN.value)
+        self.assertGreater(data["seconds"], 0)
+        sleep(0.3)
+        self.skill._do_exit_shutdown.assert_not_called()
+        self.skill._activity.on_audio_output_end()
+        sleep(0.5)
+        self.skill._do_exit_shutdown.assert_called_once_with(
+            SystemCommand.SHUTDOWN)
+
+        # The maximum deferral runs the action even while busy
+        self.skill._do_exit_shutdown.reset_mock()
+        self.skill.settings["power_max_deferral"] = 0.2
+        self.skill._activity.on_record_begin()
+        self.skill._run_power_action(SystemCommand.EXIT)
+        sleep(0.5)
+        self.skill._do_exit_shutdown.assert_called_once_with(
+            SystemCommand.EXIT)
+
+        self.skill._activity = None
+        for setting in ("power_quiet_seconds", "power_max_deferral"):
+            self.skill.settings.pop(setting)
+
     def test_enable_ww(self):
         pass
         # TODO
@@ -0,0 +1,117 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+Stress tests that run overlapping handler calls against one skill and a
+fake listener, then check invariants over every listener state change.
+"""
+
+import unittest
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from os import environ
+from random import Random
+from unittest.mock import patch
+
+from ovos_bus_client.message import Message
+
+from simulation_host import SimulationHost, isolate_environment
+
+WAKE_WORDS = {"hey_neon": {"active": True},
+              "hey_mycroft": {"active": True},
+              "ok_computer": {"active": False},
+              "hey_jarvis": {"active": False}}
+
+
+class TestConcurrentHandlers(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.environ = patch.dict(environ)
+        cls.environ.start()
+        isolate_environment()
+        cls.host = SimulationHost()
+        # Widen the window between reading and changing wake words
+        cls.host.listener.latency = 0.002
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.host.shutdown()
+        cls.environ.stop()
+
+    def setUp(self):
+        self.host.run({"wake_words": WAKE_WORDS})
+        self.host.skill.answers = deque(["yes"] * 10000)
+
+    def _fire(self, calls: list, threads: int = 8, timeout: float = 60):
+        """
+        Run handler calls concurrently and fail on errors or deadlocks.
+        :param calls: list of (handler, data) to call
+        """
+        def _call(handler, data):
+            getattr(self.host.skill, handler)(
+                Message(f"{self.host.skill_id}:{handler}", data))
+
+        with ThreadPoolExecutor(threads) as executor:
+            futures = [executor.submit(_call, *call) for call in calls]
+            done, pending = wait(futures, timeout)
+            self.assertEqual(pending, set(), "Handlers deadlocked")
+        errors = [f.exception() for f in done if f.exception()]
+        self.assertEqual(errors, list())
+
+    def _assert_invariants(self):
+        history = self.host.listener.history
+        self.assertTrue(history)
+        races = [(i, active) for i, (enabled, active) in enumerate(history)
+                 if enabled and not active]
+        self.assertEqual(races, list(),
+                         "No wake word active while wake words required")
+
+    def test_change_wake_word_races(self):
+        rng = Random(0)
+        names = [ww.replace("_", " ") for ww in WAKE_WORDS]
+        calls = [("handle_change_ww", {"rx_wakeword": rng.choice(names)})
+                 for _ in range(200)]
+        self._fire(calls)
+        self._assert_invariants()
+        self.assertTrue(self.host.listener.active)
+
+    def test_mixed_handler_races(self):
+        rng = Random(1)
+        names = [ww.replace("_", " ") for ww in WAKE_WORDS]
+        handlers = [
+            lambda: ("handle_change_ww", {"rx_wakeword": rng.choice(names)}),
+            lambda: ("handle_skip_wake_words", {"neon": "neon"}),
+            lambda: ("handle_use_wake_words", {}),
+        ]
+        calls = [rng.choice(handlers)() for _ in range(300)]
+        self._fire(calls, threads=16)
+        self._assert_invariants()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,897 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import unittest
+
+from time import sleep
+
+
+class TestFanOut(unittest.TestCase):
+    def test_get_target_devices(self):
+        from skill_device_controls.util.fanout import get_target_devices
+        self.assertEqual(get_target_devices(dict()), [])
+        self.assertEqual(get_target_devices({"target_devices": "kiosk"}),
+                         ["kiosk"])
+        self.assertEqual(get_target_devices(
+            {"target_devices": ["b", "a", "b", ""]}), ["b", "a"])
+
+    def test_fan_out(self):
+        from skill_device_controls.util.fanout import fan_out, DeviceStatus
+
+        def _job(device, timeout):
+            self.assertLessEqual(timeout, 0.5)
+            if device == "slow":
+                sleep(3)
+            elif device == "error":
+                raise RuntimeError("device error")
+            elif device == "timeout":
+                raise TimeoutError(device)
+            return device != "failed"
+
+        devices = ["ok", "failed", "error", "timeout", "slow"]
+        summary = fan_out(devices, _job, timeout=0.5)
+        self.assertEqual([r.device for r in summary.results], devices)
+        self.assertEqual([r.status for r in summary.results],
+                         [DeviceStatus.SUCCESS, DeviceStatus.FAILED,
+                          DeviceStatus.FAILED, DeviceStatus.TIMEOUT,
+                          DeviceStatus.TIMEOUT])
+        self.assertEqual(summary.succeeded, ["ok"])
+        self.assertFalse(summary.ok)
+        self.assertTrue(fan_out([], _job, 1).ok)
+
+        # Devices waiting for a worker still get their full timeout
+        def _slow_job(device, timeout):
+            self.assertEqual(timeout, 0.3)
+            sleep(0.2)
+            return True
+
+        summary = fan_out([str(i) for i in range(4)], _slow_job, timeout=0.3,
+                          max_workers=2)
+        self.assertTrue(summary.ok)
+
+
+class TestWakeWordBackend(unittest.TestCase):
+    def _test_backend(self, backend, listener):
+        self.assertTrue(backend.get_state())
+        self.assertTrue(backend.set_state(False))
+        self.assertFalse(backend.get_state())
+        self.assertFalse(listener.enabled)
+        self.assertEqual({ww: c["active"] for ww, c in
+                          backend.get_wake_words().items()},
+                         {ww: c["active"] for ww, c in
+                          listener.wake_words.items()})
+        self.assertTrue(backend.enable_wake_word("hey_mycroft"))
+        self.assertTrue(listener.wake_words["hey_mycroft"]["active"])
+        self.assertTrue(backend.disable_wake_word("hey_neon"))
+        self.assertFalse(listener.wake_words["hey_neon"]["active"])
+        self.assertFalse(backend.enable_wake_word("invalid"))
+        backend.prepare_wake_word("hey_neon", True)
+        self.assertEqual(listener.prepared, {"hey_neon": True})
+        backend.cancel_prepare_wake_word("hey_neon")
+        self.assertEqual(listener.prepared, dict())
+        backend.prepare_wake_word("hey_neon", True)
+        self.assertTrue(backend.enable_wake_word("hey_neon"))
+        self.assertEqual(listener.prepared, dict())
+
+    def test_bus_backend(self):
+        from ovos_utils.fakebus import FakeBus
+        from fake_listener import FakeListener
+        from skill_device_controls.util.ww_backend import BusWakeWordBackend
+        bus = FakeBus()
+        listener = FakeListener()
+        listener.bind(bus)
+        self._test_backend(BusWakeWordBackend(bus), listener)
+        listener.unbind()
+
+    def test_bus_backend_projection(self):
+        from ovos_utils.fakebus import FakeBus
+        from fake_listener import FakeListener
+        from skill_device_controls.util.ww_backend import BusWakeWordBackend
+        bus = FakeBus()
+        listener = FakeListener()
+        listener.bind(bus)
+        backend = BusWakeWordBackend(bus)
+        replies = list()
+        bus.on("neon.wake_words", lambda m: replies.append(m.data))
+
+        expected = {"hey_neon": {"active": True},
+                    "hey_mycroft": {"active": False}}
+        self.assertEqual(backend.get_wake_words(), expected)
+        self.assertEqual(replies[-1]["wake_words"], expected)
+        version = replies[-1]["version"]
+
+        # Unchanged catalog is served from cache
+        self.assertEqual(backend.get_wake_words(), expected)
+        self.assertEqual(replies[-1], {"not_modified": True,
+                                       "version": version})
+
+        # Changed catalog is sent again with a new version
+        listener.enable_wake_word("hey_mycroft")
+        expected["hey_mycroft"]["active"] = True
+        self.assertEqual(backend.get_wake_words(), expected)
+        self.assertNotEqual(replies[-1]["version"], version)
+
+        # Out of sync cache is refreshed
+        backend._catalog = None
+        self.assertEqual(backend.get_wake_words(), expected)
+        self.assertIn("wake_words", replies[-1])
+
+        # Legacy listener replies with the full catalog
+        listener.supports_projection = False
+        self.assertEqual(backend.get_wake_words(), listener.wake_words)
+        self.assertIsNone(backend._catalog_version)
+        listener.unbind()
+
+    def test_direct_backend(self):
+        from fake_listener import FakeListener
+        from skill_device_controls.util.ww_backend import \
+            DirectWakeWordBackend
+        listener = FakeListener()
+        self._test_backend(DirectWakeWordBackend(listener), listener)
+
+    def test_direct_backend_errors(self):
+        from unittest.mock import Mock
+        from skill_device_controls.util.ww_backend import \
+            DirectWakeWordBackend
+        listener = Mock()
+        for method in ("get_wake_words_state", "set_wake_words_state",
+                       "get_wake_words", "enable_wake_word",
+                       "disable_wake_word"):
+            getattr(listener, method).side_effect = RuntimeError(method)
+        backend = DirectWakeWordBackend(listener)
+        self.assertIsNone(backend.get_state())
+        self.assertFalse(backend.ping())
+        self.assertFalse(backend.set_state(True))
+        self.assertIsNone(backend.get_wake_words())
+        self.assertFalse(backend.enable_wake_word("hey_neon"))
+        self.assertFalse(backend.disable_wake_word("hey_neon"))
+
+    def test_get_backend(self):
+        from fake_listener import FakeListener
+        from skill_device_controls.util.ww_backend import get_backend, \
+            register_listener, BusWakeWordBackend, DirectWakeWordBackend
+        self.assertIsInstance(get_backend(None), BusWakeWordBackend)
+        self.assertIsInstance(get_backend(None, "direct"), BusWakeWordBackend)
+        register_listener(FakeListener())
+        self.assertIsInstance(get_backend(None), DirectWakeWordBackend)
+        self.assertIsInstance(get_backend(None, "bus"), BusWakeWordBackend)
+        register_listener(None)
+
+
+class TestListenerWatchdog(unittest.TestCase):
+    def test_check(self):
+        from skill_device_controls.util.watchdog import ListenerWatchdog
+        responding = True
+        watchdog = ListenerWatchdog(lambda _: responding,
+                                    failure_threshold=2)
+        self.assertIsNone(watchdog.alive)
+        self.assertFalse(watchdog.is_down)
+        self.assertTrue(watchdog.check())
+        self.assertTrue(watchdog.alive)
+        self.assertIsInstance(watchdog.latency, float)
+
+        responding = False
+        self.assertFalse(watchdog.check())
+        self.assertFalse(watchdog.alive)
+        self.assertFalse(watchdog.is_down)
+        self.assertFalse(watchdog.check())
+        self.assertTrue(watchdog.is_down)
+
+        watchdog.report(True, 0.1)
+        self.assertTrue(watchdog.alive)
+        self.assertFalse(watchdog.is_down)
+
+    def test_run(self):
+        from threading import Event
+        from skill_device_controls.util.watchdog import ListenerWatchdog
+        pinged = Event()
+
+        def _ping(timeout):
+            pinged.set()
+            return False
+
+        watchdog = ListenerWatchdog(_ping, interval=60, min_interval=0.1)
+        watchdog.start()
+        self.assertTrue(pinged.wait(1))
+        self.assertEqual(watchdog.failures, 1)
+        # Failed pings are retried sooner than the regular interval
+        pinged.clear()
+        self.assertTrue(pinged.wait(1))
+        self.assertEqual(watchdog.failures, 2)
+        self.assertTrue(watchdog.is_down)
+
+        # Idle back-off
+        self.assertGreater(watchdog._next_interval, watchdog.interval)
+        watchdog.notify_activity()
+        self.assertEqual(watchdog._next_interval, watchdog.interval)
+
+        # Activity while the listener is down triggers an early ping
+        watchdog.failures = 10
+        sleep(0.3)
+        pinged.clear()
+        watchdog.notify_activity()
+        self.assertTrue(pinged.wait(1))
+
+        # Reported failures trigger an early ping
+        watchdog._ping = lambda _: pinged.set() or True
+        pinged.clear()
+        watchdog.report(False)
+        self.assertTrue(pinged.wait(1))
+        watchdog.stop()
+        watchdog.join(1)
+        self.assertFalse(watchdog.is_alive())
+        self.assertFalse(watchdog.is_down)
+
+
+class TestControlScheduler(unittest.TestCase):
+    def test_priority_and_supersede(self):
+        from threading import Event
+        from skill_device_controls.util.scheduler import ControlScheduler, \
+            ControlPriority
+        scheduler = ControlScheduler()
+        blocking = Event()
+        executed = list()
+
+        def _op(name):
+            def _run():
+                executed.append(name)
+                return name
+            return _run
+
+        # Block the worker so later operations queue up
+        first = scheduler.submit(ControlPriority.WAKE_WORD, "block",
+                                 lambda: blocking.wait(5))
+        toggle = scheduler.submit(ControlPriority.TOGGLE, "toggle",
+                                  _op("toggle"))
+        old_state = scheduler.submit(ControlPriority.WAKE_WORD, "state",
+                                     _op("skip"))
+        new_state = scheduler.submit(ControlPriority.WAKE_WORD, "state",
+                                     _op("require"))
+        merged = scheduler.submit(ControlPriority.WAKE_WORD, "state",
+                                  _op("merged"), merge=True)
+        self.assertIs(merged, new_state)
+        self.assertTrue(old_state.cancelled)
+
+        blocking.set()
+        self.assertTrue(toggle.done.wait(2))
+        self.assertTrue(first.result)
+        self.assertEqual(new_state.result, "require")
+        self.assertEqual(executed, ["require", "toggle"])
+        self.assertEqual(scheduler.run(ControlPriority.TOGGLE, "toggle",
+                                       _op("run")), "run")
+        scheduler.shutdown()
+
+    def test_preempt(self):
+        from threading import Event, Thread
+        from skill_device_controls.util.scheduler import ControlScheduler, \
+            ControlPriority
+        scheduler = ControlScheduler()
+        blocking = Event()
+        results = dict()
+
+        def _slow_operation():
+            results["slow"] = scheduler.run(ControlPriority.WAKE_WORD, "slow",
+                                            lambda: blocking.wait(5),
+                                            default=False)
+
+        slow = Thread(target=_slow_operation)
+        slow.start()
+        while not scheduler._running:
+            sleep(0.01)
+        pending = scheduler.submit(ControlPriority.WAKE_WORD, "pending",
+                                   lambda: True)
+        self.assertEqual(scheduler.run(ControlPriority.POWER, "power",
+                                       lambda: "power"), "power")
+        slow.join(1)
+        self.assertFalse(slow.is_alive())
+        self.assertFalse(results["slow"])
+        self.assertTrue(pending.cancelled)
+        blocking.set()
+        scheduler.shutdown()
+
+    def test_run_timeout(self):
+        from threading import Event
+        from skill_device_controls.util.scheduler import ControlScheduler, \
+            ControlPriority
+        scheduler = ControlScheduler()
+        blocking = Event()
+        executed = list()
+        scheduler.submit(ControlPriority.WAKE_WORD, "block",
+                         lambda: blocking.wait(5))
+
+        # Operations that do not start before the timeout never run
+        self.assertFalse(scheduler.run(ControlPriority.WAKE_WORD, "queued",
+                                       lambda: executed.append("queued"),
+                                       default=False, timeout=0.1))
+        self.assertNotIn("queued", scheduler._pending)
+        blocking.set()
+        scheduler.run(ControlPriority.TOGGLE, "after", lambda: True)
+        self.assertEqual(executed, [])
+
+        # Operations that started before the timeout report their result
+        self.assertEqual(scheduler.run(ControlPriority.WAKE_WORD, "slow",
+                                       lambda: sleep(0.3) or "done",
+                                       default=False, timeout=0.1), "done")
+        scheduler.shutdown()
+
+
+class TestTimeBudget(unittest.TestCase):
+    def test_time_budget(self):
+        from skill_device_controls.util.budget import TimeBudget
+        budget = TimeBudget("test", 0.2)
+        self.assertFalse(budget.expired)
+        self.assertLessEqual(budget.remaining, 0.2)
+        self.assertEqual(budget.limit_retries(-1, 0.05), 1)
+        budget.total = 100
+        self.assertEqual(budget.limit_retries(-1, 10), 9)
+        self.assertEqual(budget.limit_retries(3, 10), 3)
+        budget.total = 0.2
+        with budget.step("first"):
+            sleep(0.1)
+        with budget.step("first"):
+            sleep(0.1)
+        self.assertTrue(budget.expired)
+        self.assertEqual(budget.remaining, 0)
+        report = budget.report()
+        self.assertEqual(report["flow"], "test")
+        self.assertTrue(report["expired"])
+        self.assertGreaterEqual(report["steps"]["first"], 0.2)
+
+
+class TestEarlyDispatch(unittest.TestCase):
+    intents = {"exit": ["exit"],
+               "shutdown": ["shutdown", "shut down", "power (down|off)"],
+               "restart": ["restart", "reboot"]}
+
+    def test_prefix_automaton(self):
+        from skill_device_controls.util.early_dispatch import PrefixAutomaton
+        automaton = PrefixAutomaton.from_intents(self.intents)
+        self.assertEqual(automaton.match(""), (None, set()))
+        self.assertEqual(automaton.match("please shut"), (None, {"shutdown"}))
+        self.assertEqual(automaton.match("Please shut down!"),
+                         ("shutdown", set()))
+        self.assertEqual(automaton.match("power"), (None, {"shutdown"}))
+        self.assertEqual(automaton.match("power off now"),
+                         ("shutdown", set()))
+        self.assertEqual(automaton.match("powerful"), (None, set()))
+        self.assertEqual(automaton.match("reboot then exit"),
+                         ("restart", set()))
+
+    def test_early_dispatcher(self):
+        from skill_device_controls.util.early_dispatch import EarlyDispatcher
+        prepared = list()
+
+        def _prepare(label, lang):
+            prepared.append(label)
+            return f"{lang}.{label}"
+
+        dispatcher = EarlyDispatcher(lambda _: self.intents, _prepare,
+                                     ttl=0.5)
+        self.assertIsNone(dispatcher.on_partial("a", "please", "en-us"))
+        result = dispatcher.on_partial("a", "please restart", "en-us")
+        self.assertEqual(result.data, "en-us.restart")
+        # Later partials of the same request reuse prepared work
+        dispatcher.on_partial("a", "please restart now", "en-us")
+        self.assertEqual(prepared, ["restart"])
+        dispatcher.on_final("a", "please restart now", "en-us")
+        self.assertIsNone(dispatcher.take("a", "exit"))
+        self.assertIsNone(dispatcher.take("a", "restart"))
+
+        # Other sessions are independent
+        dispatcher.on_partial("a", "exit", "en-us")
+        dispatcher.on_partial("b", "reboot", "en-us")
+        dispatcher.on_final("b", "reboot", "en-us")
+        self.assertEqual(dispatcher.take("a", "exit").label, "exit")
+        self.assertEqual(dispatcher.take("b", "restart").label, "restart")
+
+        # Final transcriptions discard unmatched or untaken work
+        dispatcher.on_partial("a", "exit", "en-us")
+        dispatcher.on_final("a", "exit solo mode", "en-us")
+        dispatcher.on_final("a", "what time is it", "en-us")
+        self.assertIsNone(dispatcher.take("a", "exit"))
+        dispatcher.on_partial("a", "shut down", "en-us")
+        dispatcher.on_final("a", "shut down the lights", "en-us")
+        dispatcher.on_partial("a", "shut", "en-us")
+        self.assertIsNone(dispatcher.take("a", "shutdown"))
+
+        # Prepared work expires
+        dispatcher.on_partial("a", "exit", "en-us")
+        sleep(0.6)
+        self.assertIsNone(dispatcher.take("a", "exit"))
+
+
+class TestMemoryProfiler(unittest.TestCase):
+    def test_memory_profiler(self):
+        import tracemalloc
+        from os.path import dirname
+        from skill_device_controls.util.memory import MemoryProfiler
+        self.assertFalse(tracemalloc.is_tracing())
+        profiler = MemoryProfiler(dirname(__file__))
+        self.assertIsNone(profiler.baseline)
+        self.assertIsNone(profiler.sample("disabled"))
+
+        profiler.start()
+        self.assertTrue(profiler.enabled)
+        self.assertIsInstance(profiler.baseline, int)
+        data = [str(i) * 10 for i in range(1000)]
+        sample = profiler.sample("test")
+        self.assertGreater(sample.local, 10000)
+        self.assertGreater(sample.total, 10000)
+        self.assertEqual(profiler.report()["test"]["local"], sample.local)
+        self.assertEqual(len(data), 1000)
+        profiler.stop()
+        self.assertFalse(tracemalloc.is_tracing())
+
+
+class TestLangCache(unittest.TestCase):
+    def test_lang_cache(self):
+        from skill_device_controls.util.lang_cache import LangCache
+        created = list()
+
+        def _factory(lang):
+            def _create():
+                created.append(lang)
+                return lang.upper()
+            return _create
+
+        cache = LangCache(max_size=2, pinned=["en-us"])
+        self.assertEqual(cache.get("en-us", _factory("en-us")), "EN-US")
+        self.assertEqual(cache.get("en-us", _factory("en-us")), "EN-US")
+        self.assertEqual(created, ["en-us"])
+        cache.get("uk-ua", _factory("uk-ua"))
+        cache.get("de-de", _factory("de-de"))
+        cache.get("uk-ua", _factory("uk-ua"))
+        self.assertEqual(cache.langs, ["en-us", "de-de", "uk-ua"])
+
+        # Least recently used unpinned language is evicted
+        cache.get("fr-fr", _factory("fr-fr"))
+        self.assertNotIn("de-de", cache)
+        self.assertIn("en-us", cache)
+        self.assertEqual(cache.langs, ["en-us", "uk-ua", "fr-fr"])
+        cache.get("de-de", _factory("de-de"))
+        self.assertEqual(created.count("de-de"), 2)
+
+
+
+class TestWakeWordAuditLog(unittest.TestCase):
+    def test_pack_entry(self):
+        from skill_device_controls.util.audit import AuditEntry, \
+            RECORD_SIZE, pack_entry, unpack_entry
+        for success in (True, False, None):
+            entry = AuditEntry(1700000000.5, "enable_wake_word", "hey_neon",
+                               success, 0.25)
+            record = pack_entry(entry)
+            self.assertEqual(len(record), RECORD_SIZE)
+            self.assertEqual(unpack_entry(record), entry)
+
+        # Long names are truncated to fit the record
+        entry = AuditEntry(0, "skip_wake_words", "x" * 40, True, 0)
+        self.assertEqual(unpack_entry(pack_entry(entry)).wake_word, "x" * 32)
+
+    def test_audit_log(self):
+        from os import listdir
+        from os.path import getsize, join
+        from tempfile import TemporaryDirectory
+        from skill_device_controls.util.audit import AuditAction, \
+            RECORD_SIZE, WakeWordAuditLog
+        with TemporaryDirectory() as tmp:
+            path = join(tmp, "audit.bin")
+            log = WakeWordAuditLog(path, max_bytes=4 * RECORD_SIZE)
+            self.assertEqual(log.recent(), list())
+            for i in range(10):
+                log.record(AuditAction.ENABLE_WAKE_WORD, f"ww_{i}", True,
+                           i / 10)
+            log.flush()
+
+            # Log rotates at its size limit, keeping one previous file
+            self.assertEqual(sorted(listdir(tmp)),
+                             ["audit.bin", "audit.bin.1"])
+            self.assertEqual(getsize(path), 2 * RECORD_SIZE)
+            entries = log.recent(5)
+            self.assertEqual([e.wake_word for e in entries],
+                             [f"ww_{i}" for i in range(5, 10)])
+            self.assertAlmostEqual(entries[-1].latency, 0.9, places=5)
+            self.assertEqual(len(log.recent(100)), 6)
+            self.assertEqual(log.recent(0), list())
+
+            log.record(AuditAction.SKIP_WAKE_WORDS, success=False)
+            log.stop()
+            self.assertFalse(log._writer.is_alive())
+            entry = log.recent(1)[0]
+            self.assertEqual(entry.action, "skip_wake_words")
+            self.assertEqual(entry.wake_word, "")
+            self.assertFalse(entry.success)
+
+
+class TestSoloGovernor(unittest.TestCase):
+    def test_time_budget(self):
+        from threading import Event
+        from skill_device_controls.util.solo import SoloGovernor
+        ended = Event()
+        reasons = list()
+
+        def _on_exhausted(reason):
+            reasons.append(reason)
+            ended.set()
+
+        governor = SoloGovernor(_on_exhausted, time_budget=0.2,
+                                check_interval=5)
+        governor.start()
+        self.assertTrue(governor.active)
+        governor.on_utterance()
+        self.assertTrue(ended.wait(2))
+        self.assertEqual(reasons, ["time"])
+        self.assertFalse(governor.active)
+        session = governor.last_session
+        self.assertEqual(session["reason"], "time")
+        self.assertEqual(session["utterances"], 1)
+        self.assertGreaterEqual(session["duration"], 0.2)
+
+        # Utterances outside solo mode are not counted
+        governor.on_utterance()
+        self.assertEqual(governor.report()["utterances"], 0)
+        governor.shutdown()
+
+    def test_stt_budget_and_load(self):
+        from skill_device_controls.util.solo import SoloGovernor
+        load = 0.5
+        governor = SoloGovernor(lambda _: None, stt_budget=0.2, max_load=1,
+                                check_interval=60, get_load=lambda: load)
+        self.assertIsNone(governor.check())
+        governor.start()
+        self.assertIsNone(governor.check())
+        governor.on_record_begin()
+        sleep(0.1)
+        governor.on_record_end()
+        self.assertIsNone(governor.check())
+        self.assertAlmostEqual(governor.stt_seconds, 0.1, delta=0.05)
+
+        # Audio still being recorded counts toward the budget
+        governor.on_record_begin()
+        sleep(0.15)
+        self.assertEqual(governor.check(), "stt")
+        governor.on_record_end()
+        governor.stt_budget = None
+        self.assertIsNone(governor.check())
+        load = 2
+        self.assertEqual(governor.check(), "load")
+        governor.stop("load")
+        governor.shutdown()
+
+    def test_report_savings(self):
+        from skill_device_controls.util.solo import SoloGovernor
+        governor = SoloGovernor(lambda _: None, check_interval=60)
+        governor.start()
+        governor.on_record_begin()
+        sleep(0.1)
+        governor.on_record_end()
+        session = governor.stop("stt")
+        self.assertGreater(session["stt_rate"], 0)
+        self.assertIsNone(governor.stop())
+
+        # STT traffic is saved while wake words are required after a limit
+        sleep(0.1)
+        saved = governor.report()["saved_stt_seconds"]
+        self.assertGreater(saved, 0)
+        governor.start()
+        report = governor.report()
+        self.assertGreaterEqual(report["saved_stt_seconds"], saved)
+        self.assertEqual(report["sessions"], 1)
+
+        # Sessions ended by the user save nothing
+        governor.stop()
+        sleep(0.05)
+        self.assertEqual(governor.report()["saved_stt_seconds"],
+                         report["saved_stt_seconds"])
+        self.assertEqual(governor.report()["sessions"], 2)
+        governor.shutdown()
+
+
+class TestScheduledRules(unittest.TestCase):
+    def test_parse_rule(self):
+        from skill_device_controls.util.rules import CronRule
+        rule = CronRule.parse("0  3 * * *  restart idle")
+        self.assertEqual(str(rule), "0 3 * * * restart idle")
+        self.assertEqual(rule.minutes, 1)
+        self.assertEqual(rule.hours, 1 << 3)
+        self.assertEqual(rule.condition, "idle")
+        rule = CronRule.parse("*/20 9-17 1,15 * 5-7 skip_wake_words")
+        self.assertEqual(rule.minutes, 1 | 1 << 20 | 1 << 40)
+        self.assertEqual(rule.days, 1 << 1 | 1 << 15)
+        # Sunday is stored as 0
+        self.assertEqual(rule.weekdays, 1 | 1 << 5 | 1 << 6)
+        self.assertIsNone(rule.condition)
+        for invalid in ("0 3 * * restart", "60 3 * * * restart",
+                        "0 3 * * * reboot", "0 3 * * * restart busy",
+                        "0 5-3 * * * exit", "*/0 * * * * exit"):
+            with self.assertRaises(ValueError):
+                CronRule.parse(invalid)
+
+    def test_next_run(self):
+        from datetime import datetime
+        from skill_device_controls.util.rules import CronRule
+        # Monday 2024-01-01
+        monday = datetime(2024, 1, 1, 12, 30, 15)
+        rule = CronRule.parse("0 3 * * * restart idle")
+        self.assertEqual(rule.next_run(monday), datetime(2024, 1, 2, 3, 0))
+        self.assertTrue(rule.matches(datetime(2024, 1, 2, 3, 0, 59)))
+        self.assertFalse(rule.matches(datetime(2024, 1, 2, 3, 1)))
+
+        skip = CronRule.parse("0 9 * * 1-5 skip_wake_words")
+        self.assertEqual(skip.next_run(monday), datetime(2024, 1, 2, 9, 0))
+        self.assertEqual(skip.next_run(datetime(2024, 1, 5, 9, 0)),
+                         datetime(2024, 1, 8, 9, 0))
+        self.assertEqual(CronRule.parse("0 9 * * 7 exit").next_run(monday),
+                         datetime(2024, 1, 7, 9, 0))
+        # Restricted day and weekday match either one
+        either = CronRule.parse("0 0 15 * 5 exit")
+        self.assertEqual(either.next_run(monday), datetime(2024, 1, 5, 0, 0))
+        self.assertEqual(either.next_run(datetime(2024, 1, 12, 1)),
+                         datetime(2024, 1, 15, 0, 0))
+        self.assertEqual(CronRule.parse("0 0 29 2 * exit").next_run(monday),
+                         datetime(2024, 2, 29, 0, 0))
+        self.assertIsNone(CronRule.parse("0 0 31 2 * exit").next_run(monday))
+
+    def test_rule_store(self):
+        from os.path import join
+        from tempfile import TemporaryDirectory
+        from skill_device_controls.util.rules import CronRule, RuleStore
+        with TemporaryDirectory() as tmp:
+            store = RuleStore(join(tmp, "rules"))
+            self.assertEqual(store.load(), list())
+            rules = [CronRule.parse("0 3 * * * restart idle"),
+                     CronRule.parse("0 17 * * 1-5 require_wake_words")]
+            store.save(rules)
+            self.assertEqual(store.load(), rules)
+            with open(store.path, "a") as f:
+                f.write("# comment\n\n0 3 * * * reboot\n")
+            self.assertEqual(store.load(), rules)
+
+    def test_rule_scheduler(self):
+        from datetime import datetime, timedelta
+        from skill_device_controls.util.rules import CronRule, RuleScheduler
+        executed = list()
+        now = datetime(2024, 1, 1, 2, 58, 30)
+        scheduler = RuleScheduler(executed.append, now=lambda: now)
+        restart = CronRule.parse("0 3 * * * restart idle")
+        skip = CronRule.parse("0 9 * * 1-5 skip_wake_words")
+        self.assertTrue(scheduler.add(restart))
+        self.assertFalse(scheduler.add(CronRule.parse("0 3 * * * restart "
+                                                      "idle")))
+        self.assertTrue(scheduler.add(skip))
+        self.assertEqual(scheduler.tick(datetime(2024, 1, 1, 2, 59, 0)),
+                         list())
+        self.assertEqual(scheduler.tick(datetime(2024, 1, 1, 3, 0, 1)),
+                         [restart])
+        self.assertEqual(scheduler.tick(datetime(2024, 1, 1, 3, 0, 40)),
+                         list())
+
+        # Rules are rescheduled after running, across wheel turns
+        tick = datetime(2024, 1, 1, 3, 1)
+        ran = list()
+        while tick < datetime(2024, 1, 3, 3, 1):
+            ran.extend((tick, r.action) for r in scheduler.tick(tick))
+            tick += timedelta(minutes=1)
+        self.assertEqual([r[1] for r in ran],
+                         ["skip_wake_words", "restart",
+                          "skip_wake_words", "restart"])
+        self.assertEqual(executed.count(restart), 3)
+
+        # Runs missed beyond the grace period are skipped, not repeated
+        self.assertEqual(scheduler.tick(datetime(2024, 1, 3, 12, 0)), list())
+        self.assertEqual(scheduler.tick(datetime(2024, 1, 4, 3, 2)),
+                         [restart])
+
+        self.assertTrue(scheduler.remove("0 3 * * *   restart idle"))
+        self.assertFalse(scheduler.remove("0 3 * * * restart idle"))
+        self.assertEqual(scheduler.rules, [skip])
+        self.assertEqual(scheduler.tick(datetime(2024, 1, 5, 3, 0)), list())
+
+    def test_rule_scheduler_thread(self):
+        from datetime import datetime
+        from skill_device_controls.util.rules import RuleScheduler
+        now = datetime(2024, 1, 1, 0, 0, 59, 950000)
+        scheduler = RuleScheduler(lambda _: None, now=lambda: now)
+        scheduler.start()
+        sleep(0.2)
+        self.assertTrue(scheduler.is_alive())
+        scheduler.stop()
+        self.assertFalse(scheduler.is_alive())
+
+
+class TestActivityMonitor(unittest.TestCase):
+    def test_rolling_counter(self):
+        from skill_device_controls.util.activity import RollingCounter
+        counter = RollingCounter(window=10)
+        for now in (100.1, 100.5, 103.2, 109.9):
+            counter.add(now)
+        self.assertEqual(counter.count(10, 109.9), 4)
+        self.assertEqual(counter.count(1, 109.9), 1)
+        self.assertEqual(counter.count(7, 109.9), 2)
+        # Buckets older than the window are reused
+        counter.add(110.0)
+        self.assertEqual(counter.count(10, 110.0), 3)
+        self.assertEqual(counter.count(10, 130.0), 0)
+
+    def test_activity_monitor(self):
+        from ovos_bus_client.message import Message
+        from skill_device_controls.util.activity import ActivityMonitor
+        monitor = ActivityMonitor("device_controls")
+        monitor.on_utterance()
+        monitor.on_speak()
+        self.assertEqual(monitor.report()["counts"],
+                         {"utterance": 1, "speak": 1})
+        self.assertFalse(monitor.busy)
+        self.assertLess(monitor.quiet_for(), 1)
+
+        # Handlers of the monitoring skill are ignored
+        own = Message("mycroft.skill.handler.start", {},
+                      {"skill_id": "device_controls"})
+        other = Message("mycroft.skill.handler.start", {},
+                        {"skill_id": "other"})
+        monitor.on_handler_start(own)
+        self.assertFalse(monitor.busy)
+        monitor.on_handler_start(other)
+        monitor.on_audio_output_start()
+        self.assertTrue(monitor.busy)
+        self.assertEqual(monitor.quiet_for(), 0)
+        self.assertGreater(monitor.expected_wait(0.1), 1)
+        self.assertFalse(monitor.wait_for_quiet(0.1, timeout=0.2))
+        monitor.on_handler_complete(other)
+        monitor.on_audio_output_end()
+        # Unmatched ends are ignored
+        monitor.on_record_end()
+        self.assertFalse(monitor.busy)
+        self.assertLessEqual(monitor.expected_wait(0.2), 0.2)
+        self.assertTrue(monitor.wait_for_quiet(0.2, timeout=1))
+        self.assertGreaterEqual(monitor.quiet_for(), 0.2)
+        self.assertEqual(monitor.expected_wait(0.2), 0)
+
+class TestWakeWordSnapshot(unittest.TestCase):
+    def test_snapshot_store(self):
+        import json
+        from os import listdir
+        from os.path import join
+        from tempfile import TemporaryDirectory
+        from skill_device_controls.util.ww_backend import get_catalog_version
+        from skill_device_controls.util.ww_snapshot import SnapshotStore
+        wake_words = {"hey_neon": {"active": True, "module": "ovos-ww"},
+                      "hey_mycroft": {"active": False}}
+        with TemporaryDirectory() as tmp:
+            path = join(tmp, "ww_catalog.json")
+            store = SnapshotStore(path)
+            self.assertIsNone(store.load())
+
+            saved = store.save(wake_words, False)
+            self.assertEqual(saved.wake_words,
+                             {"hey_neon": {"active": True},
+                              "hey_mycroft": {"active": False}})
+            self.assertEqual(saved.version,
+                             get_catalog_version(saved.wake_words))
+            self.assertEqual(store.load(), saved)
+            self.assertEqual(listdir(tmp), ["ww_catalog.json"])
+
+            # Catalog not matching its version is ignored
+            with open(path) as f:
+                data = json.load(f)
+            data["wake_words"]["hey_mycroft"]["active"] = True
+            with open(path, "w") as f:
+                json.dump(data, f)
+            self.assertIsNone(store.load())
+
+            # Unknown format is ignored
+            data = {**data, "format": 0,
+                    "version": get_catalog_version(data["wake_words"])}
+            with open(path, "w") as f:
+                json.dump(data, f)
+            self.assertIsNone(store.load())
+
+            # Corrupt file is ignored and replaced on save
+            with open(path, "w") as f:
+                f.write('{"format": 1, "wake_')
+            self.assertIsNone(store.load())
+            self.assertEqual(store.save(wake_words, None), store.load())
+            self.assertIsNone(store.load().enabled)
+
+    def test_seed_catalog(self):
+        from ovos_utils.fakebus import FakeBus
+        from fake_listener import FakeListener
+        from skill_device_controls.util.ww_backend import BusWakeWordBackend, \
+            get_catalog_version, project_wake_words
+        bus = FakeBus()
+        listener = FakeListener()
+        listener.bind(bus)
+        backend = BusWakeWordBackend(bus)
+        replies = list()
+        bus.on("neon.wake_words", lambda m: replies.append(m.data))
+
+        # A seeded catalog matching the listener is not sent again
+        catalog = project_wake_words(listener.wake_words)
+        backend.seed_catalog(catalog, get_catalog_version(catalog))
+        self.assertEqual(backend.get_wake_words(), catalog)
+        self.assertTrue(replies[-1]["not_modified"])
+
+        # Seeding does not replace a catalog from the listener
+        backend.seed_catalog(dict(), get_catalog_version(dict()))
+        self.assertEqual(backend.get_wake_words(), catalog)
+
+        # An outdated seed is replaced by the listener's catalog
+        backend = BusWakeWordBackend(bus)
+        stale = {"hey_neon": {"active": False}}
+        backend.seed_catalog(stale, get_catalog_version(stale))
+        self.assertEqual(backend.get_wake_words(), catalog)
+        self.assertIn("wake_words", replies[-1])
+        listener.unbind()
+
+
+class TestWakeWordMatcher(unittest.TestCase):
+    def test_build_pattern(self):
+        from skill_device_controls.util.ww_matcher import \
+            build_wake_word_pattern, normalize_wake_word
+        self.assertEqual(normalize_wake_word("Hey_Neon"), "hey neon")
+        self.assertEqual(normalize_wake_word(" hey -  neon "), "hey neon")
+        self.assertIsNone(build_wake_word_pattern([]))
+
+        pattern = build_wake_word_pattern(["neon", "hey_neon", "c3.po"])
+        self.assertEqual(pattern.search("to hey neon please").group(),
+                         "hey neon")
+        self.assertEqual(pattern.search("use Hey-Neon").group(), "Hey-Neon")
+        self.assertEqual(pattern.search("just neon").group(), "neon")
+        self.assertEqual(pattern.search("call c3.po").group(), "c3.po")
+        self.assertIsNone(pattern.search("neonatal"))
+        self.assertIsNone(pattern.search("call c3po"))
+
+    def test_wake_word_matcher(self):
+        from skill_device_controls.util.ww_matcher import WakeWordMatcher
+        catalog = {"hey_neon": {}, "neon": {}, "hey_mycroft": {}}
+        matcher = WakeWordMatcher(max_langs=1)
+        self.assertEqual(matcher.match("to hey neon please", catalog, "en-us"),
+                         "hey_neon")
+        self.assertEqual(matcher.match("as neon", catalog, "en-us"), "neon")
+        self.assertEqual(matcher.match("Hey Mycroft then hey neon", catalog,
+                                       "en-us"), "hey_mycroft")
+        self.assertIsNone(matcher.match("something else", catalog, "en-us"))
+        self.assertIsNone(matcher.match("", catalog, "en-us"))
+
+        # Pattern is kept until the catalog changes
+        pattern = matcher._patterns.get("en-us", None)._pattern
+        matcher.match("hey neon", dict(catalog), "EN-US")
+        self.assertIs(matcher._patterns.get("en-us", None)._pattern, pattern)
+        catalog.pop("hey_neon")
+        self.assertEqual(matcher.match("hey neon", catalog, "en-us"), "neon")
+        self.assertIsNot(matcher._patterns.get("en-us", None)._pattern,
+                         pattern)
+
+        # Patterns are cached per language
+        self.assertEqual(matcher.match("гей неон", {"гей_неон": {}},
+                                       "uk-ua"), "гей_неон")
+        self.assertEqual(matcher._patterns.langs, ["uk-ua"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import unittest
+
+from vocab_analyzer import Conflict, analyze, find_rules, get_expected
+
+
+class TestVocabAnalyzer(unittest.TestCase):
+    def test_get_expected(self):
+        self.assertEqual(get_expected({
+            "ExitShutdownIntent": {"request", "exit", "restart"},
+            "StopSoloModeIntent": {"disable", "solo"}}),
+            "StopSoloModeIntent")
+        self.assertEqual(get_expected({"SkipWWIntent": {"start_sww", "ww"},
+                                       "UseWWIntent": {"ww"}}),
+                         "SkipWWIntent")
+        self.assertIsNone(get_expected({"SkipWWIntent": {"start_sww", "ww"},
+                                        "UseWWIntent": {"stop_sww", "ww"}}))
+
+    def test_find_rules(self):
+        from adapt.intent import IntentBuilder
+        intents = [IntentBuilder("ExitShutdownIntent").require("request")
+                   .one_of("exit", "shutdown").build(),
+                   IntentBuilder("StopSoloModeIntent").require("disable")
+                   .require("solo").build()]
+        vocab = {"request": ["please"], "exit": ["exit"], "shutdown": ["off"],
+                 "disable": ["exit", "stop"], "solo": ["solo mode"]}
+        conflict = Conflict("please exit solo mode", "StopSoloModeIntent",
+                            {"ExitShutdownIntent": {"request", "exit"},
+                             "StopSoloModeIntent": {"disable", "solo"}},
+                            "ExitShutdownIntent")
+        # `disable` shares "exit" with ExitShutdownIntent, so only `solo` works
+        self.assertEqual(find_rules([conflict], intents, vocab),
+                         [("ExitShutdownIntent", "solo")])
+
+    def test_skill_intents(self):
+        for lang in ("en-us", "uk-ua"):
+            report = analyze(lang)
+            self.assertTrue(report.shared_phrases, lang)
+            misrouted = [c.utterance for c in report.conflicts
+                         if c.expected and c.matched != c.expected]
+            self.assertEqual(misrouted, [], lang)
+            self.assertEqual(report.rules, [], lang)
+            for conflict in report.conflicts:
+                self.assertNotIn("ExitShutdownIntent", conflict.candidates)
+
+
+if __name__ == '__main__':
+    unittest.main()
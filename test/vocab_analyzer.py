@@ -0,0 +1,317 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Find vocabulary shared between the skill's Adapt intents, utterances that
+more than one intent can match, and a minimal set of `exclude` rules that
+would disambiguate them.
+Run with `python test/vocab_analyzer.py [LANG ...]`
+"""
+
+import re
+import sys
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from itertools import islice, product
+from os import listdir
+from os.path import dirname, isdir, join
+from typing import Dict, List, Optional, Set, Tuple
+
+from adapt.engine import IntentDeterminationEngine
+from ovos_workshop.resource_files import SkillResources
+
+sys.path.append(dirname(__file__))
+from batch_intent_runner import ROOT_DIR, determine_intents, \
+    get_skill_intents
+
+# Maximum probe utterances generated for each intent or pair of intents
+MAX_PROBES = 200
+MAX_CROSS_PROBES = 20
+
+# Intents that should lose to any other candidate for the same utterance
+DESTRUCTIVE_INTENTS = {"ExitShutdownIntent"}
+
+
+@dataclass
+class Conflict:
+    utterance: str
+    expected: Optional[str]
+    candidates: Dict[str, Set[str]]
+    matched: Optional[str]
+
+
+@dataclass
+class LanguageReport:
+    lang: str
+    shared_phrases: Dict[str, Set[str]] = field(default_factory=dict)
+    phrase_intents: Dict[str, Set[str]] = field(default_factory=dict)
+    candidates: Dict[str, float] = field(default_factory=dict)
+    conflicts: List[Conflict] = field(default_factory=list)
+    rules: List[Tuple[str, str]] = field(default_factory=list)
+
+
+def get_languages() -> List[str]:
+    locale_dir = join(ROOT_DIR, "locale")
+    return sorted(d for d in listdir(locale_dir)
+                  if isdir(join(locale_dir, d)))
+
+
+def load_vocab(lang: str) -> Dict[str, List[str]]:
+    """
+    Get every phrase of each vocab file for a language.
+    :returns: dict of vocab name to list of lowercase phrases
+    """
+    resources = SkillResources(ROOT_DIR, lang, skill_id="vocab_analyzer")
+    return {name.lower(): [p.lower().strip() for line in lines for p in line
+                           if p.strip()]
+            for name, lines in resources.load_skill_vocabulary("").items()}
+
+
+def get_intent_vocab(intent) -> Set[str]:
+    """
+    Get all vocab names an intent may match on.
+    """
+    vocab = {r[0] for r in intent.requires}
+    vocab.update(v for group in intent.at_least_one for v in group)
+    vocab.update(o[0] for o in intent.optional)
+    return vocab
+
+
+def build_index(vocab: Dict[str, List[str]],
+                intents: list) -> Dict[str, Set[str]]:
+    """
+    Build an inverted index from each vocab phrase to the intents that could
+    use it, including intents whose vocab matches part of the phrase.
+    :param vocab: dict of vocab name to phrases
+    :param intents: list of Adapt intents
+    :returns: dict of phrase to intent names
+    """
+    vocab_intents = defaultdict(set)
+    for intent in intents:
+        for name in get_intent_vocab(intent):
+            vocab_intents[name].add(intent.name)
+    index = defaultdict(set)
+    for name, phrases in vocab.items():
+        for phrase in phrases:
+            for other, other_phrases in vocab.items():
+                if any(_contains(phrase, p) for p in other_phrases):
+                    index[phrase].update(vocab_intents.get(other, set()))
+    return index
+
+
+def _contains(phrase: str, part: str) -> bool:
+    return re.search(rf"\b{re.escape(part)}\b", phrase) is not None
+
+
+def get_probes(intent, vocab: Dict[str, List[str]]) -> List[str]:
+    """
+    Generate utterances that should match an intent by combining phrases of
+    its required vocab with each of its one-of alternatives.
+    """
+    slots = [vocab.get(r[0], []) for r in intent.requires]
+    groups = [[p for v in group for p in vocab.get(v, [])]
+              for group in intent.at_least_one]
+    return [" ".join(parts) for parts in
+            islice(product(*groups, *slots), MAX_PROBES)]
+
+
+def get_cross_probes(intent, other, vocab: Dict[str, List[str]],
+                     index: Dict[str, Set[str]]) -> List[str]:
+    """
+    Generate utterances where `other`'s probes share a phrase with `intent`,
+    prefixed with any vocab `intent` requires that `other` does not use.
+    """
+    shared = {p for p, intents in index.items()
+              if {intent.name, other.name} <= intents}
+    if not shared:
+        return []
+    other_vocab = get_intent_vocab(other)
+    prefix = " ".join(vocab[r[0]][0] for r in intent.requires
+                      if r[0] not in other_vocab and vocab.get(r[0]))
+    probes = [p for p in get_probes(other, vocab)
+              if any(_contains(p, phrase) for phrase in shared)]
+    return [f"{prefix} {p}".strip() for p in probes[:MAX_CROSS_PROBES]]
+
+
+def get_candidates(engine: IntentDeterminationEngine,
+                   utterance: str) -> Dict[str, Set[str]]:
+    """
+    Get every intent Adapt considers for an utterance.
+    :returns: dict of candidate intent name to the vocab it matched
+    """
+    candidates = defaultdict(set)
+    for intent in determine_intents(engine, utterance):
+        candidates[intent["intent_type"]].update(
+            k for k, v in intent.items() if isinstance(v, str) and
+            k not in ("intent_type", "target", "utterance"))
+    return dict(candidates)
+
+
+def get_expected(candidates: Dict[str, Set[str]]) -> Optional[str]:
+    """
+    Pick the intended match for an ambiguous utterance. Destructive intents
+    lose to any other candidate; otherwise the candidate matching the most
+    vocab wins. Ties are left unresolved.
+    """
+    safe = {k: v for k, v in candidates.items()
+            if k not in DESTRUCTIVE_INTENTS} or candidates
+    ranked = sorted(safe, key=lambda k: len(safe[k]), reverse=True)
+    if len(ranked) > 1 and len(safe[ranked[0]]) == len(safe[ranked[1]]):
+        return None
+    return ranked[0]
+
+
+def engine_best(engine: IntentDeterminationEngine,
+                utterance: str) -> Optional[str]:
+    """
+    Get the intent Adapt would select for an utterance.
+    """
+    intents = determine_intents(engine, utterance)
+    if not intents:
+        return None
+    return max(intents, key=lambda i: i.get("confidence", 0.0))["intent_type"]
+
+
+def _build_engine(vocab: Dict[str, List[str]],
+                  intents: list) -> IntentDeterminationEngine:
+    engine = IntentDeterminationEngine()
+    for name, phrases in vocab.items():
+        for phrase in phrases:
+            engine.register_entity(phrase, name)
+    for intent in intents:
+        engine.register_intent_parser(intent)
+    return engine
+
+
+def find_rules(conflicts: List[Conflict], intents: list,
+               vocab: Dict[str, List[str]]) -> List[Tuple[str, str]]:
+    """
+    Find a small set of (intent, vocab) exclusions that removes every
+    unintended candidate from the conflicting utterances. Rules are chosen
+    greedily by the number of conflicts they resolve. Vocab sharing a phrase
+    with an intent's own vocab is never excluded from that intent.
+    :returns: list of (intent name, vocab name) to exclude
+    """
+    intent_vocab = dict()
+    for intent in intents:
+        phrases = {p for v in get_intent_vocab(intent) for p in vocab.get(v, [])}
+        intent_vocab[intent.name] = {v for v, ps in vocab.items()
+                                     if phrases.intersection(ps)}
+    unresolved = set()
+    options = defaultdict(set)
+    for n, conflict in enumerate(conflicts):
+        if not conflict.expected:
+            continue
+        expected_vocab = conflict.candidates[conflict.expected]
+        for candidate in set(conflict.candidates) - {conflict.expected}:
+            key = (n, candidate)
+            unresolved.add(key)
+            # Vocab the intended match uses that the other intent does not
+            for vocab in expected_vocab - intent_vocab[candidate]:
+                options[(candidate, vocab)].add(key)
+    rules = list()
+    while unresolved:
+        best = max(sorted(options),
+                   key=lambda r: len(options[r] & unresolved), default=None)
+        if not best or not options[best] & unresolved:
+            break
+        rules.append(best)
+        unresolved -= options.pop(best)
+    return sorted(rules)
+
+
+def analyze(lang: str, intents: Optional[list] = None) -> LanguageReport:
+    """
+    Analyze vocab overlaps and intent ambiguity for a language.
+    :param lang: language to analyze
+    :param intents: Adapt intents to analyze (default the skill's intents)
+    :returns: LanguageReport for the language
+    """
+    intents = intents or get_skill_intents()[0]
+    vocab = load_vocab(lang)
+    report = LanguageReport(lang)
+    phrase_vocab = defaultdict(set)
+    for name, phrases in vocab.items():
+        for phrase in phrases:
+            phrase_vocab[phrase].add(name)
+    report.shared_phrases = {p: v for p, v in phrase_vocab.items()
+                             if len(v) > 1}
+    index = build_index(vocab, intents)
+    report.phrase_intents = {p: i for p, i in index.items() if len(i) > 1}
+
+    engine = _build_engine(vocab, intents)
+    counts = defaultdict(list)
+    seen = set()
+    for intent in intents:
+        probes = get_probes(intent, vocab)
+        for other in intents:
+            if other is not intent:
+                probes += get_cross_probes(intent, other, vocab, index)
+        for utterance in probes:
+            candidates = get_candidates(engine, utterance)
+            for name in candidates:
+                counts[name].append(len(candidates))
+            if len(candidates) > 1 and utterance not in seen:
+                seen.add(utterance)
+                report.conflicts.append(Conflict(
+                    utterance, get_expected(candidates), candidates,
+                    engine_best(engine, utterance)))
+    report.candidates = {i.name: sum(counts[i.name]) / len(counts[i.name])
+                         if counts[i.name] else 0.0 for i in intents}
+    report.rules = find_rules(report.conflicts, intents, vocab)
+    return report
+
+
+def print_report(report: LanguageReport):
+    print(f"== {report.lang}")
+    print("Phrases in more than one vocab file:")
+    for phrase, vocab in sorted(report.shared_phrases.items()):
+        print(f"  '{phrase}': {', '.join(sorted(vocab))}")
+    print("Phrases used by more than one intent:")
+    for phrase, intents in sorted(report.phrase_intents.items()):
+        print(f"  '{phrase}': {', '.join(sorted(intents))}")
+    print("Mean Adapt candidates per intent:")
+    for intent, count in sorted(report.candidates.items()):
+        print(f"  {intent}: {count:.2f}")
+    misrouted = [c for c in report.conflicts
+                 if c.expected and c.matched != c.expected]
+    print(f"Ambiguous utterances: {len(report.conflicts)} "
+          f"({len(misrouted)} matched the wrong intent)")
+    for conflict in report.conflicts:
+        print(f"  '{conflict.utterance}': "
+              f"{', '.join(sorted(conflict.candidates))}; expected "
+              f"{conflict.expected}, matched {conflict.matched}")
+    print("Disambiguating rules:")
+    for intent, vocab in report.rules:
+        print(f"  {intent}: .exclude(\"{vocab}\")")
+
+
+if __name__ == "__main__":
+    for language in sys.argv[1:] or get_languages():
+        print_report(analyze(language))
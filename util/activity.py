@@ -0,0 +1,204 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from threading import Condition
+from time import monotonic
+from typing import Dict, Optional
+
+from ovos_bus_client.message import Message
+
+# Activities that keep the device busy while they are in progress
+SPEAKING = "speaking"
+RECORDING = "recording"
+HANDLING = "handling"
+
+
+class RollingCounter:
+    """
+    Counts events over the last `window` seconds in one second buckets.
+    """
+    __slots__ = ("_counts", "_seconds")
+
+    def __init__(self, window: int = 60):
+        self._counts = [0] * window
+        self._seconds = [-1] * window
+
+    def add(self, now: float):
+        second = int(now)
+        index = second % len(self._counts)
+        if self._seconds[index] != second:
+            self._seconds[index] = second
+            self._counts[index] = 0
+        self._counts[index] += 1
+
+    def count(self, seconds: float, now: float) -> int:
+        """
+        Get the number of events in the last `seconds`, up to the window.
+        """
+        second = int(now)
+        return sum(count for count, when in zip(self._counts, self._seconds)
+                   if 0 <= second - when < seconds)
+
+
+class ActivityMonitor:
+    """
+    Tracks device activity from messagebus events: utterances and speech as
+    rolling counts, and speech output, recording and skill handlers as
+    activities in progress. Handlers of the skill that owns the monitor are
+    ignored, since it is the one waiting for a quiet window.
+    """
+    def __init__(self, skill_id: Optional[str] = None, window: int = 60):
+        """
+        :param skill_id: skill whose own handlers are not counted
+        :param window: seconds of events kept by the rolling counters
+        """
+        self.skill_id = skill_id
+        self.counters = {"utterance": RollingCounter(window),
+                         "speak": RollingCounter(window)}
+        self._active: Dict[str, int] = {SPEAKING: 0, RECORDING: 0,
+                                        HANDLING: 0}
+        self._since: Dict[str, float] = dict()
+        # Moving average of how long each activity lasts
+        self._durations: Dict[str, float] = {SPEAKING: 5, RECORDING: 5,
+                                             HANDLING: 5}
+        self.last_activity = monotonic()
+        self._cond = Condition()
+
+    @property
+    def busy(self) -> bool:
+        return any(self._active.values())
+
+    def on_utterance(self, _=None):
+        self._pulse("utterance")
+
+    def on_speak(self, _=None):
+        self._pulse("speak")
+
+    def on_audio_output_start(self, _=None):
+        self._begin(SPEAKING)
+
+    def on_audio_output_end(self, _=None):
+        self._end(SPEAKING)
+
+    def on_record_begin(self, _=None):
+        self._begin(RECORDING)
+
+    def on_record_end(self, _=None):
+        self._end(RECORDING)
+
+    def on_handler_start(self, message: Message):
+        if message.context.get("skill_id") != self.skill_id:
+            self._begin(HANDLING)
+
+    def on_handler_complete(self, message: Message):
+        if message.context.get("skill_id") != self.skill_id:
+            self._end(HANDLING)
+
+    def _pulse(self, kind: str):
+        with self._cond:
+            now = monotonic()
+            self.counters[kind].add(now)
+            self.last_activity = now
+            self._cond.notify_all()
+
+    def _begin(self, activity: str):
+        with self._cond:
+            now = monotonic()
+            if not self._active[activity]:
+                self._since[activity] = now
+            self._active[activity] += 1
+            self.last_activity = now
+            self._cond.notify_all()
+
+    def _end(self, activity: str):
+        with self._cond:
+            if not self._active[activity]:
+                return
+            now = monotonic()
+            self._active[activity] -= 1
+            if not self._active[activity]:
+                duration = now - self._since.pop(activity, now)
+                self._durations[activity] = \
+                    0.8 * self._durations[activity] + 0.2 * duration
+            self.last_activity = now
+            self._cond.notify_all()
+
+    def quiet_for(self) -> float:
+        """
+        Get seconds since the device was last active, 0 if it is busy now.
+        """
+        if self.busy:
+            return 0.0
+        return monotonic() - self.last_activity
+
+    def expected_wait(self, quiet_seconds: float) -> float:
+        """
+        Estimate seconds until a quiet window of `quiet_seconds` completes,
+        assuming activities in progress last as long as they usually do and
+        nothing new starts.
+        """
+        with self._cond:
+            now = monotonic()
+            busy_remaining = max([self._durations[activity] -
+                                  (now - self._since.get(activity, now))
+                                  for activity, count in
+                                  self._active.items() if count] or [0])
+            if self.busy:
+                return max(busy_remaining, 1) + quiet_seconds
+            return max(quiet_seconds - (now - self.last_activity), 0.0)
+
+    def wait_for_quiet(self, quiet_seconds: float, timeout: float) -> bool:
+        """
+        Block until the device has been quiet for `quiet_seconds`.
+        :param quiet_seconds: seconds without activity required
+        :param timeout: maximum seconds to wait
+        :returns: True if a quiet window was found, False on timeout
+        """
+        deadline = monotonic() + timeout
+        with self._cond:
+            while True:
+                now = monotonic()
+                if not self.busy:
+                    wait = quiet_seconds - (now - self.last_activity)
+                    if wait <= 0:
+                        return True
+                else:
+                    wait = quiet_seconds
+                if now >= deadline:
+                    return False
+                self._cond.wait(min(wait, deadline - now))
+
+    def report(self, seconds: float = 60) -> dict:
+        """
+        Get counts of recent events and activities in progress.
+        """
+        now = monotonic()
+        return {"counts": {kind: counter.count(seconds, now)
+                           for kind, counter in self.counters.items()},
+                "active": dict(self._active),
+                "quiet_for": round(self.quiet_for(), 3)}
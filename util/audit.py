@@ -0,0 +1,183 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import struct
+
+from dataclasses import dataclass
+from enum import IntEnum
+from os import remove, rename
+from os.path import exists, getsize
+from queue import Queue
+from threading import Thread
+from time import time
+from typing import List, Optional
+
+from ovos_utils.log import LOG
+
+
+class AuditAction(IntEnum):
+    ENABLE_WAKE_WORD = 1
+    DISABLE_WAKE_WORD = 2
+    REQUIRE_WAKE_WORDS = 3
+    SKIP_WAKE_WORDS = 4
+
+
+@dataclass
+class AuditEntry:
+    timestamp: float
+    action: str
+    # Wake word changed; empty for require/skip requests
+    wake_word: str
+    # True on success, False on failure, None if unknown
+    success: Optional[bool]
+    # Seconds the listener call took
+    latency: float
+
+
+# Bytes stored for each wake word name
+WAKE_WORD_BYTES = 32
+# timestamp, latency, action, result, wake word (UTF-8, NUL padded)
+_RECORD = struct.Struct(f"<dfBb{WAKE_WORD_BYTES}s")
+RECORD_SIZE = _RECORD.size
+_RESULTS = {True: 1, False: 0, None: -1}
+
+
+def pack_entry(entry: AuditEntry) -> bytes:
+    """
+    Encode an entry as a fixed size record. Wake word names longer than the
+    record allows are truncated.
+    :param entry: AuditEntry to encode
+    :returns: bytes of length `RECORD_SIZE`
+    """
+    return _RECORD.pack(entry.timestamp, entry.latency,
+                        AuditAction[entry.action.upper()],
+                        _RESULTS[entry.success],
+                        entry.wake_word.encode("utf-8")[:WAKE_WORD_BYTES])
+
+
+def unpack_entry(record: bytes) -> AuditEntry:
+    """
+    Decode a fixed size record written by `pack_entry`.
+    :param record: bytes of length `RECORD_SIZE`
+    :returns: decoded AuditEntry
+    """
+    timestamp, latency, action, result, ww = _RECORD.unpack(record)
+    return AuditEntry(timestamp, AuditAction(action).name.lower(),
+                      ww.rstrip(b"\0").decode("utf-8", "ignore"),
+                      None if result < 0 else bool(result), latency)
+
+
+class WakeWordAuditLog:
+    """
+    Append-only log of wake word changes. Entries are queued by `record` and
+    written by a background thread, so handlers never wait on disk. When the
+    log reaches `max_bytes` it is rotated to `<path>.1`, replacing any
+    previous rotated log.
+    """
+    def __init__(self, path: str, max_bytes: int = 64 * 1024):
+        """
+        :param path: file to append records to
+        :param max_bytes: size at which the log is rotated; rounded down to a
+            whole number of records
+        """
+        self.path = path
+        self.max_bytes = max(max_bytes // RECORD_SIZE, 1) * RECORD_SIZE
+        self._queue = Queue()
+        self._writer = Thread(target=self._write_entries,
+                              name="ww_audit_log", daemon=True)
+        self._writer.start()
+
+    def record(self, action: AuditAction, wake_word: str = "",
+               success: Optional[bool] = None, latency: float = 0.0):
+        """
+        Queue an entry to be written.
+        :param action: AuditAction performed
+        :param wake_word: wake word changed, if any
+        :param success: result of the listener call, None on timeout
+        :param latency: seconds the listener call took
+        """
+        self._queue.put(AuditEntry(time(), action.name.lower(), wake_word,
+                                   success, latency))
+
+    def flush(self):
+        """
+        Block until all queued entries are written.
+        """
+        self._queue.join()
+
+    def recent(self, limit: int = 20) -> List[AuditEntry]:
+        """
+        Read the most recent entries written, oldest first. Entries still
+        queued are not included; call `flush` first to include them.
+        :param limit: maximum number of entries to return
+        :returns: list of AuditEntry
+        """
+        if limit <= 0:
+            return list()
+        data = b""
+        for path in (self.path, f"{self.path}.1"):
+            if not exists(path):
+                continue
+            with open(path, "rb") as f:
+                size = getsize(path)
+                size -= size % RECORD_SIZE
+                needed = limit * RECORD_SIZE - len(data)
+                f.seek(max(size - needed, 0))
+                data = f.read(min(size, needed)) + data
+            if len(data) >= limit * RECORD_SIZE:
+                break
+        return [unpack_entry(data[i:i + RECORD_SIZE])
+                for i in range(0, len(data), RECORD_SIZE)]
+
+    def stop(self):
+        """
+        Write any queued entries and stop the writer thread.
+        """
+        self._queue.put(None)
+        self._writer.join()
+
+    def _write_entries(self):
+        while True:
+            entry = self._queue.get()
+            try:
+                if entry is None:
+                    return
+                self._append(pack_entry(entry))
+            except Exception as e:
+                LOG.error(f"Failed to write audit entry {entry}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _append(self, record: bytes):
+        if exists(self.path) and getsize(self.path) >= self.max_bytes:
+            rotated = f"{self.path}.1"
+            if exists(rotated):
+                remove(rotated)
+            rename(self.path, rotated)
+        with open(self.path, "ab") as f:
+            f.write(record)
@@ -0,0 +1,120 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from contextlib import contextmanager
+from functools import wraps
+from time import monotonic
+from typing import Dict
+
+from ovos_utils.log import LOG
+
+
+class TimeBudget:
+    """
+    Tracks an end-to-end time budget for a control flow and how much of it
+    each step used.
+    """
+    def __init__(self, name: str, total: float):
+        """
+        :param name: name of the flow this budget applies to
+        :param total: seconds allowed for the whole flow
+        """
+        self.name = name
+        self.total = total
+        self.start = monotonic()
+        self.steps: Dict[str, float] = dict()
+
+    @property
+    def elapsed(self) -> float:
+        return monotonic() - self.start
+
+    @property
+    def remaining(self) -> float:
+        return max(self.total - self.elapsed, 0.0)
+
+    @property
+    def expired(self) -> bool:
+        return self.elapsed >= self.total
+
+    @contextmanager
+    def step(self, name: str):
+        """
+        Record the time spent in a step of this flow. Repeated steps are
+        summed.
+        :param name: name of the step
+        """
+        start = monotonic()
+        try:
+            yield self
+        finally:
+            self.steps[name] = self.steps.get(name, 0.0) + \
+                monotonic() - start
+
+    def limit_retries(self, num_retries: int, attempt_time: float) -> int:
+        """
+        Limit a number of retries to what fits in the remaining budget.
+        :param num_retries: requested retries; -1 for unlimited
+        :param attempt_time: expected seconds per attempt
+        :returns: number of retries that fit in the remaining budget
+        """
+        allowed = max(int(self.remaining // max(attempt_time, 1)), 1)
+        if num_retries < 0:
+            return allowed
+        return min(num_retries, allowed)
+
+    def report(self) -> dict:
+        """
+        Get a summary of this budget and the time used by each step.
+        """
+        return {"flow": self.name,
+                "total": self.total,
+                "elapsed": round(self.elapsed, 3),
+                "expired": self.expired,
+                "steps": {k: round(v, 3) for k, v in self.steps.items()}}
+
+    def log_report(self):
+        report = self.report()
+        log = LOG.warning if report["expired"] else LOG.debug
+        log(f"Flow {self.name} used {report['elapsed']}s of "
+            f"{self.total}s: {report['steps']}")
+        return report
+
+
+def budgeted_flow(name: str):
+    """
+    Decorator to run a skill handler within a named time budget. The skill
+    must implement a `time_budget(name, message)` context manager.
+    :param name: name of the flow the handler implements
+    """
+    def wrapper(func):
+        @wraps(func)
+        def run_in_budget(skill, message, *args, **kwargs):
+            with skill.time_budget(name, message):
+                return func(skill, message, *args, **kwargs)
+        return run_in_budget
+    return wrapper
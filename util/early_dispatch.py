@@ -0,0 +1,220 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import re
+
+from dataclasses import dataclass
+from sys import intern
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from ovos_utils.bracket_expansion import expand_template
+from ovos_utils.log import LOG
+
+
+def tokenize(utterance: str) -> List[str]:
+    """
+    Split an utterance into lowercase words, ignoring punctuation.
+    """
+    return re.findall(r"\w+", utterance.lower())
+
+
+class _Node:
+    __slots__ = ("children", "label", "labels")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = dict()
+        # Label of the phrase ending at this node, if any
+        self.label: Optional[str] = None
+        # Labels of every phrase passing through this node
+        self.labels: Set[str] = set()
+
+
+class PrefixAutomaton:
+    """
+    Word-level trie of intent phrases that is matched incrementally against
+    partial transcriptions. A phrase may start at any word of an utterance.
+    """
+    def __init__(self):
+        self._root = _Node()
+
+    @classmethod
+    def from_intents(cls, intents: Dict[str, Iterable[str]]):
+        """
+        Build an automaton from Padatious intent file lines.
+        :param intents: dict of label to intent lines, which may contain
+            `(a|b)` alternatives
+        """
+        automaton = cls()
+        for label, lines in intents.items():
+            for line in lines:
+                for phrase in expand_template(line.strip()):
+                    automaton.add(phrase, label)
+        return automaton
+
+    def add(self, phrase: str, label: str):
+        """
+        Add a phrase to the automaton.
+        :param phrase: words to match
+        :param label: value returned when the phrase matches
+        """
+        words = tokenize(phrase)
+        if not words:
+            return
+        node = self._root
+        for word in words:
+            node = node.children.setdefault(intern(word), _Node())
+            node.labels.add(intern(label))
+        node.label = intern(label)
+
+    def match(self, utterance: str) -> Tuple[Optional[str], Set[str]]:
+        """
+        Match a (partial) utterance.
+        :param utterance: transcription so far
+        :returns: label of the first complete phrase found (or None) and the
+            labels of phrases the end of the utterance is still a prefix of
+        """
+        active: List[_Node] = list()
+        matched = None
+        for word in tokenize(utterance):
+            active = [node.children[word] for node in active + [self._root]
+                      if word in node.children]
+            if not matched:
+                matched = next((n.label for n in active if n.label), None)
+        pending = set()
+        for node in active:
+            if node.children:
+                pending.update(*(c.labels for c in node.children.values()))
+        return matched, pending
+
+
+@dataclass
+class PreparedDispatch:
+    label: str
+    lang: str
+    data: Any
+    created: float
+    # True once the final transcription of the request has been received
+    final: bool = False
+
+    @property
+    def age(self) -> float:
+        return monotonic() - self.created
+
+
+class EarlyDispatcher:
+    """
+    Matches partial transcriptions against intent phrases and prepares work
+    for a matched intent before the final transcription arrives. The intent
+    handler then takes (commits) the prepared work; a final transcription
+    that does not match the same intent discards it.
+    """
+    def __init__(self, load_intents: Callable[[str], Dict[str, List[str]]],
+                 prepare: Callable[[str, str], Any], ttl: float = 15):
+        """
+        :param load_intents: method returning a dict of label to intent lines
+            for a language
+        :param prepare: method accepting a matched label and language and
+            returning prepared data for it
+        :param ttl: seconds prepared data remains valid
+        """
+        self._load_intents = load_intents
+        self._prepare = prepare
+        self.ttl = ttl
+        self._automata: Dict[str, PrefixAutomaton] = dict()
+        self._prepared: Dict[str, PreparedDispatch] = dict()
+        self._lock = Lock()
+
+    def get_automaton(self, lang: str) -> PrefixAutomaton:
+        """
+        Get the automaton for a language, building it on first use.
+        """
+        if lang not in self._automata:
+            self._automata[lang] = \
+                PrefixAutomaton.from_intents(self._load_intents(lang))
+        return self._automata[lang]
+
+    def on_partial(self, session_id: str, utterance: str,
+                   lang: str) -> Optional[PreparedDispatch]:
+        """
+        Handle a partial transcription, preparing work if it matches.
+        :param session_id: session the transcription belongs to
+        :param utterance: transcription so far
+        :param lang: language of the transcription
+        :returns: prepared work for the session, if any
+        """
+        label, _ = self.get_automaton(lang).match(utterance)
+        with self._lock:
+            prepared = self._prepared.get(session_id)
+            if prepared and prepared.final:
+                # Work prepared for a previous request was never taken
+                self._prepared.pop(session_id)
+                prepared = None
+            if not label or (prepared and prepared.label == label and
+                             prepared.age < self.ttl):
+                return prepared
+        LOG.debug(f"Preparing {label} from partial: {utterance}")
+        prepared = PreparedDispatch(label, lang, self._prepare(label, lang),
+                                    monotonic())
+        with self._lock:
+            self._prepared[session_id] = prepared
+        return prepared
+
+    def on_final(self, session_id: str, utterance: str, lang: str):
+        """
+        Handle a final transcription, discarding prepared work it does not
+        match or that was left over from a previous request.
+        :param session_id: session the transcription belongs to
+        :param utterance: final transcription
+        :param lang: language of the transcription
+        """
+        label, _ = self.get_automaton(lang).match(utterance)
+        with self._lock:
+            prepared = self._prepared.get(session_id)
+            if not prepared:
+                return
+            if prepared.final or prepared.label != label:
+                LOG.debug(f"Discarding prepared {prepared.label}")
+                self._prepared.pop(session_id)
+            else:
+                prepared.final = True
+
+    def take(self, session_id: str,
+             label: str) -> Optional[PreparedDispatch]:
+        """
+        Commit prepared work for a session.
+        :param session_id: session being handled
+        :param label: label of the intent being handled
+        :returns: prepared work if it matches `label` and has not expired
+        """
+        with self._lock:
+            prepared = self._prepared.pop(session_id, None)
+        if prepared and prepared.label == label and prepared.age < self.ttl:
+            return prepared
+        return None
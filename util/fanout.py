@@ -0,0 +1,178 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from enum import Enum
+from threading import Event
+from time import monotonic
+from typing import Callable, Iterable, List, Optional
+from uuid import uuid4
+
+from ovos_bus_client.message import Message
+from ovos_utils.log import LOG
+
+
+class DeviceStatus(Enum):
+    SUCCESS = "success"
+    FAILED = "failed"
+    TIMEOUT = "timeout"
+
+
+@dataclass
+class DeviceResult:
+    device: str
+    status: DeviceStatus
+    elapsed: float = 0.0
+    detail: Optional[str] = None
+
+
+@dataclass
+class FanOutSummary:
+    results: List[DeviceResult] = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        return len(self.results)
+
+    @property
+    def succeeded(self) -> List[str]:
+        return [r.device for r in self.results
+                if r.status == DeviceStatus.SUCCESS]
+
+    @property
+    def failed(self) -> List[str]:
+        return [r.device for r in self.results
+                if r.status != DeviceStatus.SUCCESS]
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+
+def get_target_devices(context: dict) -> List[str]:
+    """
+    Get the list of devices a request should be sent to.
+    :param context: Message context to read `target_devices` from
+    :returns: de-duplicated list of device names (empty for this device only)
+    """
+    devices = context.get("target_devices") or []
+    if isinstance(devices, str):
+        devices = [devices]
+    return list(dict.fromkeys(d for d in devices if d))
+
+
+def device_request(bus, message: Message, device: str, timeout: float,
+                   reply_type: Optional[str] = None) -> Message:
+    """
+    Send a request to a single device and wait for its reply. Replies are
+    matched by a per-request ID in the context so that concurrent requests to
+    different devices do not satisfy each other.
+    :param bus: MessageBusClient to send the request on
+    :param message: Message to send; context is updated with routing data
+    :param device: device name to route the request to
+    :param timeout: seconds to wait for a reply
+    :param reply_type: message type of the reply (default `<msg_type>.response`)
+    :returns: reply Message
+    :raises TimeoutError: if no reply is received before `timeout`
+    """
+    reply_type = reply_type or f"{message.msg_type}.response"
+    request_id = str(uuid4())
+    message.context["destination"] = device
+    message.context["fan_out_request"] = request_id
+    received = Event()
+    reply = None
+
+    def _on_reply(msg: Message):
+        nonlocal reply
+        if msg.context.get("fan_out_request") == request_id:
+            reply = msg
+            received.set()
+
+    bus.on(reply_type, _on_reply)
+    try:
+        bus.emit(message)
+        if not received.wait(timeout):
+            raise TimeoutError(f"No {reply_type} from {device}")
+    finally:
+        bus.remove(reply_type, _on_reply)
+    return reply
+
+
+def fan_out(devices: Iterable[str], job: Callable[[str, float], bool],
+            timeout: float, max_workers: int = 16) -> FanOutSummary:
+    """
+    Run `job` concurrently for each device and collect the results.
+    :param devices: device names to send the job to
+    :param job: callable accepting a device name and the seconds remaining
+        before its deadline; returns True on success
+    :param timeout: seconds allowed for each device, counted from when its
+        job starts
+    :param max_workers: maximum number of concurrent device jobs. Devices
+        beyond this wait for a free worker, so the whole fan-out may take up
+        to `timeout` for each batch of `max_workers` devices
+    :returns: FanOutSummary with one result per device, in request order
+    """
+    devices = list(devices)
+    if not devices:
+        return FanOutSummary()
+    start = monotonic()
+
+    def _run(device: str) -> DeviceResult:
+        job_start = monotonic()
+        try:
+            success = job(device, timeout)
+            status = DeviceStatus.SUCCESS if success else DeviceStatus.FAILED
+            detail = None
+        except TimeoutError as e:
+            status, detail = DeviceStatus.TIMEOUT, str(e)
+        except Exception as e:
+            LOG.exception(f"Request to {device} failed: {e}")
+            status, detail = DeviceStatus.FAILED, str(e)
+        return DeviceResult(device, status, monotonic() - job_start, detail)
+
+    workers = min(max_workers, len(devices))
+    executor = ThreadPoolExecutor(max_workers=workers,
+                                  thread_name_prefix="device_fan_out")
+    futures = [executor.submit(_run, device) for device in devices]
+    # Each batch of devices gets a full timeout, plus a small margin for
+    # jobs to report their own timeout
+    batches = -(-len(devices) // workers)
+    wait(futures, timeout=timeout * batches + 1)
+    executor.shutdown(wait=False, cancel_futures=True)
+
+    summary = FanOutSummary()
+    for device, future in zip(devices, futures):
+        if future.done() and not future.cancelled():
+            summary.results.append(future.result())
+        else:
+            summary.results.append(DeviceResult(device, DeviceStatus.TIMEOUT,
+                                                monotonic() - start))
+    LOG.info(f"Fan-out complete: {len(summary.succeeded)}/{summary.total} "
+             f"succeeded in {monotonic() - start:.2f}s")
+    return summary
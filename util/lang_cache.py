@@ -0,0 +1,77 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from collections import OrderedDict
+from threading import RLock
+from typing import Callable, Generic, Iterable, List, TypeVar
+
+T = TypeVar("T")
+
+
+class LangCache(Generic[T]):
+    """
+    Small least-recently-used cache of per-language objects. Pinned languages
+    (i.e. the configured core language) are never evicted.
+    """
+    def __init__(self, max_size: int = 3, pinned: Iterable[str] = ()):
+        """
+        :param max_size: maximum number of unpinned languages to keep
+        :param pinned: languages that are never evicted
+        """
+        self.max_size = max_size
+        self.pinned = set(pinned)
+        self._items: "OrderedDict[str, T]" = OrderedDict()
+        self._lock = RLock()
+
+    def __contains__(self, lang: str) -> bool:
+        return lang in self._items
+
+    @property
+    def langs(self) -> List[str]:
+        return list(self._items.keys())
+
+    def get(self, lang: str, factory: Callable[[], T]) -> T:
+        """
+        Get the cached object for a language, creating it if needed.
+        :param lang: language to get an object for
+        :param factory: method that creates the object for `lang`
+        :returns: cached object for `lang`
+        """
+        with self._lock:
+            if lang in self._items:
+                self._items.move_to_end(lang)
+                return self._items[lang]
+            item = factory()
+            self._items[lang] = item
+            self._evict()
+            return item
+
+    def _evict(self):
+        unpinned = [lang for lang in self._items if lang not in self.pinned]
+        for lang in unpinned[:max(len(unpinned) - self.max_size, 0)]:
+            self._items.pop(lang)
@@ -0,0 +1,110 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import tracemalloc
+
+from dataclasses import asdict, dataclass
+from os.path import join
+from time import time
+from typing import Dict, Optional
+
+from ovos_utils.log import LOG
+
+
+@dataclass
+class MemorySample:
+    label: str
+    # Bytes traced process-wide since the profiler's baseline
+    total: int
+    # Bytes currently allocated from files under the profiled root
+    local: int
+    timestamp: float
+
+
+class MemoryProfiler:
+    """
+    Samples traced memory with tracemalloc. The baseline is taken when the
+    profiler is created if tracing is already active (i.e. the process was
+    started with PYTHONTRACEMALLOC), otherwise when `start` is called.
+    """
+    def __init__(self, root: str):
+        """
+        :param root: directory whose allocations are reported as `local`
+        """
+        self.root = root
+        self.samples: Dict[str, MemorySample] = dict()
+        self.baseline = tracemalloc.get_traced_memory()[0] \
+            if tracemalloc.is_tracing() else None
+        self._started = False
+
+    @property
+    def enabled(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def start(self):
+        """
+        Start tracing memory allocations if not already tracing.
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started = True
+        if self.baseline is None:
+            self.baseline = tracemalloc.get_traced_memory()[0]
+
+    def sample(self, label: str) -> Optional[MemorySample]:
+        """
+        Record current memory use. Only the latest sample for each label is
+        kept.
+        :param label: name of the sample (i.e. a handler name)
+        :returns: MemorySample, or None if not tracing
+        """
+        if not tracemalloc.is_tracing():
+            return None
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(True, join(self.root, "*"))])
+        local = sum(s.size for s in snapshot.statistics("filename"))
+        total = tracemalloc.get_traced_memory()[0] - (self.baseline or 0)
+        sample = MemorySample(label, total, local, time())
+        self.samples[label] = sample
+        LOG.debug(f"Memory after {label}: total={total} local={local}")
+        return sample
+
+    def report(self) -> Dict[str, dict]:
+        """
+        Get the latest sample for each label.
+        """
+        return {label: asdict(sample)
+                for label, sample in self.samples.items()}
+
+    def stop(self):
+        """
+        Stop tracing if this profiler started it.
+        """
+        if self._started and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._started = False
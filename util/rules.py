@@ -0,0 +1,318 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from os import replace
+from os.path import exists
+from threading import Event, Lock, Thread
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ovos_utils.log import LOG
+
+ACTIONS = ("restart", "shutdown", "exit",
+           "skip_wake_words", "require_wake_words")
+CONDITIONS = ("idle",)
+
+# (name, minimum, maximum) of each cron time field
+_FIELDS = (("minute", 0, 59), ("hour", 0, 23), ("day", 1, 31),
+           ("month", 1, 12), ("weekday", 0, 7))
+
+
+def _parse_field(spec: str, low: int, high: int) -> int:
+    """
+    Parse a cron field into a bitmask of allowed values.
+    :param spec: field as in crontab, e.g. `*`, `9-17`, `1,15`, `*/5`
+    :param low: smallest allowed value
+    :param high: largest allowed value
+    :returns: int with bit `n` set if value `n` is allowed
+    """
+    mask = 0
+    for part in spec.split(","):
+        value, _, step = part.partition("/")
+        if value == "*":
+            start, end = low, high
+        elif "-" in value:
+            start, end = (int(v) for v in value.split("-", 1))
+        else:
+            start = end = int(value)
+            if step:
+                end = high
+        step = int(step) if step else 1
+        if not low <= start <= end <= high or step < 1:
+            raise ValueError(f"Invalid field '{spec}' for range "
+                             f"{low}-{high}")
+        for n in range(start, end + 1, step):
+            mask |= 1 << n
+    return mask
+
+
+def _values(mask: int) -> List[int]:
+    return [n for n in range(mask.bit_length()) if mask >> n & 1]
+
+
+@dataclass(frozen=True)
+class CronRule:
+    """
+    A device control run at times matching a crontab-style schedule, e.g.
+    `0 3 * * * restart idle` or `0 9 * * 1-5 skip_wake_words`. Time fields
+    are stored as bitmasks; the original line is kept as `spec`.
+    """
+    spec: str
+    minutes: int
+    hours: int
+    days: int
+    months: int
+    weekdays: int
+    action: str
+    condition: Optional[str] = None
+
+    @classmethod
+    def parse(cls, line: str) -> 'CronRule':
+        """
+        Parse a rule from `minute hour day month weekday action [condition]`
+        :param line: rule string
+        :returns: parsed CronRule
+        :raises ValueError: if the rule is not valid
+        """
+        parts = line.split()
+        if len(parts) not in (6, 7):
+            raise ValueError(f"Expected 6 or 7 fields: {line}")
+        masks = [_parse_field(spec, low, high) for spec, (_, low, high)
+                 in zip(parts[:5], _FIELDS)]
+        # Sunday may be written as 0 or 7
+        if masks[4] & 1 << 7:
+            masks[4] = (masks[4] | 1) & ~(1 << 7)
+        action = parts[5]
+        condition = parts[6] if len(parts) == 7 else None
+        if action not in ACTIONS:
+            raise ValueError(f"Unknown action: {action}")
+        if condition and condition not in CONDITIONS:
+            raise ValueError(f"Unknown condition: {condition}")
+        return cls(" ".join(parts), *masks, action, condition)
+
+    def __str__(self):
+        return self.spec
+
+    @property
+    def _any_day(self) -> bool:
+        return self.days == _parse_field("*", 1, 31)
+
+    @property
+    def _any_weekday(self) -> bool:
+        return self.weekdays == _parse_field("*", 0, 6)
+
+    def _matches_date(self, dt: datetime) -> bool:
+        if not self.months >> dt.month & 1:
+            return False
+        day = bool(self.days >> dt.day & 1)
+        weekday = bool(self.weekdays >> (dt.isoweekday() % 7) & 1)
+        # As in cron, a restricted day and weekday match either one
+        if self._any_day or self._any_weekday:
+            return day and weekday
+        return day or weekday
+
+    def matches(self, dt: datetime) -> bool:
+        """
+        Check if this rule runs in the minute of `dt`.
+        """
+        return bool(self.minutes >> dt.minute & 1 and
+                    self.hours >> dt.hour & 1) and self._matches_date(dt)
+
+    def next_run(self, after: datetime) -> Optional[datetime]:
+        """
+        Get the first time after `after` this rule runs.
+        :param after: datetime to search from
+        :returns: datetime of the next run, None if none within 8 years
+        """
+        start = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        hours = _values(self.hours)
+        minutes = _values(self.minutes)
+        # Allows for rules that only run on 29 February
+        for offset in range(366 * 8):
+            day = start.date() + timedelta(days=offset)
+            if not self._matches_date(day):
+                continue
+            for hour in hours:
+                for minute in minutes:
+                    candidate = datetime(day.year, day.month, day.day,
+                                         hour, minute)
+                    if candidate >= start:
+                        return candidate
+        return None
+
+
+class RuleStore:
+    """
+    Stores rules one per line in crontab form. Lines starting with `#` are
+    ignored.
+    """
+    def __init__(self, path: str):
+        self.path = path
+
+    def load(self) -> List[CronRule]:
+        rules = list()
+        if not exists(self.path):
+            return rules
+        with open(self.path) as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                try:
+                    rules.append(CronRule.parse(line))
+                except ValueError as e:
+                    LOG.error(f"Skipping invalid rule: {e}")
+        return rules
+
+    def save(self, rules: List[CronRule]):
+        """
+        Write rules, replacing the stored rules atomically.
+        """
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w") as f:
+            f.writelines(f"{rule}\n" for rule in rules)
+        replace(tmp, self.path)
+
+
+class RuleScheduler(Thread):
+    """
+    Runs rules from a single hashed timer wheel with one slot per minute of
+    the hour. Each rule is placed in the slot of its next run and the wheel
+    ticks once a minute, so checking rules costs nothing between runs no
+    matter how many rules there are. Runs missed by more than `grace`
+    seconds, e.g. while the system was suspended, are skipped.
+    """
+    def __init__(self, execute: Callable[[CronRule], None], slots: int = 60,
+                 grace: float = 300,
+                 now: Callable[[], datetime] = datetime.now):
+        """
+        :param execute: callable run with each rule when it is due
+        :param slots: number of one minute slots in the wheel
+        :param grace: seconds after its time a missed run may still happen
+        :param now: callable returning the current local time
+        """
+        Thread.__init__(self, name="rule_scheduler", daemon=True)
+        self._execute = execute
+        self._now = now
+        self.grace = timedelta(seconds=grace)
+        self._wheel: List[List[Tuple[datetime, CronRule]]] = \
+            [list() for _ in range(slots)]
+        self._rules: Dict[str, CronRule] = dict()
+        self._last_tick: Optional[datetime] = None
+        self._lock = Lock()
+        self._stopping = Event()
+
+    @property
+    def rules(self) -> List[CronRule]:
+        with self._lock:
+            return list(self._rules.values())
+
+    def _slot(self, when: datetime) -> List[Tuple[datetime, CronRule]]:
+        index = int(when.timestamp() // 60) % len(self._wheel)
+        return self._wheel[index]
+
+    def _schedule(self, rule: CronRule, after: datetime):
+        next_run = rule.next_run(after)
+        if next_run:
+            self._slot(next_run).append((next_run, rule))
+        else:
+            LOG.warning(f"Rule never runs: {rule}")
+
+    def add(self, rule: CronRule) -> bool:
+        """
+        Add a rule to the wheel.
+        :returns: False if an identical rule is already scheduled
+        """
+        with self._lock:
+            if rule.spec in self._rules:
+                return False
+            self._rules[rule.spec] = rule
+            self._schedule(rule, self._last_tick or self._now())
+            return True
+
+    def remove(self, spec: str) -> bool:
+        """
+        Remove a rule from the wheel.
+        :param spec: rule string as returned by `str(rule)`
+        :returns: True if the rule was scheduled
+        """
+        spec = " ".join(spec.split())
+        with self._lock:
+            if not self._rules.pop(spec, None):
+                return False
+            for slot in self._wheel:
+                slot[:] = [entry for entry in slot if entry[1].spec != spec]
+            return True
+
+    def tick(self, now: Optional[datetime] = None) -> List[CronRule]:
+        """
+        Run rules due since the last tick.
+        :param now: current time, default from the `now` callable
+        :returns: list of rules that were due
+        """
+        now = now or self._now()
+        with self._lock:
+            last = self._last_tick or now - timedelta(minutes=1)
+            self._last_tick = now
+            minutes = int(now.timestamp() // 60) - int(last.timestamp() // 60)
+            due = list()
+            # Visit the slot of each minute since the last tick; after a
+            # long gap every slot is visited once
+            for offset in range(min(minutes, len(self._wheel))):
+                slot = self._slot(now - timedelta(minutes=offset))
+                remaining = list()
+                for entry in slot:
+                    (due if entry[0] <= now else remaining).append(entry)
+                slot[:] = remaining
+            for _, rule in due:
+                self._schedule(rule, now)
+        ran = list()
+        for when, rule in sorted(due, key=lambda e: e[0]):
+            if now - when > self.grace:
+                LOG.warning(f"Skipping run of '{rule}' missed at {when}")
+                continue
+            ran.append(rule)
+            try:
+                self._execute(rule)
+            except Exception as e:
+                LOG.exception(f"Rule '{rule}' failed: {e}")
+        return ran
+
+    def run(self):
+        while True:
+            now = self._now()
+            wait = 60 - now.second - now.microsecond / 1e6
+            if self._stopping.wait(wait):
+                return
+            self.tick()
+
+    def stop(self):
+        self._stopping.set()
+        if self.is_alive():
+            self.join()
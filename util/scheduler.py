@@ -0,0 +1,201 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from enum import IntEnum
+from heapq import heappop, heappush
+from itertools import count
+from threading import Condition, Event, Lock, Thread, current_thread
+from typing import Any, Callable, Dict, Optional
+
+from ovos_utils.log import LOG
+
+
+class ControlPriority(IntEnum):
+    """
+    Priority of a control operation; lower values run first.
+    """
+    POWER = 0
+    WAKE_WORD = 1
+    TOGGLE = 2
+
+
+class ControlOperation:
+    __slots__ = ("priority", "key", "fn", "result", "cancelled", "done")
+
+    def __init__(self, priority: ControlPriority, key: str, fn: Callable):
+        self.priority = priority
+        self.key = key
+        self.fn = fn
+        self.result = None
+        self.cancelled = False
+        self.done = Event()
+
+    def finish(self, result: Any = None, cancelled: bool = False):
+        """
+        Mark this operation complete and release any waiting callers. Only the
+        first call has any effect.
+        """
+        if self.done.is_set():
+            return
+        self.result = result
+        self.cancelled = cancelled
+        self.done.set()
+
+
+class ControlScheduler:
+    """
+    Serializes device control operations in priority order. Pending
+    operations with the same key are merged or superseded, and power
+    operations preempt everything else.
+    """
+    def __init__(self):
+        self._queue = list()
+        self._seq = count()
+        self._pending: Dict[str, ControlOperation] = dict()
+        self._running: Optional[ControlOperation] = None
+        self._cond = Condition()
+        self._power_lock = Lock()
+        self._stopping = False
+        self._thread = Thread(target=self._run, name="control_scheduler",
+                              daemon=True)
+        self._thread.start()
+
+    def submit(self, priority: ControlPriority, key: str, fn: Callable,
+               merge: bool = False) -> ControlOperation:
+        """
+        Queue an operation to run on the scheduler thread.
+        :param priority: ControlPriority of the operation
+        :param key: operations with the same key conflict with each other
+        :param fn: callable to run
+        :param merge: if True, join a pending operation with the same key
+            instead of superseding it
+        :returns: ControlOperation to wait on
+        """
+        with self._cond:
+            pending = self._pending.get(key)
+            if pending and not pending.done.is_set():
+                if merge:
+                    LOG.debug(f"Merged with pending operation: {key}")
+                    return pending
+                LOG.info(f"Superseded pending operation: {key}")
+                pending.finish(cancelled=True)
+            op = ControlOperation(priority, key, fn)
+            self._pending[key] = op
+            heappush(self._queue, (priority, next(self._seq), op))
+            self._cond.notify()
+        return op
+
+    def run(self, priority: ControlPriority, key: str, fn: Callable,
+            default: Any = None, merge: bool = False,
+            timeout: Optional[float] = None) -> Any:
+        """
+        Run an operation and wait for its result. Power operations cancel
+        all other operations and run immediately.
+        :param priority: ControlPriority of the operation
+        :param key: operations with the same key conflict with each other
+        :param fn: callable to run
+        :param default: value to return if the operation is cancelled
+        :param merge: if True, join a pending operation with the same key
+        :param timeout: max seconds to wait for the operation to start; an
+            operation that has not started by then is cancelled
+        :returns: result of `fn`, else `default`
+        """
+        if current_thread() is self._thread:
+            # Nested operations run inline to avoid deadlocking the worker
+            return fn()
+        if priority == ControlPriority.POWER:
+            self.preempt()
+            with self._power_lock:
+                return fn()
+        op = self.submit(priority, key, fn, merge)
+        if not op.done.wait(timeout) and self._cancel(op):
+            LOG.warning(f"Timed out waiting for operation: {key}")
+            return default
+        # An operation that started before the timeout is allowed to finish
+        op.done.wait()
+        return default if op.cancelled else op.result
+
+    def _cancel(self, op: ControlOperation) -> bool:
+        """
+        Cancel an operation that has not started yet.
+        :returns: True if the operation was cancelled and will not run
+        """
+        with self._cond:
+            if op.done.is_set():
+                return op.cancelled
+            if self._running is op:
+                return False
+            if self._pending.get(op.key) is op:
+                self._pending.pop(op.key)
+            op.finish(cancelled=True)
+            return True
+
+    def preempt(self):
+        """
+        Cancel all pending operations and release callers waiting on the
+        running operation.
+        """
+        with self._cond:
+            while self._queue:
+                _, _, op = heappop(self._queue)
+                op.finish(cancelled=True)
+            self._pending.clear()
+            if self._running:
+                LOG.info(f"Preempted running operation: {self._running.key}")
+                self._running.finish(cancelled=True)
+
+    def shutdown(self):
+        """
+        Cancel pending operations and stop the scheduler thread.
+        """
+        self.preempt()
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._queue and not self._stopping:
+                    self._cond.wait()
+                if self._stopping:
+                    return
+                _, _, op = heappop(self._queue)
+                if self._pending.get(op.key) is op:
+                    self._pending.pop(op.key)
+                if op.done.is_set():
+                    continue
+                self._running = op
+            try:
+                op.finish(op.fn())
+            except Exception as e:
+                LOG.exception(f"Operation {op.key} failed: {e}")
+                op.finish(cancelled=True)
+            finally:
+                with self._cond:
+                    self._running = None
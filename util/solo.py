@@ -0,0 +1,240 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from os import cpu_count, getloadavg
+from threading import Event, Lock, Thread
+from time import monotonic
+from typing import Callable, Optional
+
+from ovos_utils.log import LOG
+
+
+def get_system_load() -> Optional[float]:
+    """
+    Get the 1 minute load average per CPU, if the platform reports one.
+    """
+    try:
+        return getloadavg()[0] / (cpu_count() or 1)
+    except (AttributeError, OSError):
+        return None
+
+
+class SoloGovernor:
+    """
+    Limits how long solo mode (skipping wake words) may run and how much STT
+    traffic it may produce. STT traffic is counted from listener messages:
+    transcribed utterances and seconds of recorded audio. When a limit is
+    reached, or the system is overloaded, `on_exhausted` is called from a
+    background thread with the reason so wake words can be required again.
+    """
+    def __init__(self, on_exhausted: Callable[[str], None],
+                 time_budget: Optional[float] = None,
+                 stt_budget: Optional[float] = None,
+                 max_load: Optional[float] = None,
+                 check_interval: float = 10,
+                 get_load: Callable[[], Optional[float]] = get_system_load):
+        """
+        :param on_exhausted: callback accepting the reason solo mode must end
+        :param time_budget: maximum seconds of solo mode per session
+        :param stt_budget: maximum seconds of recorded audio sent to STT per
+            session
+        :param max_load: maximum load average per CPU before solo mode ends
+        :param check_interval: seconds between checks while solo mode runs
+        :param get_load: callable returning the current load per CPU
+        """
+        self._on_exhausted = on_exhausted
+        self.time_budget = time_budget
+        self.stt_budget = stt_budget
+        self.max_load = max_load
+        self.check_interval = check_interval
+        self._get_load = get_load
+        self._lock = Lock()
+        self._wakeup = Event()
+        self._thread: Optional[Thread] = None
+        self._started: Optional[float] = None
+        self._record_start: Optional[float] = None
+        self.utterances = 0
+        self.stt_seconds = 0.0
+        self.last_session: Optional[dict] = None
+        # Totals over all sessions
+        self.sessions = 0
+        self.solo_seconds = 0.0
+        self.total_stt_seconds = 0.0
+        self.saved_stt_seconds = 0.0
+        # Set while wake words are required after a budget ended solo mode
+        self._fallback: Optional[tuple] = None
+
+    @property
+    def active(self) -> bool:
+        return self._started is not None
+
+    @property
+    def elapsed(self) -> float:
+        started = self._started
+        return monotonic() - started if started is not None else 0.0
+
+    def start(self):
+        """
+        Start tracking a solo mode session.
+        """
+        with self._lock:
+            if self._started is not None:
+                return
+            self._end_fallback()
+            self._started = monotonic()
+            self._record_start = None
+            self.utterances = 0
+            self.stt_seconds = 0.0
+            self._wakeup.clear()
+            self._thread = Thread(target=self._run, name="solo_governor",
+                                  daemon=True)
+            self._thread.start()
+
+    def stop(self, reason: str = "user") -> Optional[dict]:
+        """
+        Stop tracking the current solo mode session.
+        :param reason: why solo mode ended; sessions not ended by the user
+            count the STT traffic avoided until solo mode starts again
+        :returns: report of the session, None if solo mode was not active
+        """
+        with self._lock:
+            if self._started is None:
+                return None
+            self._on_record_end()
+            duration = monotonic() - self._started
+            self._started = None
+            self._wakeup.set()
+            self.sessions += 1
+            self.solo_seconds += duration
+            self.total_stt_seconds += self.stt_seconds
+            rate = self.stt_seconds / duration if duration else 0.0
+            if reason != "user":
+                self._fallback = (monotonic(), rate)
+            self.last_session = {"reason": reason,
+                                 "duration": round(duration, 3),
+                                 "utterances": self.utterances,
+                                 "stt_seconds": round(self.stt_seconds, 3),
+                                 "stt_rate": round(rate, 4)}
+        LOG.info(f"Solo mode ended ({reason}): {self.last_session}")
+        return self.last_session
+
+    def on_utterance(self, _=None):
+        if self.active:
+            self.utterances += 1
+
+    def on_record_begin(self, _=None):
+        if self.active:
+            self._record_start = monotonic()
+
+    def on_record_end(self, _=None):
+        with self._lock:
+            self._on_record_end()
+
+    def _on_record_end(self):
+        if self._record_start is not None:
+            self.stt_seconds += monotonic() - self._record_start
+            self._record_start = None
+
+    def check(self) -> Optional[str]:
+        """
+        Check the current session against its limits.
+        :returns: reason solo mode must end, else None
+        """
+        if not self.active:
+            return None
+        if self.time_budget is not None and self.elapsed >= self.time_budget:
+            return "time"
+        stt_seconds = self.stt_seconds
+        if self._record_start is not None:
+            stt_seconds += monotonic() - self._record_start
+        if self.stt_budget is not None and stt_seconds >= self.stt_budget:
+            return "stt"
+        if self.max_load is not None:
+            load = self._get_load()
+            if load is not None and load > self.max_load:
+                return "load"
+        return None
+
+    def report(self) -> dict:
+        """
+        Get the current session and totals over all sessions. STT traffic
+        saved is estimated from each session's STT rate, over the time wake
+        words were required after a limit ended it.
+        """
+        with self._lock:
+            saved = self.saved_stt_seconds
+            if self._fallback:
+                since, rate = self._fallback
+                saved += (monotonic() - since) * rate
+            return {"active": self.active,
+                    "elapsed": round(self.elapsed, 3),
+                    "utterances": self.utterances if self.active else 0,
+                    "stt_seconds": round(self.stt_seconds, 3)
+                    if self.active else 0.0,
+                    "last_session": self.last_session,
+                    "sessions": self.sessions,
+                    "solo_seconds": round(self.solo_seconds, 3),
+                    "total_stt_seconds": round(self.total_stt_seconds, 3),
+                    "saved_stt_seconds": round(saved, 3)}
+
+    def shutdown(self):
+        """
+        Stop the background check without ending the session.
+        """
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join()
+
+    def _end_fallback(self):
+        if self._fallback:
+            since, rate = self._fallback
+            self.saved_stt_seconds += (monotonic() - since) * rate
+            self._fallback = None
+
+    def _next_check(self) -> float:
+        """
+        Get seconds until the next check, waking when the time budget ends.
+        """
+        if self.time_budget is None:
+            return self.check_interval
+        return max(min(self.check_interval,
+                       self.time_budget - self.elapsed), 0.0)
+
+    def _run(self):
+        started = self._started
+        while not self._wakeup.wait(self._next_check()):
+            if self._started != started:
+                return
+            reason = self.check()
+            if reason:
+                if self.stop(reason):
+                    try:
+                        self._on_exhausted(reason)
+                    except Exception as e:
+                        LOG.exception(f"Failed to end solo mode: {e}")
+                return
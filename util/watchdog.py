@@ -0,0 +1,158 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from threading import Event, Lock, Thread
+from time import monotonic
+from typing import Callable, Optional
+
+from ovos_utils.log import LOG
+
+
+class ListenerWatchdog(Thread):
+    """
+    Background thread that periodically pings the listener and caches its
+    liveness and latency. Pings back off while the skill is idle and run
+    early when a handler reports a failed request.
+    """
+    def __init__(self, ping: Callable[[float], bool], interval: float = 60,
+                 max_interval: float = 900, timeout: float = 3,
+                 failure_threshold: int = 2, min_interval: float = 5,
+                 max_retry_interval: float = 30):
+        """
+        :param ping: callable accepting a timeout in seconds; returns True if
+            the listener responded
+        :param interval: seconds between pings while the skill is in use
+        :param max_interval: maximum seconds between pings while idle
+        :param timeout: seconds to wait for each ping
+        :param failure_threshold: consecutive failed pings before the
+            listener is considered down
+        :param min_interval: minimum seconds between pings
+        :param max_retry_interval: maximum seconds between pings while the
+            listener is failing
+        """
+        Thread.__init__(self, name="listener_watchdog", daemon=True)
+        self._ping = ping
+        self.interval = interval
+        self.max_interval = max_interval
+        self.min_interval = min_interval
+        self.max_retry_interval = max_retry_interval
+        self.timeout = timeout
+        self.failure_threshold = failure_threshold
+        self.alive: Optional[bool] = None
+        self.latency: Optional[float] = None
+        self.failures = 0
+        self.last_check: Optional[float] = None
+        self._next_interval = interval
+        self._active = False
+        self._lock = Lock()
+        self._wakeup = Event()
+        self._stopping = Event()
+
+    @property
+    def is_down(self) -> bool:
+        """
+        True if the listener has failed enough consecutive pings to be
+        considered unavailable.
+        """
+        return self.failures >= self.failure_threshold
+
+    def notify_activity(self):
+        """
+        Note that the skill is handling a request; resets the idle back-off.
+        If the listener is down, the watchdog checks it again right away so
+        a recovered listener is noticed by the next request.
+        """
+        self._active = True
+        self._next_interval = self.interval
+        if self.is_down:
+            self._wakeup.set()
+
+    def report(self, success: bool, latency: Optional[float] = None):
+        """
+        Report the result of a listener request made outside the watchdog.
+        Failures trigger an early ping to confirm the listener state.
+        :param success: True if the listener responded
+        :param latency: seconds the listener took to respond
+        """
+        if success:
+            self._record(True, latency)
+        else:
+            self._wakeup.set()
+
+    def check(self) -> bool:
+        """
+        Ping the listener now and update the cached state.
+        :returns: True if the listener responded
+        """
+        start = monotonic()
+        try:
+            success = bool(self._ping(self.timeout))
+        except Exception as e:
+            LOG.error(f"Listener ping failed: {e}")
+            success = False
+        self._record(success, monotonic() - start if success else None)
+        return success
+
+    def _record(self, success: bool, latency: Optional[float]):
+        with self._lock:
+            was_down = self.is_down
+            self.last_check = monotonic()
+            self.alive = success
+            if success:
+                self.failures = 0
+                if latency is not None:
+                    self.latency = latency if self.latency is None else \
+                        0.8 * self.latency + 0.2 * latency
+            else:
+                self.failures += 1
+            if was_down != self.is_down:
+                LOG.warning(f"Listener is {'down' if self.is_down else 'up'}")
+
+    def run(self):
+        while not self._stopping.is_set():
+            self.check()
+            if self._active:
+                self._active = False
+            else:
+                self._next_interval = min(self._next_interval * 2,
+                                          self.max_interval)
+            wait_time = self._next_interval
+            if self.failures:
+                # Retry sooner while the listener is failing
+                wait_time = min(self.min_interval * 2 ** (self.failures - 1),
+                                self.max_retry_interval, wait_time)
+            self._wakeup.wait(wait_time)
+            self._wakeup.clear()
+            # Limit how often early pings may run
+            elapsed = monotonic() - self.last_check
+            if elapsed < self.min_interval:
+                self._stopping.wait(self.min_interval - elapsed)
+
+    def stop(self):
+        self._stopping.set()
+        self._wakeup.set()
@@ -0,0 +1,362 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from abc import ABC, abstractmethod
+from hashlib import sha1
+from json import dumps
+from sys import intern
+from threading import Lock
+from typing import Iterable, Optional, Tuple
+
+from ovos_bus_client.message import Message
+from ovos_utils.log import LOG
+from neon_utils.message_utils import dig_for_message
+
+_LOCAL_LISTENER = None
+
+# Wake word config fields the skill reads from the listener's catalog
+WW_CATALOG_FIELDS = ("active",)
+
+
+def register_listener(listener):
+    """
+    Register a listener running in this process so skills can call it directly
+    instead of through the messagebus. The listener must implement the methods
+    used by `DirectWakeWordBackend`.
+    :param listener: in-process listener object, or None to unregister
+    """
+    global _LOCAL_LISTENER
+    _LOCAL_LISTENER = listener
+
+
+def get_registered_listener():
+    """
+    Get the in-process listener registered with `register_listener`, if any.
+    """
+    return _LOCAL_LISTENER
+
+
+def project_wake_words(wake_words: dict,
+                       fields: Iterable[str] = WW_CATALOG_FIELDS) -> dict:
+    """
+    Get a view of a wake word catalog with only the requested config fields.
+    Names and keys are interned since the view is cached for the life of the
+    skill.
+    :param wake_words: dict of wake word name to config
+    :param fields: config keys to keep for each wake word
+    :returns: projected dict of wake word name to config
+    """
+    return {intern(ww): {intern(k): config[k] for k in fields if k in config}
+            for ww, config in wake_words.items()}
+
+
+def get_catalog_version(wake_words: dict) -> str:
+    """
+    Get a stable hash of a (projected) wake word catalog that listeners may
+    return as the catalog version.
+    :param wake_words: dict of wake word name to config
+    :returns: hex digest identifying this catalog
+    """
+    return sha1(dumps(wake_words, sort_keys=True,
+                      default=str).encode()).hexdigest()
+
+
+def parse_wake_words_reply(data: dict) -> Tuple[Optional[dict], Optional[str]]:
+    """
+    Parse a `neon.wake_words` reply. Listeners that support projection reply
+    with `wake_words` and `version`, or with `not_modified` and `version` when
+    the requested version is current; older listeners reply with the full
+    catalog.
+    :param data: reply message data
+    :returns: catalog (None if not modified) and version (None if unversioned)
+    """
+    if "version" in data:
+        if data.get("not_modified"):
+            return None, data["version"]
+        if isinstance(data.get("wake_words"), dict):
+            return data["wake_words"], data["version"]
+    return data, None
+
+
+class WakeWordBackend(ABC):
+    """
+    Interface for querying and changing the listener's wake word config.
+    """
+    @abstractmethod
+    def get_state(self, message: Optional[Message] = None) -> Optional[bool]:
+        """
+        Get the current wake words state.
+        :returns: True if wake words are required, None if unknown
+        """
+
+    @abstractmethod
+    def set_state(self, enabled: bool,
+                  message: Optional[Message] = None) -> bool:
+        """
+        Require or skip wake words.
+        :param enabled: True to require wake words, False to skip them
+        :returns: True if the listener acknowledged the request
+        """
+
+    @abstractmethod
+    def get_wake_words(self,
+                       message: Optional[Message] = None) -> Optional[dict]:
+        """
+        Get a dict of available configured wake words.
+        :returns: dict of wake word name to config, None if unavailable
+        """
+
+    @abstractmethod
+    def enable_wake_word(self, ww: str,
+                         message: Optional[Message] = None) -> bool:
+        """
+        Enable the requested wake word.
+        :param ww: string wake word to enable
+        :returns: True on success, False on failure
+        """
+
+    @abstractmethod
+    def disable_wake_word(self, ww: str,
+                          message: Optional[Message] = None) -> bool:
+        """
+        Disable the requested wake word.
+        :param ww: string wake word to disable
+        :returns: True on success, False on failure
+        """
+
+    def ping(self, timeout: float = 3) -> bool:
+        """
+        Check if the listener is responding.
+        :param timeout: seconds to wait for a response
+        :returns: True if the listener responded
+        """
+        return self.get_state() is not None
+
+    def prepare_wake_word(self, ww: str, enable: bool,
+                          message: Optional[Message] = None):
+        """
+        Hint that the requested wake word is likely to be enabled or disabled
+        soon so the listener may prepare its recognizer in the background.
+        This does not change the active wake words.
+        :param ww: string wake word to prepare
+        :param enable: True if the wake word will be enabled, else disabled
+        """
+
+    def cancel_prepare_wake_word(self, ww: str,
+                                 message: Optional[Message] = None):
+        """
+        Cancel a previous `prepare_wake_word` hint.
+        :param ww: string wake word to stop preparing
+        """
+
+    def seed_catalog(self, wake_words: dict, version: str):
+        """
+        Provide a previously known projected catalog and its version so an
+        unchanged catalog need not be sent again.
+        :param wake_words: projected dict of wake word name to config
+        :param version: version of `wake_words`
+        """
+
+
+class BusWakeWordBackend(WakeWordBackend):
+    """
+    Wake word backend that talks to the listener over the messagebus.
+    """
+    def __init__(self, bus):
+        self.bus = bus
+        self._catalog = None
+        self._catalog_version = None
+        self._catalog_lock = Lock()
+
+    @staticmethod
+    def _get_message(message: Optional[Message], msg_type: str,
+                     data: Optional[dict] = None) -> Message:
+        message = message or dig_for_message() or Message(msg_type)
+        return message.forward(msg_type, data)
+
+    def get_state(self, message=None):
+        resp = self.bus.wait_for_response(Message("neon.query_wake_words_state"))
+        if not resp:
+            LOG.warning("No WW Status reported")
+            return None
+        if resp.data.get('enabled', True):
+            return True
+        return False
+
+    def ping(self, timeout=3):
+        return self.bus.wait_for_response(
+            Message("neon.query_wake_words_state"), timeout=timeout) is not None
+
+    def set_state(self, enabled, message=None):
+        resp = self.bus.wait_for_response(self._get_message(
+            message, "neon.wake_words_state", {"enabled": enabled}))
+        return resp is not None
+
+    def get_wake_words(self, message=None):
+        cached_version = self._catalog_version
+        resp = self.bus.wait_for_response(
+            self._get_message(message, "neon.get_wake_words",
+                              {"fields": list(WW_CATALOG_FIELDS),
+                               "version": cached_version}),
+            "neon.wake_words")
+        if not resp:
+            return None
+        catalog, version = parse_wake_words_reply(resp.data)
+        with self._catalog_lock:
+            if catalog is None:
+                if self._catalog is not None and \
+                        version == self._catalog_version:
+                    LOG.debug(f"Wake word catalog not modified: {version}")
+                    return dict(self._catalog)
+                LOG.warning(f"Unexpected not modified version: {version}")
+                self._catalog_version = None
+                if cached_version is None:
+                    return None
+            else:
+                self._catalog = catalog if version else None
+                self._catalog_version = version
+                return dict(catalog)
+        # Cached catalog is out of sync; request the full projection
+        return self.get_wake_words(message)
+
+    def seed_catalog(self, wake_words, version):
+        with self._catalog_lock:
+            if self._catalog_version is None:
+                self._catalog = dict(wake_words)
+                self._catalog_version = version
+
+    def enable_wake_word(self, ww, message=None):
+        # This has to reload the recognizer loop, so allow more time to respond
+        resp = self.bus.wait_for_response(self._get_message(
+            message, "neon.enable_wake_word", {"wake_word": ww}), timeout=30)
+        if not resp:
+            LOG.error("No response to WW enable request")
+            return False
+        if resp.data.get('error'):
+            LOG.warning(f"WW enable failed with response: {resp.data}")
+            return False
+        return True
+
+    def disable_wake_word(self, ww, message=None):
+        resp = self.bus.wait_for_response(self._get_message(
+            message, "neon.disable_wake_word", {"wake_word": ww}), timeout=30)
+        if not resp:
+            LOG.error("No response to WW disable request")
+            return False
+        if resp.data.get('error'):
+            LOG.warning(f"WW disable failed with response: {resp.data}")
+            return False
+        return True
+
+    def prepare_wake_word(self, ww, enable, message=None):
+        self.bus.emit(self._get_message(message, "neon.prepare_wake_word",
+                                        {"wake_word": ww, "enable": enable}))
+
+    def cancel_prepare_wake_word(self, ww, message=None):
+        self.bus.emit(self._get_message(message,
+                                        "neon.cancel_prepare_wake_word",
+                                        {"wake_word": ww}))
+
+
+class DirectWakeWordBackend(WakeWordBackend):
+    """
+    Wake word backend that calls a listener running in the same process,
+    skipping message serialization and bus round trips.
+    """
+    def __init__(self, listener):
+        self.listener = listener
+
+    def get_state(self, message=None):
+        try:
+            return bool(self.listener.get_wake_words_state())
+        except Exception as e:
+            LOG.warning(f"WW state query failed with error: {e}")
+            return None
+
+    def ping(self, timeout=3):
+        """
+        Check if the in-process listener is responding. There is no transport
+        to time out, so this only fails when the listener raises an error;
+        a listener that hangs blocks the caller.
+        :param timeout: unused for direct calls
+        :returns: True if the listener reported its state
+        """
+        return self.get_state() is not None
+
+    def set_state(self, enabled, message=None):
+        try:
+            self.listener.set_wake_words_state(enabled)
+            return True
+        except Exception as e:
+            LOG.warning(f"WW state change failed with error: {e}")
+            return False
+
+    def get_wake_words(self, message=None):
+        try:
+            return self.listener.get_wake_words()
+        except Exception as e:
+            LOG.warning(f"WW query failed with error: {e}")
+            return None
+
+    def enable_wake_word(self, ww, message=None):
+        try:
+            return bool(self.listener.enable_wake_word(ww))
+        except Exception as e:
+            LOG.warning(f"WW enable failed with error: {e}")
+            return False
+
+    def disable_wake_word(self, ww, message=None):
+        try:
+            return bool(self.listener.disable_wake_word(ww))
+        except Exception as e:
+            LOG.warning(f"WW disable failed with error: {e}")
+            return False
+
+    def prepare_wake_word(self, ww, enable, message=None):
+        if hasattr(self.listener, "prepare_wake_word"):
+            self.listener.prepare_wake_word(ww, enable)
+
+    def cancel_prepare_wake_word(self, ww, message=None):
+        if hasattr(self.listener, "cancel_prepare_wake_word"):
+            self.listener.cancel_prepare_wake_word(ww)
+
+
+def get_backend(bus, backend: str = "auto") -> WakeWordBackend:
+    """
+    Get a wake word backend.
+    :param bus: MessageBusClient used by the bus backend
+    :param backend: `bus`, `direct`, or `auto` to use a registered in-process
+        listener when available
+    :returns: WakeWordBackend instance
+    """
+    listener = get_registered_listener()
+    if backend == "direct" and not listener:
+        LOG.warning("No in-process listener registered; using bus backend")
+    if backend != "bus" and listener:
+        return DirectWakeWordBackend(listener)
+    return BusWakeWordBackend(bus)
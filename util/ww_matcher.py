@@ -0,0 +1,124 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import re
+
+from threading import Lock
+from typing import Dict, Iterable, Optional, Pattern
+
+from .lang_cache import LangCache
+
+# Separators allowed between the words of a spoken wake word
+_SEPARATOR = r"[\s_-]+"
+
+
+def normalize_wake_word(text: str) -> str:
+    """
+    Get the spoken form of a wake word name or transcription.
+    :param text: wake word name (e.g. `hey_neon`) or spoken text
+    :returns: case-folded words separated by single spaces
+    """
+    return " ".join(re.split(_SEPARATOR, text.casefold().strip()))
+
+
+def build_wake_word_pattern(wake_words: Iterable[str]) -> Optional[Pattern]:
+    """
+    Compile a pattern matching any of the given wake words as whole words.
+    Longer wake words come first in the alternation so e.g. `hey neon` is
+    preferred over `neon` at the same position.
+    :param wake_words: wake word names to match
+    :returns: compiled pattern, None if there are no wake words
+    """
+    spoken = sorted({normalize_wake_word(ww) for ww in wake_words} - {""},
+                    key=len, reverse=True)
+    if not spoken:
+        return None
+    alternation = "|".join(_SEPARATOR.join(re.escape(word)
+                                           for word in ww.split(" "))
+                           for ww in spoken)
+    return re.compile(rf"(?<!\w)(?:{alternation})(?!\w)", re.IGNORECASE)
+
+
+class WakeWordPattern:
+    """
+    Compiled wake word pattern that is rebuilt when the catalog it was built
+    from changes.
+    """
+    def __init__(self):
+        self._catalog = None
+        self._pattern: Optional[Pattern] = None
+        self._names: Dict[str, str] = dict()
+        self._lock = Lock()
+
+    def _update(self, wake_words: Iterable[str]):
+        catalog = tuple(wake_words)
+        if catalog == self._catalog:
+            return
+        self._names = {normalize_wake_word(ww): ww for ww in catalog}
+        self._pattern = build_wake_word_pattern(catalog)
+        self._catalog = catalog
+
+    def search(self, text: str, wake_words: Iterable[str]) -> Optional[str]:
+        """
+        Find the first wake word spoken in some text.
+        :param text: utterance or transcription to search
+        :param wake_words: wake word names in the current catalog
+        :returns: matched wake word name, else None
+        """
+        with self._lock:
+            self._update(wake_words)
+            pattern, names = self._pattern, self._names
+        match = pattern.search(text) if pattern and text else None
+        if not match:
+            return None
+        return names.get(normalize_wake_word(match.group()))
+
+
+class WakeWordMatcher:
+    """
+    Extracts configured wake words from utterances using a compiled pattern
+    per language.
+    """
+    def __init__(self, max_langs: int = 3):
+        """
+        :param max_langs: maximum number of languages to keep patterns for
+        """
+        self._patterns: LangCache[WakeWordPattern] = \
+            LangCache(max_size=max_langs)
+
+    def match(self, text: str, wake_words: Iterable[str],
+              lang: str) -> Optional[str]:
+        """
+        Find the first wake word spoken in some text.
+        :param text: utterance or transcription to search
+        :param wake_words: wake word names in the current catalog
+        :param lang: language of `text`
+        :returns: matched wake word name, else None
+        """
+        return self._patterns.get(lang.lower(), WakeWordPattern).search(
+            text, wake_words)
@@ -0,0 +1,106 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import json
+
+from dataclasses import asdict, dataclass
+from os import fsync, replace
+from os.path import exists
+from time import time
+from typing import Optional
+
+from ovos_utils.log import LOG
+
+from .ww_backend import get_catalog_version, project_wake_words
+
+# Incremented when the snapshot file layout changes
+SNAPSHOT_FORMAT = 1
+
+
+@dataclass
+class WakeWordSnapshot:
+    # Projected wake word catalog
+    wake_words: dict
+    # Catalog version, as returned by `get_catalog_version`
+    version: str
+    # True if wake words were required, None if unknown
+    enabled: Optional[bool]
+    # Unix time the snapshot was saved
+    saved: float
+
+
+class SnapshotStore:
+    """
+    Persists the last known wake word catalog and state so they are
+    available before the listener responds after a restart.
+    """
+    def __init__(self, path: str):
+        self.path = path
+
+    def load(self) -> Optional[WakeWordSnapshot]:
+        """
+        Load the saved snapshot.
+        :returns: WakeWordSnapshot, None if missing, outdated or corrupt
+        """
+        if not exists(self.path):
+            return None
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            if data.get("format") != SNAPSHOT_FORMAT:
+                LOG.info(f"Ignoring snapshot format: {data.get('format')}")
+                return None
+            snapshot = WakeWordSnapshot(data["wake_words"], data["version"],
+                                        data.get("enabled"), data["saved"])
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            LOG.warning(f"Ignoring unreadable snapshot {self.path}: {e}")
+            return None
+        if get_catalog_version(snapshot.wake_words) != snapshot.version:
+            LOG.warning("Ignoring snapshot with mismatched version")
+            return None
+        return snapshot
+
+    def save(self, wake_words: dict,
+             enabled: Optional[bool]) -> WakeWordSnapshot:
+        """
+        Save a snapshot, replacing the previous one atomically.
+        :param wake_words: dict of wake word name to config
+        :param enabled: True if wake words are required, None if unknown
+        :returns: WakeWordSnapshot that was saved
+        """
+        wake_words = project_wake_words(wake_words)
+        snapshot = WakeWordSnapshot(wake_words,
+                                    get_catalog_version(wake_words),
+                                    enabled, time())
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump({"format": SNAPSHOT_FORMAT, **asdict(snapshot)}, f)
+            f.flush()
+            fsync(f.fileno())
+        replace(tmp, self.path)
+        return snapshot